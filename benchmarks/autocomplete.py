@@ -0,0 +1,85 @@
+"""
+Latence de l'autocomplétion des clients (`GET /api/autocomplete/clients/`) :
+colonnes normalisées indexées (`crm.textsearch`) vs `istartswith` sur les
+colonnes brutes (parcours complet de la table puis tri).
+
+Usage :
+    python -m benchmarks.autocomplete [--clients 1000000] [--repeat 20]
+
+Les clients sont insérés par lots (`bulk_create`, clés de recherche calculées
+avec `set_search_keys()`), avec les noms et entreprises de `crm.datagen`.
+La vue est appelée directement (`APIRequestFactory`, utilisateur forcé) :
+la mesure couvre requêtes SQL, fusion et rendu JSON, sans réseau ni JWT.
+"""
+
+import argparse
+import random
+
+from benchmarks.common import measure, print_table, setup_django, test_database
+
+PREFIXES = ("je", "chloe", "ines mo", "dur", "lefevre s", "zz")
+
+
+def populate(count: int, batch_size: int = 5000) -> None:
+    from django.utils import timezone
+
+    from crm.clients.models import Client
+    from crm.datagen import COMPANY_SUFFIXES, FIRST_NAMES, LAST_NAMES
+
+    rng = random.Random(1)
+    today = timezone.now().date()
+    for offset in range(0, count, batch_size):
+        batch = []
+        for n in range(offset, min(offset + batch_size, count)):
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            client = Client(full_name=f"{first} {last}", email=f"client.{n}@example.com", phone="0600000000",
+                            company_name=f"{rng.choice(LAST_NAMES)} {rng.choice(COMPANY_SUFFIXES)}",
+                            last_contact=today)
+            client.set_search_keys()
+            batch.append(client)
+        Client.objects.bulk_create(batch)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db.models import Q
+    from rest_framework.test import APIRequestFactory, force_authenticate
+
+    from crm.autocomplete import CLIENT_COLUMNS, ClientAutocompleteView
+    from crm.clients.models import Client
+    from crm.users.models import User
+
+    with test_database():
+        populate(args.clients)
+        user = User.objects.create_user(username="bench_support", password="Azerty123$", role="SUPPORT")
+        view = ClientAutocompleteView.as_view()
+        factory = APIRequestFactory()
+
+        def indexed(prefix):
+            request = factory.get("/api/autocomplete/clients/", {"q": prefix})
+            force_authenticate(request, user=user)
+            return view(request).render()
+
+        def scan(prefix):
+            return list(Client.objects.filter(Q(full_name__istartswith=prefix) | Q(company_name__istartswith=prefix))
+                        .order_by("full_name", "id").values(*CLIENT_COLUMNS)[:10])
+
+        rows = [("préfixe", "résultats", "vue indexée meilleur (ms)", "vue indexée médiane (ms)",
+                 "istartswith médiane (ms)")]
+        for prefix in PREFIXES:
+            found = len(indexed(prefix).data["results"])
+            fast = measure(lambda: indexed(prefix), repeat=args.repeat)
+            slow = measure(lambda: scan(prefix), repeat=3)
+            rows.append((prefix, found, f"{fast['best'] * 1000:.2f}", f"{fast['median'] * 1000:.2f}",
+                         f"{slow['median'] * 1000:.1f}"))
+
+    print_table(f"Autocomplétion des clients ({args.clients} clients, 10 résultats)", rows)
+
+
+if __name__ == "__main__":
+    main()
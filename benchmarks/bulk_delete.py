@@ -0,0 +1,101 @@
+"""
+Suppression d'un client et d'un utilisateur à gros graphe de dépendances :
+collecteur Django (`Model.delete()`) vs `crm.deletion` (lots ensemblistes).
+
+Usage :
+    python -m benchmarks.bulk_delete [--contracts 10000] [--chunk 1000]
+
+Le graphe est recréé avant chaque mesure : un commercial, un client portant
+`--contracts` contrats (un événement pour deux contrats), suivis par ce commercial.
+On mesure la durée puis, sur un second graphe, le pic de mémoire Python (`tracemalloc`).
+"""
+
+import argparse
+import time
+import tracemalloc
+from datetime import timedelta
+
+from benchmarks.common import print_table, setup_django, test_database
+
+
+def build_graph(contracts: int):
+    from django.utils import timezone
+
+    from crm.clients.models import Client
+    from crm.contracts.models import Contract
+    from crm.events.models import Event
+    from crm.pipeline.services import rebuild_summary
+    from crm.users.models import User
+
+    Client.objects.filter(email="grand.compte@example.com").delete()
+    User.objects.filter(username="bench_owner").delete()
+    owner = User.objects.create_user(username="bench_owner", password="Azerty123$", role="COMMERCIAL")
+    client = Client.objects.create(full_name="Grand Compte", email="grand.compte@example.com", phone="0600000000",
+                                   company_name="Grand Compte SA", last_contact=timezone.now().date(),
+                                   sales_contact=owner)
+    rows = Contract.objects.bulk_create(
+        [Contract(client=client, sales_contact=owner, total_amount=1000, amount_due=n % 1000, is_signed=n % 2 == 0)
+         for n in range(contracts)],
+        batch_size=2000,
+    )
+    start = timezone.now()
+    Event.objects.bulk_create(
+        [Event(contract=c, client=client, support_contact=owner, event_name=f"Événement {c.pk}",
+               event_start=start, event_end=start + timedelta(hours=4), location="Paris", attendees=10)
+         for c in rows[::2]],
+        batch_size=2000,
+    )
+    rebuild_summary(owner.pk)  # bulk_create n'émet pas les signaux du pipeline
+    return owner, client
+
+
+def timed(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def peak_memory(fn) -> int:
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--contracts", type=int, default=10000)
+    parser.add_argument("--chunk", type=int, default=1000)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+
+    from crm.deletion import delete_client, delete_user
+
+    settings.DELETE_CHUNK_SIZE = args.chunk
+    cases = [
+        ("client (cascade)", lambda owner, client: client.delete(), lambda owner, client: delete_client(client)),
+        ("utilisateur (SET NULL)", lambda owner, client: owner.delete(), lambda owner, client: delete_user(owner)),
+    ]
+
+    with test_database():
+        rows = [("suppression", "collecteur (s)", "crm.deletion (s)", "mémoire collecteur (Mo)",
+                 "mémoire crm.deletion (Mo)")]
+        for label, standard, chunked in cases:
+            results = []
+            for fn in (standard, chunked):
+                # tracemalloc ralentit l'exécution : durée et mémoire sur deux graphes distincts
+                owner, client = build_graph(args.contracts)
+                elapsed = timed(lambda: fn(owner, client))
+                owner, client = build_graph(args.contracts)
+                results.append((elapsed, peak_memory(lambda: fn(owner, client))))
+            (slow, slow_mem), (fast, fast_mem) = results
+            rows.append((label, f"{slow:.2f}", f"{fast:.2f}", f"{slow_mem / 2**20:.1f}", f"{fast_mem / 2**20:.1f}"))
+
+    print_table(f"Suppression ({args.contracts} contrats, lots de {args.chunk})", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Outils partagés par les scripts de mesure (`python -m benchmarks.<script>`).
+
+- `setup_django()` : initialise Django (profil de settings choisi par variable
+  d'environnement, `epic_crm.settings` par défaut) ;
+- `test_database()` : base de test jetable (comme pytest-django), détruite en sortie ;
+- `measure()` : meilleur temps et médiane sur plusieurs répétitions ;
+- `print_table()` : affichage aligné des résultats.
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+
+def setup_django(settings_module: str = "epic_crm.settings") -> None:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    import django
+
+    django.setup()
+
+
+@contextmanager
+def test_database():
+    """Crée les bases de test (migrations appliquées) et les supprime en sortie."""
+    from django.test.utils import setup_databases, setup_test_environment, teardown_databases, \
+        teardown_test_environment
+
+    setup_test_environment()
+    config = setup_databases(verbosity=0, interactive=False)
+    try:
+        yield
+    finally:
+        teardown_databases(config, verbosity=0)
+        teardown_test_environment()
+
+
+def measure(fn: Callable[[], object], repeat: int = 5, clock: Callable[[], float] = time.perf_counter) -> dict:
+    """Exécute `fn` `repeat` fois ; retourne {"best": s, "median": s} (`clock=time.process_time` : temps CPU)."""
+    timings = []
+    for _ in range(repeat):
+        started = clock()
+        fn()
+        timings.append(clock() - started)
+    return {"best": min(timings), "median": statistics.median(timings)}
+
+
+def print_table(title: str, rows: list[tuple]) -> None:
+    """Affiche `rows` (première ligne = en-têtes) en colonnes alignées."""
+    widths = [max(len(str(row[i])) for row in rows) for i in range(len(rows[0]))]
+    print(f"\n{title}")
+    for n, row in enumerate(rows):
+        print("  " + "  ".join(str(v).ljust(w) for v, w in zip(row, widths)))
+        if n == 0:
+            print("  " + "  ".join("-" * w for w in widths))
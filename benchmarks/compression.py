@@ -0,0 +1,60 @@
+"""
+Octets transférés par les listes selon l'encodage négocié (identité, gzip,
+brotli / zstd si installés) et coût CPU de la compression côté serveur.
+
+Usage :
+    python -m benchmarks.compression [--clients 1000] [--page-size 100] [--repeat 20]
+
+Les requêtes passent par la pile Django complète (middleware inclus), en GESTION,
+sur des données `crm.datagen` dans une base de test jetable.
+"""
+
+import argparse
+import time
+
+from benchmarks.common import measure, print_table, setup_django, test_database
+
+URLS = ["/api/clients/", "/api/contracts/", "/api/events/", "/api/events/?compact=true"]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.contrib.auth import get_user_model
+    from rest_framework.pagination import PageNumberPagination
+    from rest_framework.test import APIClient
+
+    from crm.compression import SUPPORTED
+    from crm.datagen import GeneratorConfig, generate
+
+    PageNumberPagination.page_size = args.page_size
+    encodings = ["identity", *reversed(SUPPORTED)]
+
+    with test_database():
+        generate(GeneratorConfig(clients=args.clients, seed=1))
+        api = APIClient()
+        api.force_authenticate(user=get_user_model().objects.get(username="gestion_1"))
+
+        rows = [("endpoint", "encodage", "octets", "gain", "CPU requête (ms)")]
+        for url in URLS:
+            plain = None
+            for encoding in encodings:
+                def fetch():
+                    return api.get(url, HTTP_ACCEPT_ENCODING=encoding)
+                response = fetch()
+                assert response.get("Content-Encoding", "identity") == encoding
+                size = len(response.content)
+                plain = plain or size
+                cpu = measure(fetch, args.repeat, clock=time.process_time)["median"]
+                rows.append((url, encoding, size, f"-{100 * (1 - size / plain):.0f} %", f"{cpu * 1000:.2f}"))
+
+    print_table(f"Compression des listes ({args.page_size} lignes par page)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Détection des doublons de clients : blocs indexés + voisinage trié
+(`crm.clients.duplicates.find_duplicates`) vs comparaison de toutes les paires.
+
+Usage :
+    python -m benchmarks.duplicates [--sizes 2000 20000 200000] [--naive-max 5000]
+
+Chaque jeu contient des clients aux noms et entreprises variés, dont 1 %
+sont recopiés avec une variante (e-mail en majuscules, téléphone au format
+international, faute de frappe dans le nom, forme juridique ajoutée). On
+mesure la durée du rapport, le nombre de paires, le rappel sur ces doublons
+injectés et la durée du contrôle d'une fiche avant création (`find_matches`).
+La comparaison exhaustive (O(n²)) n'est lancée que jusqu'à `--naive-max`.
+"""
+
+import argparse
+import random
+import string
+import time
+
+from benchmarks.common import measure, print_table, setup_django, test_database
+
+
+def _word(rng) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9))).capitalize()
+
+
+def populate(count: int, seed: int = 1) -> set[tuple[int, int]]:
+    """Insère `count` clients (dont 1 % de variantes) ; retourne les paires injectées."""
+    from django.utils import timezone
+
+    from crm.clients.models import Client
+
+    rng = random.Random(seed)
+    today = timezone.now().date()
+    originals = []
+    for n in range(count - count // 100):
+        client = Client(full_name=f"{_word(rng)} {_word(rng)}", email=f"client.{n}@example.com",
+                        phone=f"06{rng.randint(10_000_000, 99_999_999)}", company_name=f"{_word(rng)} {_word(rng)}",
+                        last_contact=today)
+        client.set_search_keys()
+        originals.append(client)
+    Client.objects.bulk_create(originals, batch_size=5000)
+
+    copies = []
+    for n, source in enumerate(rng.sample(originals, count // 100)):
+        variant = n % 3
+        name = source.full_name
+        if variant == 2:  # faute de frappe : une lettre remplacée
+            i = rng.randrange(1, len(name))
+            name = name[:i] + rng.choice(string.ascii_lowercase) + name[i + 1:]
+        copy = Client(
+            full_name=name,
+            email=source.email.upper() if variant == 0 else f"copie.{n}@example.com",
+            phone="+33 " + source.phone[1:] if variant == 1 else f"07{rng.randint(10_000_000, 99_999_999)}",
+            company_name=f"{source.company_name} SARL",
+            last_contact=today,
+        )
+        copy.set_search_keys()
+        copies.append((source, copy))
+    Client.objects.bulk_create([c for _, c in copies], batch_size=5000)
+    return {(source.pk, copy.pk) for source, copy in copies}
+
+
+def naive_pairs(threshold: float) -> set[tuple[int, int]]:
+    """Comparaison de toutes les paires (mêmes critères, sans blocs)."""
+    from crm.clients.duplicates import similarity
+    from crm.clients.models import Client
+
+    rows = list(Client.objects.order_by("id").values_list("id", "email_key", "phone_key", "name_key",
+                                                          "company_key", "search_name", "search_company"))
+    found = set()
+    for i, a in enumerate(rows):
+        for b in rows[i + 1:]:
+            if (a[1] == b[1] or (a[2] and a[2] == b[2])
+                    or (a[4] == b[4] and similarity(a[5], b[5]) >= threshold)
+                    or (a[3] == b[3] and similarity(a[6], b[6]) >= threshold)):
+                found.add((a[0], b[0]))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2000, 20000, 200000])
+    parser.add_argument("--naive-max", type=int, default=5000)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+
+    from crm.clients.duplicates import find_duplicates, find_matches
+    from crm.clients.models import Client
+
+    rows = [("clients", "blocs (s)", "paires", "rappel", "toutes paires (s)", "contrôle création (ms)")]
+    with test_database():
+        for size in args.sizes:
+            Client.objects.all().delete()
+            injected = populate(size)
+
+            started = time.perf_counter()
+            pairs = {(p.first_id, p.second_id) for p in find_duplicates()}
+            blocked = time.perf_counter() - started
+            recall = len(injected & pairs) / len(injected) if injected else 1.0
+
+            naive = "—"
+            if size <= args.naive_max:
+                started = time.perf_counter()
+                naive_pairs(settings.DEDUP_SIMILARITY)
+                naive = f"{time.perf_counter() - started:.2f}"
+            probe = Client.objects.values("full_name", "email", "phone", "company_name").last()
+            check = measure(lambda: find_matches(probe), repeat=20)
+            rows.append((size, f"{blocked:.2f}", len(pairs), f"{recall:.0%}", naive, f"{check['median'] * 1000:.2f}"))
+
+    print_table(f"Doublons de clients (fenêtre {settings.DEDUP_WINDOW}, seuil {settings.DEDUP_SIMILARITY})", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Latence de la première requête par endpoint, worker froid vs préchauffé (`crm.warmup`).
+
+Usage :
+    python -m benchmarks.first_request [--runs 5] [--clients 50]
+
+Chaque mesure tourne dans un processus neuf (`--child`) : base de test jetable,
+quelques données, puis, en mode préchauffé, `warm_up()` avant le trafic. Les
+endpoints sont appelés dans l'ordre avec un token Bearer (utilisateur gestion) ;
+on relève la 1re requête et la suivante sur le même endpoint. La base de test
+est déjà ouverte dans les deux modes : l'étape « base » n'apparaît pas ici.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.common import print_table, setup_django, test_database
+
+ENDPOINTS = ["/api/clients/", "/api/contracts/", "/api/events/", "/api/users/me/", "/api/pipeline/"]
+
+
+def child(clients: int, warm: bool) -> dict:
+    setup_django()
+    from django.test import Client as HttpClient
+
+    from crm.datagen import GeneratorConfig, generate
+    from crm.users.authentication import RoleTokenObtainPairSerializer
+    from crm.users.models import User
+    from crm.warmup import warm_up
+
+    with test_database():
+        generate(GeneratorConfig(clients=clients, seed=1))
+        user = User.objects.get(username="gestion_1")
+        access = str(RoleTokenObtainPairSerializer.get_token(user).access_token)
+
+        if warm:
+            warm_up()
+
+        http = HttpClient(HTTP_AUTHORIZATION=f"Bearer {access}")
+        timings = {}
+        for url in ENDPOINTS:
+            pair = []
+            for _ in range(2):
+                started = time.perf_counter()
+                response = http.get(url)
+                pair.append(time.perf_counter() - started)
+                assert response.status_code == 200, (url, response.status_code)
+            timings[url] = pair
+        return timings
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--warm", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(child(args.clients, args.warm)))
+        return
+
+    env = {**os.environ, "WARMUP_ON_STARTUP": "False"}
+    results = {}
+    for warm in (False, True):
+        command = [sys.executable, "-m", "benchmarks.first_request", "--child", "--clients", str(args.clients)]
+        runs = [
+            json.loads(subprocess.run(command + (["--warm"] if warm else []), env=env, check=True,
+                                      capture_output=True, text=True).stdout.strip().splitlines()[-1])
+            for _ in range(args.runs)
+        ]
+        results[warm] = {url: [statistics.median(run[url][i] for run in runs) for i in (0, 1)] for url in ENDPOINTS}
+
+    rows = [("endpoint", "1re froide (ms)", "1re préchauffée (ms)", "suivante (ms)")]
+    for url in ENDPOINTS:
+        cold, warm = results[False][url], results[True][url]
+        rows.append((url, f"{cold[0] * 1000:.1f}", f"{warm[0] * 1000:.1f}", f"{warm[1] * 1000:.1f}"))
+    print_table(f"Première requête (médiane sur {args.runs} processus)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Liste de relance (`GET /api/clients/to-call/`) sur un grand volume de clients :
+première page, page profonde par clé (`?after=`) vs par `OFFSET` (requête
+seule), parcours
+complet d'un portefeuille, puis première page sans l'index
+`(sales_contact, last_contact, id)`.
+
+Usage :
+    python -m benchmarks.followup [--clients 1000000] [--commercials 50] [--depth 10000]
+
+Les clients sont répartis entre `--commercials` commerciaux, dernier contact
+tiré sur deux ans. La vue est appelée directement (`APIRequestFactory`,
+utilisateur forcé) : requête SQL, pagination et rendu JSON, sans réseau ni JWT.
+"""
+
+import argparse
+import random
+from datetime import timedelta
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.common import measure, print_table, setup_django, test_database
+
+PAGE_SIZE = 25
+
+
+def populate(count: int, commercials: int, batch_size: int = 5000) -> list:
+    from django.utils import timezone
+
+    from crm.clients.models import Client
+    from crm.users.models import User
+
+    owners = User.objects.bulk_create([
+        User(username=f"bench_commercial_{n}", email=f"bench{n}@example.com", role="COMMERCIAL", password="!")
+        for n in range(commercials)
+    ])
+    rng = random.Random(1)
+    today = timezone.localdate()
+    for offset in range(0, count, batch_size):
+        Client.objects.bulk_create([
+            Client(full_name=f"Client {n}", email=f"client.{n}@example.com", phone="0600000000",
+                   company_name=f"Société {n}", sales_contact_id=owners[n % commercials].pk,
+                   last_contact=today - timedelta(days=rng.randint(0, 730)))
+            for n in range(offset, min(offset + batch_size, count))
+        ])
+    return owners
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=1_000_000)
+    parser.add_argument("--commercials", type=int, default=50)
+    parser.add_argument("--depth", type=int, default=10000, help="Rang de la page profonde mesurée.")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db import connection
+    from rest_framework.test import APIRequestFactory, force_authenticate
+
+    from crm.clients.followup import followup_queryset
+    from crm.clients.models import Client
+    from crm.clients.views import ClientViewSet
+    from crm.pagination import FollowUpPagination
+
+    with test_database():
+        owner = populate(args.clients, args.commercials)[0]
+        view = ClientViewSet.as_view({"get": "to_call"})
+        factory = APIRequestFactory()
+
+        def page(**params):
+            request = factory.get("/api/clients/to-call/", {"page_size": PAGE_SIZE, **params})
+            force_authenticate(request, user=owner)
+            return view(request).render()
+
+        deep = followup_queryset(30, owner.pk)[args.depth]
+        cursor = f"{deep['last_contact'].isoformat()},{deep['id']}"
+
+        def walk():
+            response, pages = page(), 1
+            while response.data["next"]:
+                after = parse_qs(urlparse(response.data["next"]).query)["after"][0]
+                response, pages = page(after=after), pages + 1
+            return pages
+
+        def keyset_page():
+            return list(FollowUpPagination()._after(followup_queryset(30, owner.pk), cursor)[:PAGE_SIZE])
+
+        def offset_page():
+            return list(followup_queryset(30, owner.pk)[args.depth:args.depth + PAGE_SIZE])
+
+        first = measure(page, repeat=20)
+        keyset = measure(keyset_page, repeat=20)
+        by_offset = measure(offset_page, repeat=5)
+        pages = walk()
+        full = measure(walk, repeat=1)
+
+        with connection.schema_editor() as editor:
+            for index in Client._meta.indexes:
+                if index.name in ("client_followup_idx", "client_last_contact_idx"):
+                    editor.remove_index(Client, index)
+        unindexed = measure(page, repeat=5)
+
+    rows = [("mesure", "médiane (ms)"),
+            ("première page", f"{first['median'] * 1000:.2f}"),
+            (f"page au rang {args.depth}, requête seule — clé (?after=)", f"{keyset['median'] * 1000:.2f}"),
+            (f"page au rang {args.depth}, requête seule — OFFSET", f"{by_offset['median'] * 1000:.2f}"),
+            (f"portefeuille complet ({pages} pages)", f"{full['median'] * 1000:.0f}"),
+            ("première page sans index", f"{unindexed['median'] * 1000:.2f}")]
+    print_table(f"Liste de relance ({args.clients} clients, {args.commercials} commerciaux, "
+                f"pages de {PAGE_SIZE})", rows)
+
+
+if __name__ == "__main__":
+    main()
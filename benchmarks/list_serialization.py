@@ -0,0 +1,67 @@
+"""
+Temps CPU de sérialisation + rendu JSON d'une page de liste : chemin DRF standard
+(`ModelSerializer` + `JSONRenderer`) vs plan précompilé (`crm.compiled`) +
+`FastJSONRenderer` (orjson si installé).
+
+Usage :
+    python -m benchmarks.list_serialization [--clients 500] [--rows 500] [--repeat 20]
+
+Les instances sont chargées une fois (requête exclue de la mesure) ; seule la
+transformation objets → octets est chronométrée, en temps CPU (`time.process_time`).
+"""
+
+import argparse
+import time
+
+from benchmarks.common import measure, print_table, setup_django, test_database
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    from rest_framework.renderers import JSONRenderer
+
+    from crm.clients.models import Client
+    from crm.clients.serializers import ClientSerializer
+    from crm.compiled import CompiledListSerializer
+    from crm.contracts.models import Contract
+    from crm.contracts.serializers import ContractSerializer
+    from crm.datagen import GeneratorConfig, generate
+    from crm.events.models import Event
+    from crm.events.serializers import EventSerializer
+    from crm.renderers import FastJSONRenderer, orjson
+
+    cases = [
+        ("clients", ClientSerializer, Client.objects.select_related("sales_contact")),
+        ("contrats", ContractSerializer, Contract.objects.select_related("client", "sales_contact")),
+        ("événements", EventSerializer, Event.objects.select_related("client", "support_contact")),
+    ]
+
+    with test_database():
+        generate(GeneratorConfig(clients=args.clients, seed=1))
+
+        rows = [("liste", "lignes", "DRF (ms)", "précompilé + rendu rapide (ms)", "gain")]
+        for label, serializer_class, queryset in cases:
+            instances = list(queryset.order_by("id")[: args.rows])
+
+            def standard():
+                return JSONRenderer().render(serializer_class(instances, many=True).data)
+
+            def fast():
+                return FastJSONRenderer().render(CompiledListSerializer(instances, serializer_class()).data)
+
+            assert standard() == fast()
+            slow = measure(standard, args.repeat, clock=time.process_time)["median"]
+            quick = measure(fast, args.repeat, clock=time.process_time)["median"]
+            rows.append((label, len(instances), f"{slow * 1000:.1f}", f"{quick * 1000:.1f}", f"x{slow / quick:.1f}"))
+
+    print_table(f"Sérialisation des listes (orjson {'actif' if orjson else 'absent'})", rows)
+
+
+if __name__ == "__main__":
+    main()
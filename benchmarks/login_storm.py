@@ -0,0 +1,89 @@
+"""
+Tempête de connexions concurrentes sur `POST /api/auth/jwt/create/`.
+
+Usage :
+    python -m benchmarks.login_storm [--threads 8] [--attempts 40] [--users 4]
+
+Chaque thread enchaîne des tentatives (1 sur 4 avec un mauvais mot de passe) sur
+un petit ensemble de comptes, d'abord sans limitation puis avec les débits de
+`settings.LOGIN_THROTTLE`. Les durées `db` / `hash` proviennent de l'en-tête
+`Server-Timing` renvoyé par `LoginView` (hacheur par défaut, PBKDF2), activé ici
+par `DEBUG=True` (jamais exposé hors `DEBUG`).
+"""
+
+import argparse
+import logging
+import re
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import print_table, setup_django, test_database
+
+TIMING = re.compile(r"(\w+);dur=([\d.]+)")
+
+
+def storm(threads: int, attempts: int, usernames: list[str]) -> dict:
+    from django.db import connection
+    from django.test import Client
+
+    def worker(n: int):
+        client = Client(REMOTE_ADDR=f"10.0.0.{n % 4}")
+        results = []
+        for i in range(attempts):
+            password = "wrong" if i % 4 == 3 else "Azerty123$"
+            r = client.post("/api/auth/jwt/create/", {"username": usernames[(n + i) % len(usernames)],
+                                                      "password": password}, content_type="application/json")
+            results.append((r.status_code, dict(TIMING.findall(r.get("Server-Timing", "")))))
+        connection.close()
+        return results
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        results = [item for chunk in pool.map(worker, range(threads)) for item in chunk]
+    wall = time.perf_counter() - started
+
+    statuses = Counter(status for status, _ in results)
+    return {
+        "wall": wall,
+        "statuses": statuses,
+        "hash": sum(float(t.get("hash", 0)) for _, t in results) / 1000,
+        "db": sum(float(t.get("db", 0)) for _, t in results) / 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--attempts", type=int, default=40)
+    parser.add_argument("--users", type=int, default=4)
+    args = parser.parse_args()
+
+    setup_django()
+    logging.getLogger("django.request").setLevel(logging.ERROR)  # 401/429 attendus
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.test import override_settings
+
+    from crm.users.throttling import reset_login_throttles
+
+    with test_database():
+        User = get_user_model()
+        usernames = [f"storm_{i}" for i in range(args.users)]
+        for username in usernames:
+            User.objects.create_user(username=username, email="", password="Azerty123$", role="SUPPORT")
+
+        unlimited = {**settings.LOGIN_THROTTLE, "RATES": {"ip": (10 ** 6, 1), "username": (10 ** 6, 1)}}
+        rows = [("mode", "mur (s)", "200", "401", "429", "hachage (s)", "base (s)")]
+        for label, throttle in (("sans limite", unlimited), ("LOGIN_THROTTLE", settings.LOGIN_THROTTLE)):
+            reset_login_throttles()
+            with override_settings(LOGIN_THROTTLE=throttle, DEBUG=True):
+                res = storm(args.threads, args.attempts, usernames)
+            s = res["statuses"]
+            rows.append((label, f"{res['wall']:.2f}", s[200], s[401], s[429], f"{res['hash']:.2f}", f"{res['db']:.3f}"))
+
+    print_table(f"{args.threads} threads × {args.attempts} tentatives, {args.users} comptes", rows)
+
+
+if __name__ == "__main__":
+    main()
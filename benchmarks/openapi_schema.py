@@ -0,0 +1,62 @@
+"""
+Latence de `/api/schema/` : `SpectacularAPIView` (introspection à chaque appel)
+vs `CachedSpectacularAPIView` (rendu en mémoire, revalidation par ETag).
+
+Usage :
+    python -m benchmarks.openapi_schema [--repeat 10]
+
+Les vues sont appelées directement (RequestFactory) : le coût mesuré est celui
+de la génération / du rendu, sans réseau.
+"""
+
+import argparse
+import logging
+import time
+
+from benchmarks.common import measure, print_table, setup_django
+
+MEDIA_TYPES = [("YAML", "application/vnd.oai.openapi"), ("JSON", "application/vnd.oai.openapi+json")]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.test import RequestFactory
+    from drf_spectacular.views import SpectacularAPIView
+
+    from crm.schema import CachedSpectacularAPIView, clear_schema_cache
+
+    logging.getLogger("drf_spectacular").setLevel(logging.ERROR)
+    factory = RequestFactory()
+    original = SpectacularAPIView.as_view()
+    cached = CachedSpectacularAPIView.as_view(force_cache=True)
+
+    rows = [("format", "variante", "meilleur (ms)", "médiane (ms)")]
+    for label, media_type in MEDIA_TYPES:
+        def call(view, **headers):
+            response = view(factory.get("/api/schema/", HTTP_ACCEPT=media_type, **headers))
+            return response.render() if hasattr(response, "render") else response
+
+        clear_schema_cache()
+        started = time.perf_counter()
+        etag = call(cached)["ETag"]
+        first = time.perf_counter() - started
+
+        variants = [
+            ("spectacular (chaque appel)", lambda: call(original)),
+            ("cache mémoire", lambda: call(cached)),
+            ("cache + If-None-Match (304)", lambda: call(cached, HTTP_IF_NONE_MATCH=etag)),
+        ]
+        rows.append((label, "cache : 1er appel (génération)", f"{first * 1000:.1f}", "—"))
+        for name, fn in variants:
+            timing = measure(fn, args.repeat)
+            rows.append((label, name, f"{timing['best'] * 1000:.2f}", f"{timing['median'] * 1000:.2f}"))
+
+    print_table("Schéma OpenAPI", rows)
+
+
+if __name__ == "__main__":
+    main()
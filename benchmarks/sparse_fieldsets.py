@@ -0,0 +1,57 @@
+"""
+Taille des réponses et latence des listes : représentation complète vs `?compact=true`
+vs `?fields=` minimal.
+
+Usage :
+    python -m benchmarks.sparse_fieldsets [--clients 2000] [--repeat 30]
+
+Les données sont produites par `crm.datagen` dans une base de test jetable ;
+les requêtes passent par la pile Django complète (client de test, GESTION).
+"""
+
+import argparse
+
+from benchmarks.common import measure, print_table, setup_django, test_database
+
+VARIANTS = [
+    ("complet", {}),
+    ("compact", {"compact": "true"}),
+    ("fields=id,…", None),
+]
+MINIMAL = {
+    "/api/clients/": "id,full_name",
+    "/api/contracts/": "id,amount_due",
+    "/api/events/": "id,event_start",
+}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.contrib.auth import get_user_model
+    from rest_framework.test import APIClient
+
+    from crm.datagen import GeneratorConfig, generate
+
+    with test_database():
+        generate(GeneratorConfig(clients=args.clients, seed=1))
+        api = APIClient()
+        api.force_authenticate(user=get_user_model().objects.get(username="gestion_1"))
+
+        rows = [("endpoint", "variante", "octets", "meilleur (ms)", "médiane (ms)")]
+        for url in MINIMAL:
+            for label, params in VARIANTS:
+                params = {"fields": MINIMAL[url]} if params is None else params
+                size = len(api.get(url, params).content)
+                timing = measure(lambda: api.get(url, params), args.repeat)
+                rows.append((url, label, size, f"{timing['best'] * 1000:.2f}", f"{timing['median'] * 1000:.2f}"))
+
+    print_table(f"Listes paginées (page par défaut), {args.clients} clients", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Coût du hachage des mots de passe : fixtures de test et provisionnement en masse.
+
+Usage :
+    python -m benchmarks.user_provisioning [--users 64] [--repeat 3]
+
+Mesures :
+    - mise en place des 4 utilisateurs de `tests/conftest.py` avec le hacheur par
+      défaut (PBKDF2) puis avec le profil de test (`epic_crm.settings_test`, MD5) ;
+    - création de N comptes un par un (`create_user`, comme `UserSerializer.create`)
+      puis via `provision_users` : pool de threads (requête `POST /api/users/bulk/`)
+      et pool de processus (commande `provision_users`), suivis de `bulk_create`.
+"""
+
+import argparse
+import os
+
+from benchmarks.common import measure, print_table, setup_django, test_database
+
+FIXTURE_USERS = [
+    ("gestion_test", "GESTION"),
+    ("commercial_test", "COMMERCIAL"),
+    ("commercial_test_2", "COMMERCIAL"),
+    ("support_test", "SUPPORT"),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.contrib.auth import get_user_model
+    from django.test import override_settings
+
+    from crm.users.services import provision_users
+
+    User = get_user_model()
+    fast = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+    def fixtures():
+        for username, role in FIXTURE_USERS:
+            User.objects.create_user(username=username, email=f"{username}@test.com",
+                                     password="Azerty123$", role=role)
+        User.objects.all().delete()
+
+    rows = [{"username": f"bulk_{i}", "email": f"bulk_{i}@test.com", "role": "SUPPORT",
+             "password": "Azerty123$"} for i in range(args.users)]
+
+    def one_by_one():
+        for row in rows:
+            User.objects.create_user(**row)
+        User.objects.all().delete()
+
+    def bulk(processes):
+        provision_users(rows, processes=processes)
+        User.objects.all().delete()
+
+    with test_database():
+        default = measure(fixtures, args.repeat)
+        with override_settings(PASSWORD_HASHERS=fast):
+            profile = measure(fixtures, args.repeat)
+        serial = measure(one_by_one, args.repeat)
+        threaded = measure(lambda: bulk(False), args.repeat)
+        pooled = measure(lambda: bulk(True), args.repeat)
+
+    print_table("Mise en place des fixtures utilisateurs (4 comptes)", [
+        ("hacheur", "meilleur (s)", "médiane (s)"),
+        ("PBKDF2 (défaut)", f"{default['best']:.3f}", f"{default['median']:.3f}"),
+        ("MD5 (settings_test)", f"{profile['best']:.3f}", f"{profile['median']:.3f}"),
+    ])
+    print_table(f"Provisionnement de {args.users} comptes (PBKDF2, {os.cpu_count()} cœur(s))", [
+        ("méthode", "meilleur (s)", "médiane (s)"),
+        ("create_user un par un", f"{serial['best']:.3f}", f"{serial['median']:.3f}"),
+        ("provision_users (threads, API)", f"{threaded['best']:.3f}", f"{threaded['median']:.3f}"),
+        ("provision_users (processus, commande)", f"{pooled['best']:.3f}", f"{pooled['median']:.3f}"),
+    ])
+
+
+if __name__ == "__main__":
+    main()
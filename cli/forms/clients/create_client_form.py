@@ -7,6 +7,17 @@ from cli.validators.phone_validator import validate_phone
 from cli.validators.exceptions import ValidationError
 from cli.utils.session import session
 from cli.utils.config import CLIENT_URL
+from cli.services.search.pick import pick_user
+
+
+def _duplicates(resp) -> list:
+    """Messages « doublon probable » d'une réponse 400 de création ([] sinon)."""
+    if resp.status_code != 400:
+        return []
+    try:
+        return resp.json().get("duplicates") or []
+    except (ValueError, AttributeError):
+        return []
 
 
 def _format_fr_phone(raw: str) -> str:
@@ -124,11 +135,9 @@ def create_client_form():
     # 🎯 Sales contact (uniquement visible pour GESTION ; COMMERCIAL ignoré côté serveur)
     role = (session.user or {}).get("role")
     if role == "GESTION":
-        sc = input("   🎯 ID du commercial (optionnel) : ").strip()
-        if sc and sc.isdigit():
-            payload["sales_contact"] = int(sc)
-        elif sc and not sc.isdigit():
-            print("   ⚠️ ID commercial ignoré (doit être un entier).")
+        sc = pick_user("   🎯 Commercial (ID ou début du nom, optionnel) : ", role="COMMERCIAL", optional=True)
+        if sc is not None:
+            payload["sales_contact"] = sc
 
     # 📋 Récapitulatif (confirmation)
     print("\n" + "-" * 50)
@@ -152,6 +161,17 @@ def create_client_form():
     print("\n⏳ Enregistrement du client…")
     resp = session.post(CLIENT_URL, json=payload)
 
+    # 👯 Doublon probable : le serveur liste les fiches proches, création confirmée sur demande
+    duplicates = _duplicates(resp)
+    if duplicates:
+        print("⚠️ Ce client ressemble à des fiches existantes :")
+        for message in duplicates:
+            print(f"   • {message}")
+        if input("   Créer quand même ? (o/N) : ").strip().lower() != "o":
+            print("   ❌ Création annulée.")
+            return None
+        resp = session.post(CLIENT_URL, json=payload, params={"allow_duplicate": "true"})
+
     if 200 <= resp.status_code < 300:
         client = resp.json()
         print(f"✅ Client #{client.get('id')} créé : {client.get('full_name')} – {client.get('company_name')}")
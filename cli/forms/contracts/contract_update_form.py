@@ -2,6 +2,7 @@
 from cli.validators.exceptions import ValidationError
 from cli.validators.validate_amount import validate_amount
 from cli.validators.validate_signed_input import validate_signed_input
+from cli.services.search.pick import pick_client
 from cli.utils.session import session
 from cli.utils.config import CONTRACT_URL
 
@@ -12,7 +13,8 @@ def create_contract_form():
     puis envoie la requête de création à l’API.
 
     Comportement :
-      - Demande l'ID client (entier).
+      - Demande le client : ID, ou début du nom / de l'entreprise puis choix
+        parmi les suggestions ('retour' pour annuler).
       - Valide les montants via `validate_amount` (décimal valide).
       - Valide le statut signé via `validate_signed_input` (oui/non).
       - Affiche un récapitulatif et demande confirmation.
@@ -27,15 +29,13 @@ def create_contract_form():
     print("=" * 50 + "\n")
 
     # ——————————————————————————————————————————————————————————————
-    # 📌 ID client (doit être un entier > 0 ; ici on vérifie seulement "isdigit")
-    #     Si tu veux durcir la validation, fais-le dans le validator dédié.
+    # 📌 Client : ID, ou début du nom / de l'entreprise puis choix
+    #     parmi les suggestions (autocomplétion côté API)
     # ——————————————————————————————————————————————————————————————
-    while True:
-        client_id_raw = input("   🔹 ID du client         : ").strip()
-        if client_id_raw.isdigit():
-            client_id = int(client_id_raw)
-            break
-        print("   ❌ L’ID client doit être un nombre entier.")
+    client_id = pick_client("   🔹 Client (ID ou début du nom) : ")
+    if client_id is None:
+        print("   ❌ Création annulée.")
+        return None
 
     # ——————————————————————————————————————————————————————————————
     # 💰 Montant total (validation via validator de domaine)
@@ -52,7 +52,7 @@ def create_event_form(signed_contracts: list[dict]):
       - Le client est imposé par le contrat (évite les incohérences).
 
     Args:
-        signed_contracts (list[dict]): liste de contrats signés visibles par l’utilisateur.
+        signed_contracts (list[dict]): contrats signés, encore sans événement, visibles par l’utilisateur.
 
     Returns:
         dict | None: L’événement créé si succès, sinon None.
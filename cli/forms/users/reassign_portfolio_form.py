@@ -0,0 +1,133 @@
+# cli/forms/users/reassign_portfolio_form.py
+
+from typing import Optional
+
+from cli.utils.session import session
+from cli.utils.config import USER_URL
+
+LABELS = {"clients": "client(s)", "contracts": "contrat(s)", "events": "événement(s)"}
+
+
+def _ask_id(prompt: str) -> Optional[int]:
+    """Saisie d'un ID numérique ; None si l'utilisateur tape 'retour'."""
+    while True:
+        value = input(prompt).strip()
+        if value.lower() == "retour":
+            return None
+        if value.isdigit():
+            return int(value)
+        print("❌ L'ID doit être un nombre entier.")
+
+
+def _ask_client_ids() -> Optional[list[int]]:
+    """IDs clients séparés par des virgules ; liste vide = tout le portefeuille, None = annulation."""
+    while True:
+        value = input("👥 IDs des clients concernés (séparés par des virgules, Entrée = tous) : ").strip()
+        if value.lower() == "retour":
+            return None
+        parts = [p.strip() for p in value.split(",") if p.strip()]
+        if all(p.isdigit() for p in parts):
+            return [int(p) for p in parts]
+        print("❌ Saisissez des IDs numériques séparés par des virgules.")
+
+
+def _print_error(resp) -> None:
+    if resp.status_code == 404:
+        print("❌ Utilisateur introuvable.")
+    elif resp.status_code == 403:
+        print("⛔ Permission refusée : réservé au rôle GESTION.")
+    else:
+        print(f"❌ Erreur HTTP {resp.status_code} :")
+        try:
+            print(resp.json())
+        except ValueError:
+            print(resp.text)
+
+
+def reassign_portfolio_form() -> Optional[dict]:
+    """
+    Formulaire CLI pour transférer le portefeuille d'un collaborateur à un autre.
+
+    Comportement :
+      - Demande l'ID du collaborateur qui part, puis celui du destinataire
+      - Permet de limiter le transfert à certains clients (Entrée = tous)
+      - Affiche d'abord un essai à blanc (`dry_run`) : nombre de lignes concernées
+        et événements qui chevaucheraient le planning du destinataire
+      - Après confirmation, exécute le transfert (une requête côté serveur),
+        conflits de planning acceptés explicitement le cas échéant
+
+    Retour :
+      - dict : les compteurs renvoyés par l'API en cas de succès
+      - None : si annulé par l'utilisateur ou en cas d'erreur
+    """
+    print("\n" + "=" * 50)
+    print("🔁 RÉAFFECTATION D’UN PORTEFEUILLE".center(50))
+    print("=" * 50)
+    print("(Tape 'retour' à tout moment pour annuler)\n")
+
+    source_id = _ask_id("🔢 ID du collaborateur dont le portefeuille est transféré : ")
+    if source_id is None:
+        print("❌ Réaffectation annulée.")
+        return None
+    target_id = _ask_id("🎯 ID du collaborateur destinataire : ")
+    if target_id is None:
+        print("❌ Réaffectation annulée.")
+        return None
+    client_ids = _ask_client_ids()
+    if client_ids is None:
+        print("❌ Réaffectation annulée.")
+        return None
+
+    payload = {"to": target_id}
+    if client_ids:
+        payload["client_ids"] = client_ids
+    url = f"{USER_URL}{source_id}/reassign/"
+
+    # ─────────────────────────────────────────────────────────────
+    # 🧪 Essai à blanc : aperçu des volumes
+    # ─────────────────────────────────────────────────────────────
+    try:
+        resp = session.post(url, json={**payload, "dry_run": True})
+    except Exception as exc:
+        print(f"❌ Impossible de contacter le serveur : {exc}")
+        return None
+    if resp.status_code != 200:
+        _print_error(resp)
+        return None
+
+    preview = resp.json()
+    counts = {k: preview[k] for k in LABELS if k in preview}
+    if not any(counts.values()):
+        print("ℹ️ Rien à transférer pour ce collaborateur.")
+        return None
+
+    print("\n📋 Seront transférés :")
+    for key, n in counts.items():
+        print(f"   • {n} {LABELS[key]}")
+    conflicts = preview.get("conflicts") or []
+    if conflicts:
+        print("\n⚠️ Conflits de planning avec le destinataire :")
+        for c in conflicts:
+            print(f"   • événement #{c['event']} ↔ événement #{c['conflicts_with']}")
+        payload["allow_conflicts"] = True
+    confirm = input(f"\n   Confirmer le transfert vers l’utilisateur #{target_id} ? (o/N) : ").strip().lower()
+    if confirm != "o":
+        print("❌ Réaffectation annulée.")
+        return None
+
+    # ─────────────────────────────────────────────────────────────
+    # 📨 Transfert effectif
+    # ─────────────────────────────────────────────────────────────
+    try:
+        resp = session.post(url, json=payload)
+    except Exception as exc:
+        print(f"❌ Impossible de contacter le serveur : {exc}")
+        return None
+    if resp.status_code != 200:
+        _print_error(resp)
+        return None
+
+    result = resp.json()
+    done = ", ".join(f"{result[k]} {LABELS[k]}" for k in LABELS if k in result)
+    print(f"✅ Portefeuille transféré : {done}.")
+    return result
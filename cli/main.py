@@ -12,23 +12,14 @@ django.setup()
 
 def _ensure_current_user():
     """
-    Si la session n'a pas encore d'utilisateur chargé, on le récupère à partir du token.
+    Si la session n'a pas encore d'utilisateur chargé (profil absent de la réponse
+    de connexion), on le récupère via /api/users/me/.
     """
     if getattr(session, "user", None):
         return
 
     try:
-        # On lit l'ID dans l'access token puis GET /api/users/{id}/
-        import jwt
-        access = session._ensure_access() if hasattr(session, "_ensure_access") else session.ensure_access_token()
-        payload = jwt.decode(access, options={"verify_signature": False})
-        uid = payload.get("user_id")
-        if not uid:
-            return
-        resp = session.get(f"/api/users/{uid}/")
-        data = session.ok_json(resp)
-        if data:
-            session.user = data  # on mémorise pour tout le CLI
+        session.load_current_user()
     except Exception:
         # Pas bloquant : le menu pourra encore s'afficher, mais sans le nom/role
         pass
@@ -49,6 +40,9 @@ def main():
     # 6) Router vers le menu selon le rôle
     show_menu()
 
+    # 7) Volume échangé pendant la session (compression négociée)
+    print(f"📦 {session.transfer_summary()}")
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
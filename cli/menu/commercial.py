@@ -3,10 +3,13 @@
 from typing import Optional
 
 from cli.services.clients.get_clients import list_clients
+from cli.services.clients.get_followup import show_clients_to_call
 from cli.services.contracts.get_contracts import list_contracts
 from cli.forms.clients.create_client_form import create_client_form
 from cli.forms.clients.update_client_form import update_client_form
 from cli.forms.events.create_event_form import create_event_form
+from cli.services.pipeline.get_pipeline import show_my_pipeline
+from cli.utils.config import LARGEST_PAGE
 
 
 def commercial_menu() -> Optional[None]:
@@ -21,6 +24,8 @@ def commercial_menu() -> Optional[None]:
       5) Lister uniquement les contrats non signés (filtre serveur).
       6) Lister les contrats avec montant dû > 0 (filtre serveur).
       7) Créer un événement pour un contrat signé (formulaire → POST direct).
+      8) Afficher son pipeline (agrégats matérialisés côté API).
+      9) Clients à relancer (non contactés depuis N jours, page par page).
       0) Retour au routeur de menus.
 
     Retour :
@@ -40,6 +45,8 @@ def commercial_menu() -> Optional[None]:
         print("5. Contrats non signés")
         print("6. Modifier un de mes contrats")
         print("7. Créer un événement (pour un contrat signé)")
+        print("8. Mon pipeline")
+        print("9. Clients à relancer")
         print("0. Retour")
 
         choice = input("\nVotre choix : ").strip()
@@ -86,16 +93,35 @@ def commercial_menu() -> Optional[None]:
 
         # ─────────────────────────────────────────────────────────
         # 7) Créer un événement pour un contrat signé :
-        #    - Récupère la liste des contrats signés (filtre serveur),
+        #    - Récupère les contrats signés qui n’ont pas encore d’événement
+        #      (filtres serveur `is_signed` + `has_event`, plus grande page),
         #    - Passe cette liste au formulaire, qui POST directement l’événement.
         # ─────────────────────────────────────────────────────────
         elif choice == "7":
-            signed_contracts = list_contracts(params={"is_signed": "true"}, display=False)
+            signed_contracts = list_contracts(
+                params={"is_signed": "true", "has_event": "false", **LARGEST_PAGE}, display=False
+            )
             if not signed_contracts:
-                print("ℹ️ Aucun contrat signé disponible.")
+                print("ℹ️ Aucun contrat signé sans événement.")
                 continue
             create_event_form(signed_contracts)
 
+        # ─────────────────────────────────────────────────────────
+        # 8) Pipeline : un seul appel API (agrégats maintenus côté serveur)
+        # ─────────────────────────────────────────────────────────
+        elif choice == "8":
+            show_my_pipeline()
+
+        # ─────────────────────────────────────────────────────────
+        # 9) Liste de relance : N jours sans contact (Entrée = défaut serveur)
+        # ─────────────────────────────────────────────────────────
+        elif choice == "9":
+            days = input("Jours sans contact (Entrée = valeur par défaut) : ").strip()
+            if days and not days.isdigit():
+                print("❌ Le nombre de jours doit être un entier.")
+                continue
+            show_clients_to_call(int(days) if days else None)
+
         # ─────────────────────────────────────────────────────────
         # 0) Retour
         # ─────────────────────────────────────────────────────────
@@ -8,6 +8,7 @@ from cli.forms.contracts.update_contract_form import update_contract_form
 from cli.forms.users.create_user_form import create_user_form
 from cli.forms.users.user_update_form import update_user_form
 from cli.forms.users.user_delete_form import delete_user_form
+from cli.forms.users.reassign_portfolio_form import reassign_portfolio_form
 
 # ✅ Imports services (listings + MAJ support événement)
 from cli.services.clients.get_clients import list_clients
@@ -35,6 +36,7 @@ def gestion_menu() -> Optional[None]:
       8) Créer un collaborateur
       9) Modifier un collaborateur
      10) Supprimer un collaborateur
+     11) Réaffecter le portefeuille d’un collaborateur (clients, contrats, événements)
       0) Retour au routeur de menus
 
     Remarques :
@@ -59,6 +61,7 @@ def gestion_menu() -> Optional[None]:
         print("8. Créer un collaborateur")
         print("9. Modifier un collaborateur")
         print("10. Supprimer un collaborateur")
+        print("11. Réaffecter un portefeuille")
         print("0. Retour")
 
         choice = input("\nVotre choix : ").strip()
@@ -143,6 +146,13 @@ def gestion_menu() -> Optional[None]:
         elif choice == "10":
             delete_user_form()  # DELETE direct
 
+        # ─────────────────────────────────────────────────────────
+        # 11) Utilisateurs : réaffectation du portefeuille
+        #     (aperçu dry_run puis transfert confirmé)
+        # ─────────────────────────────────────────────────────────
+        elif choice == "11":
+            reassign_portfolio_form()
+
         # ─────────────────────────────────────────────────────────
         # 0) Retour
         # ─────────────────────────────────────────────────────────
@@ -5,10 +5,12 @@ Menu CLI pour le rôle SUPPORT.
 Fonctions principales :
 - Lister uniquement les événements assignés à l'utilisateur connecté.
 - Mettre à jour un événement dont l'utilisateur est responsable.
+- Consulter son agenda (semaine / mois) et l'exporter au format ICS.
 Le backend (permissions) garantit que le support ne peut modifier
 que ses propres événements.
 """
 
+from cli.services.events.get_agenda import export_agenda_ics, show_agenda
 from cli.services.events.get_events import list_events
 from cli.services.events.update_event import _input_int, _update_event_form_support
 from cli.utils.config import EVENT_URL
@@ -20,6 +22,8 @@ def support_menu() -> None:
     Affiche le menu dédié au rôle SUPPORT et route les actions.
     - Option 1 : liste les événements dont `support_contact` = session.user.id
     - Option 2 : met à jour un événement (horaires, notes, etc.) si autorisé
+    - Options 3/4 : agenda de la semaine / du mois (un seul appel API)
+    - Option 5 : export ICS du mois courant
     """
     while True:
         print("\n" + "=" * 50)
@@ -27,6 +31,9 @@ def support_menu() -> None:
         print("=" * 50)
         print("1. Lister MES événements (assignés à moi)")
         print("2. Mettre à jour un de MES événements")
+        print("3. Mon agenda de la semaine")
+        print("4. Mon agenda du mois")
+        print("5. Exporter mon agenda du mois (ICS)")
         print("0. Retour")
 
         choice = input("\nVotre choix : ").strip()
@@ -66,6 +73,17 @@ def support_menu() -> None:
                 except ValueError:
                     print("📨", resp.text)
 
+        elif choice == "3":
+            show_agenda(period="week")
+
+        elif choice == "4":
+            show_agenda(period="month")
+
+        elif choice == "5":
+            path = input("📁 Fichier de destination [agenda.ics] : ").strip() or "agenda.ics"
+            if path.lower() != "retour":
+                export_agenda_ics(path, period="month")
+
         elif choice == "0":
             break
 
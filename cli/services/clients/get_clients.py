@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import List, Dict, Tuple, Any, Optional
 
 from cli.services.clients.helpers import _parse_date, _print_table
-from cli.utils.config import CLIENT_URL
+from cli.utils.config import CLIENT_URL, WITHOUT_COUNT
 from cli.utils.session import session
 
 
@@ -14,6 +14,8 @@ def list_clients(display: bool = True) -> list[dict]:
     Comportement :
       - Retourne toujours une liste d’objets clients (items), même si l’API est paginée.
       - N’affiche rien si `display=False`.
+      - Pour l’affichage, seules les colonnes du tableau sont demandées (`?compact=true`).
+      - Pagination sans total (`?count=false`) : le serveur ne compte pas les lignes.
       - En cas d’erreur HTTP ou JSON invalide, retourne une liste vide.
 
     Paramètres :
@@ -23,7 +25,10 @@ def list_clients(display: bool = True) -> list[dict]:
       list[dict] : liste des clients (page courante si pagination DRF).
     """
     # ── Appel API (session gère JWT + headers)
-    resp = session.get(CLIENT_URL)
+    query: Dict[str, Any] = dict(WITHOUT_COUNT)
+    if display:
+        query["compact"] = "true"
+    resp = session.get(CLIENT_URL, params=query)
     data = session.ok_json(resp)
     if data is None:
         # Erreur déjà journalisée par ok_json()
@@ -81,8 +86,9 @@ def list_clients(display: bool = True) -> list[dict]:
         # Pied de tableau si pagination DRF active
         footer: Optional[str] = None
         if is_paginated:
+            total = f"Total: {count} | " if count is not None else ""
             footer = (
-                f"Total: {count} | "
+                f"{total}"
                 f"Page précédente: {'Oui' if previous_page else 'Non'} | "
                 f"Page suivante: {'Oui' if next_page else 'Non'}"
             )
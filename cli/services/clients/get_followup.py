@@ -0,0 +1,51 @@
+# cli/services/clients/get_followup.py
+from typing import Any, Dict, List, Optional
+
+from cli.services.clients.helpers import _print_table
+from cli.services.contracts.helpers import _fmt_euro
+from cli.utils.config import CLIENT_TO_CALL_URL
+from cli.utils.session import session
+
+
+def show_clients_to_call(days: Optional[int] = None, page_size: int = 20) -> List[Dict[str, Any]]:
+    """
+    Affiche la liste de relance : clients non contactés depuis `days` jours
+    (défaut serveur si None), du plus ancien au plus récent, page par page.
+
+    Comportement :
+      - Une requête par page ; la page suivante n'est demandée qu'à la demande
+        (Entrée), via le lien `next` renvoyé par l'API.
+      - 'q' arrête le parcours.
+
+    Retour :
+      list[dict] : clients affichés (toutes pages parcourues).
+    """
+    params: Dict[str, Any] = {"page_size": page_size}
+    if days is not None:
+        params["days"] = days
+
+    resp = session.get(CLIENT_TO_CALL_URL, absolute=True, params=params)
+    shown: List[Dict[str, Any]] = []
+    headers = [("ID", 6), ("Nom complet", 24), ("Entreprise", 22), ("Téléphone", 14),
+               ("Dernier contact", 15), ("Jours", 5), ("Montant dû", 14)]
+
+    while True:
+        data = session.ok_json(resp)
+        if data is None:
+            return shown
+        items = data.get("results", [])
+        if not items and not shown:
+            print("✅ Aucun client à relancer.")
+            return shown
+
+        shown.extend(items)
+        rows = [[c.get("id"), c.get("full_name"), c.get("company_name"), c.get("phone"), c.get("last_contact"),
+                 c.get("days_since_contact"), _fmt_euro(c.get("contracts_amount_due"))] for c in items]
+        _print_table(headers, rows, footer=f"📞 {len(shown)} client(s) à relancer affiché(s).")
+
+        next_url = data.get("next")
+        if not next_url:
+            return shown
+        if input("   Entrée : page suivante — q : quitter : ").strip().lower() == "q":
+            return shown
+        resp = session.get(next_url, absolute=True)
@@ -1,6 +1,6 @@
 from typing import Any, Dict, List, Optional
 from cli.services.contracts.helpers import _fmt_euro, _date_only
-from cli.utils.config import CONTRACT_URL
+from cli.utils.config import CONTRACT_URL, WITHOUT_COUNT
 from cli.utils.session import session
 
 
@@ -12,6 +12,8 @@ def list_contracts(params: Optional[Dict[str, Any]] = None, display: bool = True
     Comportement :
       - Les filtres sont passés au backend via `params` (ex. {"is_signed": "false"}).
       - Retourne toujours une liste d’objets contrats (page courante si pagination).
+      - Pour l’affichage, seules les colonnes du tableau sont demandées (`?compact=true`).
+      - Pagination sans total (`?count=false`) : le serveur ne compte pas les lignes.
       - En cas d’erreur HTTP/JSON, retourne une liste vide (les erreurs sont déjà affichées par ok_json()).
 
     Paramètres :
@@ -22,7 +24,10 @@ def list_contracts(params: Optional[Dict[str, Any]] = None, display: bool = True
       list[dict] : liste des contrats.
     """
     # ── Appel API (session gère JWT + headers)
-    resp = session.get(CONTRACT_URL, params=params or {})
+    query: Dict[str, Any] = {**WITHOUT_COUNT, **(params or {})}
+    if display:
+        query["compact"] = "true"
+    resp = session.get(CONTRACT_URL, params=query)
     data = session.ok_json(resp)
     if data is None:
         return []
@@ -77,8 +82,9 @@ def list_contracts(params: Optional[Dict[str, Any]] = None, display: bool = True
 
         # Pied de tableau si pagination DRF active
         if paginated:
+            total = f"Total: {count} | " if count is not None else ""
             print(
-                f"\nTotal: {count} | "
+                f"\n{total}"
                 f"Page précédente: {'Oui' if previous_page else 'Non'} | "
                 f"Page suivante: {'Oui' if next_page else 'Non'}"
             )
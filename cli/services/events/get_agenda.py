@@ -0,0 +1,96 @@
+# cli/services/events/get_agenda.py
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional
+
+from cli.services.events.get_events import _clip
+from cli.utils.config import EVENT_AGENDA_ICS_URL, EVENT_AGENDA_URL
+from cli.utils.session import session
+
+
+def _agenda_window(period: str, today: Optional[date] = None) -> tuple[date, date, str]:
+    """
+    Calcule la fenêtre [start, end[ et le regroupement pour une période :
+      - "week"  : semaine courante (lundi → lundi suivant), regroupée par jour
+      - "month" : mois courant (1er → 1er du mois suivant), regroupé par semaine
+    """
+    today = today or date.today()
+    if period == "month":
+        start = today.replace(day=1)
+        end = (start + timedelta(days=32)).replace(day=1)
+        return start, end, "week"
+    start = today - timedelta(days=today.weekday())
+    return start, start + timedelta(days=7), "day"
+
+
+def _hour(value: Optional[str]) -> str:
+    if not value:
+        return "—"
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).strftime("%d/%m %H:%M")
+    except Exception:
+        return value
+
+
+def show_agenda(period: str = "week", display: bool = True) -> Dict[str, Any]:
+    """
+    Affiche l’agenda de l’utilisateur connecté (périmètre filtré par rôle côté API).
+
+    - Un seul appel `GET events/agenda/` : le backend renvoie les événements déjà
+      regroupés par jour (semaine) ou par semaine (mois), sans pagination.
+    - Retourne la réponse brute ({start, end, bucket, count, buckets}) ou {} en cas d’erreur.
+    """
+    start, end, bucket = _agenda_window(period)
+    resp = session.get(
+        EVENT_AGENDA_URL,
+        absolute=True,
+        params={"start": start.isoformat(), "end": end.isoformat(), "bucket": bucket},
+    )
+    data = session.ok_json(resp)
+    if data is None:
+        return {}
+
+    if not display:
+        return data
+
+    title = "SEMAINE" if period == "week" else "MOIS"
+    print(f"\n🗓️  === MON AGENDA ({title} du {data.get('start')} au {data.get('end')}) ===")
+    if not data.get("count"):
+        print("🔍 Aucun événement sur la période.")
+        return data
+
+    for b in data.get("buckets", []):
+        label = f"Semaine du {b['key']}" if bucket == "week" else b["key"]
+        print(f"\n📌 {label} — {b['count']} événement(s)")
+        for e in b.get("events", []):
+            print(
+                f"   {_hour(e.get('event_start'))} → {_hour(e.get('event_end'))}  "
+                f"#{e.get('id'):<5} {_clip(e.get('event_name'), 28):<28} "
+                f"📍 {_clip(e.get('location'), 22):<22} "
+                f"👤 {_clip(e.get('client_full_name') or '—', 20)}"
+            )
+
+    print(f"\n📊 Total: {data.get('count')}")
+    return data
+
+
+def export_agenda_ics(path: str, period: str = "month") -> bool:
+    """
+    Télécharge l’export ICS de la période en streaming (écriture par blocs)
+    et l’enregistre dans `path`. Retourne True si succès.
+    """
+    start, end, _ = _agenda_window(period)
+    resp = session.get(
+        EVENT_AGENDA_ICS_URL,
+        absolute=True,
+        params={"start": start.isoformat(), "end": end.isoformat()},
+        stream=True,
+    )
+    if not 200 <= resp.status_code < 300:
+        session.ok_json(resp)
+        return False
+
+    with open(path, "wb") as f:
+        for chunk in resp.iter_content(chunk_size=65536):
+            f.write(chunk)
+    print(f"✅ Agenda exporté dans {path}")
+    return True
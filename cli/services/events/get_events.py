@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from cli.utils.config import EVENT_URL
+from cli.utils.config import EVENT_URL, WITHOUT_COUNT
 from cli.utils.session import session
 
 
@@ -33,10 +33,10 @@ def list_events(
     - Filtrage côté backend via `params` (ex: {"support_contact__isnull": "true"})
     - `user_id` force support_contact=<id>
     - `mine_only_for_support=True` utilise l'id de l'utilisateur connecté si son rôle est SUPPORT
-    - Gère pagination DRF ({count,next,previous,results})
-    - Affichage tableau (par défaut) ou détaillé
+    - Gère pagination DRF ({next,previous,results} ; sans total par défaut : `?count=false`)
+    - Affichage tableau (par défaut, colonnes seules via `?compact=true`) ou détaillé
     """
-    q: Dict[str, Any] = dict(params or {})
+    q: Dict[str, Any] = {**WITHOUT_COUNT, **(params or {})}
 
     # Si on veut "mes événements" pour un support, on impose le filtre
     if mine_only_for_support and session.user and session.user.get("role") == "SUPPORT":
@@ -46,6 +46,9 @@ def list_events(
     if user_id is not None:
         q["support_contact"] = user_id
 
+    if display and as_table:
+        q["compact"] = "true"
+
     resp = session.get(EVENT_URL, params=q)
     data = session.ok_json(resp)
     if data is None:
@@ -121,8 +124,9 @@ def list_events(
             print(f"📝 Notes         : {e.get('notes', 'Aucune note')}")
 
     if paginated:
+        total = f"📊 Total: {count} | " if count is not None else ""
         print(
-            f"\n📊 Total: {count} | "
+            f"\n{total}"
             f"⬅️ Page précédente: {'Oui' if prev_page else 'Non'} | "
             f"➡️ Page suivante: {'Oui' if next_page else 'Non'}"
         )
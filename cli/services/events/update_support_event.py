@@ -1,5 +1,5 @@
 # cli/forms/update_support_event.py
-from cli.utils.config import USER_URL  # ex: "/api/users/"
+from cli.utils.config import LARGEST_PAGE, USER_URL  # ex: "/api/users/"
 from cli.utils.session import session
 
 
@@ -16,7 +16,7 @@ def update_support_event():
     print("(Tape 'retour' à tout moment pour annuler)\n")
 
     # Récupère la liste des utilisateurs (filtrage côté client sur role == SUPPORT)
-    resp = session.get(USER_URL)  # si tu as un filtre serveur: USER_URL + "?role=SUPPORT"
+    resp = session.get(USER_URL, params=LARGEST_PAGE)  # si tu as un filtre serveur: USER_URL + "?role=SUPPORT"
     data = session.ok_json(resp)
     if data is None:
         return None, None
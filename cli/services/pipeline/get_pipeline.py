@@ -0,0 +1,42 @@
+# cli/services/pipeline/get_pipeline.py
+from typing import Any, Dict
+
+from cli.services.contracts.helpers import _fmt_euro
+from cli.services.events.get_events import _date_dt
+from cli.utils.config import PIPELINE_ME_URL
+from cli.utils.session import session
+
+
+def show_my_pipeline(display: bool = True) -> Dict[str, Any]:
+    """
+    Affiche le pipeline du commercial connecté en un seul appel API
+    (`GET pipeline/me/`) : clients, contrats non signés, montant restant dû
+    et prochains événements.
+
+    Retour :
+      dict : réponse de l’API, ou {} en cas d’erreur.
+    """
+    resp = session.get(PIPELINE_ME_URL, absolute=True)
+    data = session.ok_json(resp)
+    if data is None:
+        return {}
+
+    if not display:
+        return data
+
+    print("\n" + "=" * 50)
+    print("📈 MON PIPELINE".center(50))
+    print("=" * 50)
+    print(f"   🏢 Clients               : {data.get('clients_count', 0)}")
+    print(f"   📄 Contrats              : {data.get('contracts_count', 0)}")
+    print(f"   ✍️  Contrats non signés   : {data.get('unsigned_contracts_count', 0)}")
+    print(f"   💶 Montant restant dû    : {_fmt_euro(data.get('amount_due_total'))}")
+
+    upcoming = data.get("upcoming_events") or []
+    print("\n📅 Prochains événements :")
+    if not upcoming:
+        print("   — Aucun événement à venir.")
+    for e in upcoming:
+        print(f"   {_date_dt(e.get('event_start'))}  #{e.get('id')} {e.get('event_name')} ({e.get('location')})")
+
+    return data
@@ -0,0 +1,66 @@
+# cli/services/search/pick.py
+from typing import Any, Callable, Dict, List, Optional
+
+from cli.utils.config import AUTOCOMPLETE_CLIENT_URL, AUTOCOMPLETE_USER_URL
+from cli.utils.session import session
+
+# Suggestions affichées pour un début de saisie
+SUGGESTIONS = 8
+
+
+def _suggest(url: str, prefix: str, **params) -> List[Dict[str, Any]]:
+    """Suggestions de l'API pour `prefix` ([] en cas d'erreur)."""
+    try:
+        resp = session.get(url, absolute=True, params={"q": prefix, "limit": SUGGESTIONS, **params})
+    except Exception as exc:
+        print(f"   ❌ Impossible de contacter le serveur : {exc}")
+        return []
+    data = session.ok_json(resp)
+    return (data or {}).get("results", [])
+
+
+def _pick(prompt: str, url: str, label: Callable[[Dict[str, Any]], str],
+          optional: bool = False, **params) -> Optional[int]:
+    """
+    Saisie d'un ID, ou d'un début de nom puis choix parmi les suggestions.
+
+    Retour :
+      - int : ID saisi ou choisi
+      - None : 'retour' (ou Entrée si `optional`)
+    """
+    while True:
+        value = input(prompt).strip()
+        if value.lower() == "retour" or (optional and not value):
+            return None
+        if value.isdigit():
+            return int(value)
+        if not value:
+            print("   ❌ Saisissez un ID ou le début d’un nom.")
+            continue
+
+        results = _suggest(url, value, **params)
+        if not results:
+            print("   ❌ Aucune correspondance (2 caractères minimum).")
+            continue
+        for i, row in enumerate(results, 1):
+            print(f"      {i}. {label(row)}")
+        choice = input("   👉 Numéro (Entrée pour une autre recherche) : ").strip()
+        if choice.isdigit() and 1 <= int(choice) <= len(results):
+            return results[int(choice) - 1]["id"]
+
+
+def pick_client(prompt: str, mine: bool = False, optional: bool = False) -> Optional[int]:
+    """ID d'un client, par ID ou début du nom / de l'entreprise (`mine` : mes clients uniquement)."""
+    params = {"mine": "true"} if mine else {}
+    return _pick(prompt, AUTOCOMPLETE_CLIENT_URL,
+                 lambda c: f"#{c['id']} {c['full_name']} — {c['company_name']} ({c['email']})",
+                 optional=optional, **params)
+
+
+def pick_user(prompt: str, role: Optional[str] = None, optional: bool = False) -> Optional[int]:
+    """ID d'un collaborateur, par ID ou début du nom d'utilisateur (filtré sur `role`)."""
+    params = {"role": role} if role else {}
+    return _pick(prompt, AUTOCOMPLETE_USER_URL,
+                 lambda u: f"#{u['id']} {u['username']} "
+                           f"({' '.join(filter(None, (u['first_name'], u['last_name'], u['role'])))})",
+                 optional=optional, **params)
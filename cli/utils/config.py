@@ -20,12 +20,35 @@ JWT_VERIFY_URL  = url("auth/jwt/verify/")   # POST
 # (Optionnel, seulement si tu as cet endpoint côté API)
 ME_URL = url("users/me/")  # GET
 
+# --- Pagination ---
+# Plus grande page autorisée par l'API (plafond propre à chaque ressource),
+# pour les listes de sélection chargées en un seul appel
+LARGEST_PAGE = {"page_size": "max"}
+# Pagination sans total (pas de COUNT côté serveur) : les tableaux n'affichent
+# que la présence d'une page précédente / suivante
+WITHOUT_COUNT = {"count": "false"}
+
 # --- Ressources principales ---
 CLIENT_URL   = url("clients/")    # GET/POST, etc.
 CONTRACT_URL = url("contracts/")  # GET/POST/...
 EVENT_URL    = url("events/")     # GET/POST/...
 USER_URL     = url("users/")      # GET/POST/...
 
+# --- Pipeline commercial (agrégats matérialisés) ---
+PIPELINE_URL    = url("pipeline/")     # GET (GESTION : tous les pipelines)
+PIPELINE_ME_URL = url("pipeline/me/")  # GET (pipeline de l'utilisateur connecté)
+
+# --- Liste de relance (clients non contactés depuis N jours, pages par clé) ---
+CLIENT_TO_CALL_URL = url("clients/to-call/")  # GET ?days=&page_size= ; page suivante : `next`
+
+# --- Autocomplétion par préfixe (nom / entreprise / nom d'utilisateur) ---
+AUTOCOMPLETE_CLIENT_URL = url("autocomplete/clients/")  # GET ?q=&limit=&mine=
+AUTOCOMPLETE_USER_URL   = url("autocomplete/users/")    # GET ?q=&limit=&role=
+
+# --- Agenda des événements (regroupé par jour/semaine, export ICS) ---
+EVENT_AGENDA_URL     = url("events/agenda/")      # GET ?start=&end=&bucket=
+EVENT_AGENDA_ICS_URL = url("events/agenda/ics/")  # GET (text/calendar, streamé)
+
 # --- Routes rôle-spécifiques (uniquement si tu les as réellement implémentées) ---
 GESTION_EVENT_URL    = url("gestion/events/")
 GESTION_CONTRACT_URL = url("gestion/contracts/")
@@ -3,6 +3,7 @@
 import os
 import requests
 import jwt
+from urllib3.util import make_headers
 from getpass import getpass
 from datetime import datetime, timezone
 from typing import Optional, Any
@@ -33,6 +34,9 @@ TOKEN_FILE = os.path.expanduser("~/.epic_crm_token")
 # ⏱️ Timeout réseau par défaut (secondes)
 DEFAULT_TIMEOUT = 10
 
+# 📦 Encodages que le client sait décoder (gzip, deflate + br / zstd si brotli / zstandard installés)
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
 
 class Session:
     """
@@ -40,24 +44,33 @@ class Session:
     - Stocke access/refresh localement (~/.epic_crm_token)
     - Rafraîchit automatiquement l'access token si expiré
     - Expose get/post/put/patch/delete avec en-têtes Authorization
+    - Réutilise la connexion HTTP et négocie la compression des réponses
+      (décodage transparent, octets reçus / décodés comptés dans self.transfer)
     """
 
     def __init__(self):
         self.tokens: dict[str, str] = {}   # {"access": "...", "refresh": "..."}
         self.user: dict | None = None      # Informations utilisateur connecté
+        self.http = requests.Session()     # Connexion keep-alive partagée
+        self.http.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        self.transfer = {"wire": 0, "decoded": 0}
         self._load_tokens()
 
     # -----------------------
     # Authentification
     # -----------------------
     def login_prompt(self) -> bool:
-        """Demande username/password, enregistre les tokens si succès et charge le profil."""
+        """
+        Demande username/password, enregistre les tokens si succès et charge le profil.
+        Une seule requête : l'API renvoie tokens et profil ensemble.
+        """
         print("\n=== Connexion ===")
         username = input("Nom d'utilisateur : ").strip()
         password = getpass("Mot de passe : ")
 
         try:
-            r = requests.post(
+            r = self._request(
+                "POST",
                 JWT_CREATE_URL,  # ✅ URL avec slash final
                 json={"username": username, "password": password},
                 timeout=DEFAULT_TIMEOUT,
@@ -67,11 +80,13 @@ class Session:
             return False
 
         if r.status_code == 200:
-            self.tokens = r.json() or {}
+            data = r.json() or {}
+            self.tokens = {"access": data.get("access"), "refresh": data.get("refresh")}
             self._save_tokens()
 
-            # Charge immédiatement l'utilisateur connecté
-            if self.load_current_user():
+            # Le profil est embarqué dans la réponse de connexion (sinon : /users/me/)
+            self.user = data.get("user")
+            if self.user or self.load_current_user():
                 print(f"✅ Connecté en tant que {self.user.get('username')} ({self.user.get('role')})")
             else:
                 print("⚠️ Connecté, mais impossible de récupérer le profil utilisateur.")
@@ -142,7 +157,8 @@ class Session:
         if not refresh:
             return False
         try:
-            r = requests.post(
+            r = self._request(
+                "POST",
                 JWT_REFRESH_URL,  # ✅ URL avec slash final
                 json={"refresh": refresh},
                 timeout=DEFAULT_TIMEOUT,
@@ -229,25 +245,42 @@ class Session:
         """
         return urljoin(API_BASE_URL, path)
 
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Envoie la requête sur la connexion partagée et comptabilise les octets transférés."""
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        resp = self.http.request(method, url, **kwargs)
+        if not kwargs.get("stream"):
+            decoded = len(resp.content)
+            # raw.tell() : octets lus sur le réseau (avant décompression)
+            self.transfer["wire"] += resp.raw.tell() or decoded
+            self.transfer["decoded"] += decoded
+        return resp
+
     def get(self, path: str, *, absolute: bool = False, **kwargs) -> requests.Response:
         url = path if absolute else self._full_url(path)
-        return requests.get(url, headers=self._headers(), timeout=DEFAULT_TIMEOUT, **kwargs)
+        return self._request("GET", url, headers=self._headers(), **kwargs)
 
     def post(self, path: str, json: Any = None, *, absolute: bool = False, **kwargs) -> requests.Response:
         url = path if absolute else self._full_url(path)
-        return requests.post(url, headers=self._headers(), json=json, timeout=DEFAULT_TIMEOUT, **kwargs)
+        return self._request("POST", url, headers=self._headers(), json=json, **kwargs)
 
     def put(self, path: str, json: Any = None, *, absolute: bool = False, **kwargs) -> requests.Response:
         url = path if absolute else self._full_url(path)
-        return requests.put(url, headers=self._headers(), json=json, timeout=DEFAULT_TIMEOUT, **kwargs)
+        return self._request("PUT", url, headers=self._headers(), json=json, **kwargs)
 
     def patch(self, path: str, json: Any = None, *, absolute: bool = False, **kwargs) -> requests.Response:
         url = path if absolute else self._full_url(path)
-        return requests.patch(url, headers=self._headers(), json=json, timeout=DEFAULT_TIMEOUT, **kwargs)
+        return self._request("PATCH", url, headers=self._headers(), json=json, **kwargs)
 
     def delete(self, path: str, *, absolute: bool = False, **kwargs) -> requests.Response:
         url = path if absolute else self._full_url(path)
-        return requests.delete(url, headers=self._headers(), timeout=DEFAULT_TIMEOUT, **kwargs)
+        return self._request("DELETE", url, headers=self._headers(), **kwargs)
+
+    def transfer_summary(self) -> str:
+        """Résumé lisible des volumes reçus (réseau vs décompressé)."""
+        wire, decoded = self.transfer["wire"], self.transfer["decoded"]
+        saved = f" (-{100 * (1 - wire / decoded):.0f} %)" if decoded and wire < decoded else ""
+        return f"{wire / 1024:.1f} Ko reçus pour {decoded / 1024:.1f} Ko de données{saved}"
 
     # -----------------------
     # Utils réponses
@@ -0,0 +1,93 @@
+"""
+Contexte d’autorisation partagé par les permissions DRF des applications CRM.
+
+Le rôle et l’identifiant de l’utilisateur sont résolus une seule fois par
+requête (`access_context`) puis réutilisés par `has_permission` et par chaque
+appel à `has_object_permission`. Les règles objet ne comparent que des clés
+étrangères déjà chargées (`sales_contact_id`, `support_contact_id`) : aucune
+requête SQL n’est émise par les contrôles d’accès tant que les vues chargent
+la relation `client` (`select_related`) pour les contrats et événements.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from rest_framework.permissions import SAFE_METHODS, BasePermission
+
+
+@dataclass(frozen=True)
+class AccessContext:
+    """Périmètre de l’utilisateur courant : identifiant et rôle (None si anonyme)."""
+    user_id: Optional[int]
+    role: Optional[str]
+
+    @property
+    def is_authenticated(self) -> bool:
+        return self.user_id is not None
+
+    @property
+    def is_gestion(self) -> bool:
+        return self.role == "GESTION"
+
+    @property
+    def is_commercial(self) -> bool:
+        return self.role == "COMMERCIAL"
+
+    @property
+    def is_support(self) -> bool:
+        return self.role == "SUPPORT"
+
+    def is_self(self, user_id: Optional[int]) -> bool:
+        """Vrai si `user_id` (clé étrangère) désigne l’utilisateur courant."""
+        return self.user_id is not None and user_id == self.user_id
+
+
+def access_context(request) -> AccessContext:
+    """Retourne le contexte de la requête, calculé au premier appel puis mis en cache sur celle-ci."""
+    user = getattr(request, "user", None)
+    cached = getattr(request, "_access_context", None)
+    if cached is not None and cached[0] is user:
+        return cached[1]
+
+    if user is not None and user.is_authenticated:
+        context = AccessContext(user_id=user.pk, role=getattr(user, "role", None))
+    else:
+        context = AccessContext(user_id=None, role=None)
+    request._access_context = (user, context)
+    return context
+
+
+def client_owner_id(obj) -> Optional[int]:
+    """
+    ID du commercial du client concerné par `obj` (Client, Contract ou Event).
+
+    Pour un contrat / événement, la relation `client` doit avoir été chargée par
+    la vue (`select_related("client")`) pour que la lecture reste sans requête.
+    """
+    if hasattr(obj, "client_id"):
+        return obj.client.sales_contact_id
+    return obj.sales_contact_id
+
+
+class RolePermission(BasePermission):
+    """
+    Base des permissions par rôle : refuse les anonymes puis délègue à
+    `has_role_permission(ctx, method)` / `has_role_object_permission(ctx, method, obj)`.
+    """
+
+    def has_permission(self, request, view):
+        ctx = access_context(request)
+        if not ctx.is_authenticated:
+            return False
+        return self.has_role_permission(ctx, request.method)
+
+    def has_object_permission(self, request, view, obj):
+        return self.has_role_object_permission(access_context(request), request.method, obj)
+
+    def has_role_permission(self, ctx: AccessContext, method: str) -> bool:
+        return method in SAFE_METHODS
+
+    def has_role_object_permission(self, ctx: AccessContext, method: str, obj) -> bool:
+        return True
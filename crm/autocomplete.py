@@ -0,0 +1,103 @@
+"""
+Autocomplétion par préfixe (saisie au fil de l’eau dans la CLI).
+
+    GET /api/autocomplete/clients/?q=dup&limit=10[&mine=true]
+        Clients dont le nom complet OU l’entreprise commence par `q`.
+    GET /api/autocomplete/users/?q=comm&limit=10[&role=COMMERCIAL]
+        Collaborateurs actifs dont le nom d’utilisateur commence par `q`.
+
+Chaque recherche est une lecture d’intervalle, déjà triée, sur l’index d’une
+colonne normalisée (`search_name`, `search_company`, `search_username`, voir
+`crm.textsearch`), bornée à `limit` lignes : le coût ne dépend pas du volume
+de la table. `q` est normalisé comme les colonnes (casse, accents, ponctuation
+ignorés) et doit compter au moins `AUTOCOMPLETE_MIN_CHARS` caractères, sans
+quoi la réponse est vide.
+
+Périmètre : celui des listes correspondantes.
+    - clients : tous les rôles lisent tous les clients ; `?mine=true` limite
+      aux clients suivis par l’utilisateur connecté ;
+    - utilisateurs : GESTION voit tous les collaborateurs, les autres rôles
+      uniquement eux-mêmes.
+
+Réponse : {"results": [...]} (non paginée), triée par clé normalisée puis ID.
+"""
+
+from django.conf import settings
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from crm.authorization import access_context
+from crm.clients.models import Client
+from crm.textsearch import normalize, prefix_filter, prefix_key
+from crm.users.models import User
+
+# {clé normalisée: nom renvoyé dans `match`}
+CLIENT_KEYS = {"search_name": "full_name", "search_company": "company_name"}
+CLIENT_COLUMNS = ("id", "full_name", "company_name", "email", "sales_contact_id")
+USER_COLUMNS = ("id", "username", "first_name", "last_name", "role")
+
+
+def _limit(request) -> int:
+    """`?limit=` borné à [1, AUTOCOMPLETE_MAX_RESULTS] (valeur par défaut si absent ou invalide)."""
+    raw = request.query_params.get("limit")
+    try:
+        limit = int(raw) if raw else settings.AUTOCOMPLETE_DEFAULT_RESULTS
+    except ValueError:
+        limit = settings.AUTOCOMPLETE_DEFAULT_RESULTS
+    return max(1, min(limit, settings.AUTOCOMPLETE_MAX_RESULTS))
+
+
+def _prefix(request) -> str:
+    """`?q=` normalisé, ou "" s’il est trop court pour interroger l’index."""
+    prefix = normalize(request.query_params.get("q"))
+    return prefix if len(prefix) >= settings.AUTOCOMPLETE_MIN_CHARS else ""
+
+
+class ClientAutocompleteView(APIView):
+    """Clients dont le nom ou l’entreprise commence par `q` (une lecture d’index par colonne)."""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        prefix = _prefix(request)
+        if not prefix:
+            return Response({"results": []})
+        limit = _limit(request)
+
+        qs = Client.objects.all()
+        if request.query_params.get("mine", "").lower() in ("1", "true"):
+            qs = qs.filter(sales_contact_id=access_context(request).user_id)
+
+        # `limit` meilleurs candidats par colonne, fusionnés (un client peut
+        # correspondre par son nom ET son entreprise : gardé une seule fois)
+        matches = {}
+        for key, match in CLIENT_KEYS.items():
+            rows = qs.filter(prefix_filter(key, prefix)).order_by(prefix_key(key), "id").values(key, *CLIENT_COLUMNS)[:limit]
+            for row in rows:
+                sort_key = (row.pop(key), row["id"])
+                if row["id"] not in matches or sort_key < matches[row["id"]][0]:
+                    matches[row["id"]] = (sort_key, {**row, "match": match})
+
+        results = [row for _, row in sorted(matches.values(), key=lambda item: item[0])[:limit]]
+        return Response({"results": results})
+
+
+class UserAutocompleteView(APIView):
+    """Collaborateurs actifs dont le nom d’utilisateur commence par `q` (filtre `role` optionnel)."""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        prefix = _prefix(request)
+        if not prefix:
+            return Response({"results": []})
+
+        context = access_context(request)
+        qs = User.objects.filter(prefix_filter("search_username", prefix), is_active=True)
+        if not context.is_gestion:
+            qs = qs.filter(pk=context.user_id)
+        role = request.query_params.get("role")
+        if role:
+            qs = qs.filter(role=role.upper())
+
+        results = list(qs.order_by(prefix_key("search_username"), "id").values(*USER_COLUMNS)[:_limit(request)])
+        return Response({"results": results})
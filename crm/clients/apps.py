@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class ClientsConfig(AppConfig):
+    """Application clients (agrégats de contrats / événements maintenus par signaux)."""
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'crm.clients'
+
+    def ready(self):
+        # Enregistre les signaux de maintenance des agrégats de Client
+        from crm.clients import signals  # noqa: F401
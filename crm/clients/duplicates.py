@@ -0,0 +1,186 @@
+"""
+Détection des clients probablement en double.
+
+Un même client est souvent saisi deux fois : e-mail à la casse près, téléphone
+dans un autre format, entreprise ou nom légèrement différents. Les clés de
+rapprochement sont stockées et indexées sur `Client` (`Client.set_search_keys()`,
+voir `crm.textsearch`), et les comparaisons se limitent à des blocs :
+
+    motif      bloc (égalité)   comparaison
+    ---------  ---------------  ------------------------------------------------
+    email      email_key        —  (même adresse, casse ignorée)
+    phone      phone_key        —  (même numéro, format ignoré)
+    company    company_key      similarité des noms (`search_name`)
+    name       name_key         similarité des entreprises (`search_company`)
+
+Dans un bloc, les clients sont triés sur la colonne comparée et chacun n’est
+comparé qu’à ses `DEDUP_WINDOW` prédécesseurs (voisinage trié) : le coût est en
+O(n · fenêtre) au lieu de O(n²), y compris pour les blocs très peuplés, et seuls
+les blocs d’au moins deux clients sont lus. La similarité est le ratio de
+`difflib.SequenceMatcher` (0 à 1), retenue à partir de `DEDUP_SIMILARITY`.
+
+- `find_duplicates()` : rapport complet (commande `find_duplicate_clients`) ;
+- `find_matches()` : clients proches d’une fiche à créer, en quelques requêtes
+  indexées ;
+- `check_duplicates()` : lève une `ValidationError` DRF listant ces clients
+  (`ClientViewSet.perform_create`, sauf `?allow_duplicate=true`).
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import Iterator, Optional
+
+from django.conf import settings
+from django.db.models import Count, Q
+from rest_framework.exceptions import ValidationError
+
+from crm.clients.models import Client
+
+# (motif, clé de bloc) : égalité stricte
+EXACT_RULES = (("email", "email_key"), ("phone", "phone_key"))
+# (motif, clé de bloc, colonne comparée) : similarité dans le bloc
+FUZZY_RULES = (("company", "company_key", "search_name"), ("name", "name_key", "search_company"))
+
+REASON_LABELS = {
+    "email": "même e-mail",
+    "phone": "même téléphone",
+    "company": "même entreprise, nom proche",
+    "name": "même nom, entreprise proche",
+}
+
+MATCH_COLUMNS = ("id", "full_name", "company_name", "email", "phone", "sales_contact_id")
+
+
+def similarity(a: str, b: str) -> float:
+    """Ratio de ressemblance de deux clés normalisées (0 si l’une est vide)."""
+    return SequenceMatcher(None, a, b).ratio() if a and b else 0.0
+
+
+@dataclass
+class DuplicatePair:
+    """Deux clients probablement identiques (`first_id` < `second_id`)."""
+    first_id: int
+    second_id: int
+    reasons: set[str] = field(default_factory=set)
+    score: float = 0.0
+
+    def add(self, reason: str, score: float) -> None:
+        self.reasons.add(reason)
+        self.score = max(self.score, score)
+
+
+def _shared_blocks(key: str):
+    """Valeurs non vides de `key` portées par au moins deux clients (sous-requête)."""
+    return (
+        Client.objects.exclude(**{key: ""}).order_by()
+        .values(key).annotate(n=Count("id")).filter(n__gt=1).values(key)
+    )
+
+
+def _neighbours(key: str, column: Optional[str], window: int,
+                threshold: float) -> Iterator[tuple[int, int, float]]:
+    """
+    Paires (id, id, score) entre voisins d’un même bloc `key`, triés sur `column`
+    (sans `column` : égalité stricte, score 1).
+    """
+    compared = [column] if column else []
+    rows = (
+        Client.objects.filter(**{f"{key}__in": _shared_blocks(key)})
+        .order_by(key, *compared, "id")
+        .values_list(key, "id", *compared)
+        .iterator(chunk_size=2000)
+    )
+    previous: deque = deque(maxlen=window)
+    current = None
+    for block, pk, *value in rows:
+        if block != current:
+            previous.clear()
+            current = block
+        for other_pk, other_value in previous:
+            score = similarity(value[0], other_value[0]) if column else 1.0
+            if score >= threshold:
+                yield other_pk, pk, score
+        previous.append((pk, value))
+
+
+def find_duplicates(window: Optional[int] = None, threshold: Optional[float] = None) -> list[DuplicatePair]:
+    """Toutes les paires de clients probablement en double, par score décroissant."""
+    window = window or settings.DEDUP_WINDOW
+    threshold = settings.DEDUP_SIMILARITY if threshold is None else threshold
+
+    pairs: dict[tuple[int, int], DuplicatePair] = {}
+    rules = [(reason, key, None) for reason, key in EXACT_RULES] + list(FUZZY_RULES)
+    for reason, key, column in rules:
+        for first_id, second_id, score in _neighbours(key, column, window, threshold):
+            a, b = min(first_id, second_id), max(first_id, second_id)
+            pairs.setdefault((a, b), DuplicatePair(a, b)).add(reason, score)
+    return sorted(pairs.values(), key=lambda p: (-p.score, p.first_id, p.second_id))
+
+
+def find_matches(data: dict, exclude_pk: Optional[int] = None, window: Optional[int] = None,
+                 threshold: Optional[float] = None) -> list[dict]:
+    """
+    Clients existants proches de `data` (full_name, email, phone, company_name) :
+    une requête pour les clés exactes, deux par bloc (voisins avant / après la
+    fiche dans l’index du bloc), une pour les fiches retenues. Chaque résultat
+    porte `reasons` et `score`, par score décroissant.
+    """
+    window = window or settings.DEDUP_WINDOW
+    threshold = settings.DEDUP_SIMILARITY if threshold is None else threshold
+
+    probe = Client(**{name: data.get(name) or "" for name in ("full_name", "email", "phone", "company_name")})
+    probe.set_search_keys()
+    qs = Client.objects.exclude(pk=exclude_pk) if exclude_pk else Client.objects.all()
+    reasons: dict[int, set[str]] = defaultdict(set)
+    scores: dict[int, float] = defaultdict(float)
+
+    def note(pk: int, reason: str, score: float) -> None:
+        reasons[pk].add(reason)
+        scores[pk] = max(scores[pk], score)
+
+    exact = Q()
+    for _, key in EXACT_RULES:
+        if getattr(probe, key):
+            exact |= Q(**{key: getattr(probe, key)})
+    if exact:
+        for row in qs.filter(exact).values("id", *(key for _, key in EXACT_RULES))[:window]:
+            for reason, key in EXACT_RULES:
+                if row[key] and row[key] == getattr(probe, key):
+                    note(row["id"], reason, 1.0)
+
+    for reason, key, column in FUZZY_RULES:
+        block, value = getattr(probe, key), getattr(probe, column)
+        if not block:
+            continue
+        in_block = qs.filter(**{key: block})
+        after = in_block.filter(**{f"{column}__gte": value}).order_by(column, "id")
+        before = in_block.filter(**{f"{column}__lt": value}).order_by(f"-{column}", "-id")
+        for candidates in (after, before):
+            for pk, other in candidates.values_list("id", column)[:window]:
+                score = similarity(value, other)
+                if score >= threshold:
+                    note(pk, reason, score)
+
+    if not reasons:
+        return []
+    rows = Client.objects.filter(pk__in=list(reasons)).values(*MATCH_COLUMNS)
+    matches = [{**row, "reasons": sorted(reasons[row["id"]]), "score": round(scores[row["id"]], 2)} for row in rows]
+    return sorted(matches, key=lambda m: (-m["score"], m["id"]))
+
+
+def check_duplicates(data: dict, exclude_pk: Optional[int] = None) -> None:
+    """
+    Vérifie qu’aucun client existant ne ressemble à `data` et lève sinon une
+    `ValidationError` (HTTP 400) décrivant les fiches proches.
+    """
+    matches = find_matches(data, exclude_pk=exclude_pk)
+    if not matches:
+        return
+    raise ValidationError({"duplicates": [
+        f"Doublon probable du client #{m['id']} ({m['full_name']} — {m['company_name']}) : "
+        f"{', '.join(REASON_LABELS[r] for r in m['reasons'])}."
+        for m in matches
+    ]})
@@ -0,0 +1,41 @@
+"""
+Liste de relance des clients (« à appeler »).
+
+Clients dont le dernier contact remonte à au moins `days` jours, du plus
+ancien au plus récent, avec le montant restant dû de leurs contrats (agrégat
+`contracts_amount_due`, sans jointure). Pour un commercial, la requête est un
+parcours d’intervalle de l’index `(sales_contact, last_contact, id)` : elle
+s’arrête après une page, quelle que soit la taille du portefeuille, et la page
+suivante reprend après la dernière ligne lue (`crm.pagination.FollowUpPagination`).
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Optional
+
+from django.utils import timezone
+
+from crm.clients.models import Client
+
+# Ancienneté maximale acceptée pour `days` (100 ans ; au-delà, la date de coupure déborde)
+MAX_FOLLOW_UP_DAYS = 36500
+
+FOLLOW_UP_COLUMNS = ("id", "full_name", "company_name", "email", "phone", "last_contact",
+                     "contracts_amount_due", "next_event_start", "sales_contact_id")
+
+
+def followup_queryset(days: int, sales_contact_id: Optional[int] = None):
+    """Clients non contactés depuis `days` jours (tous, ou ceux de `sales_contact_id`), triés par ancienneté."""
+    qs = Client.objects.filter(last_contact__lte=timezone.localdate() - timedelta(days=days))
+    if sales_contact_id is not None:
+        qs = qs.filter(sales_contact_id=sales_contact_id)
+    return qs.order_by("last_contact", "id").values(*FOLLOW_UP_COLUMNS)
+
+
+def with_staleness(rows: list[dict], today: Optional[date] = None) -> list[dict]:
+    """Ajoute `days_since_contact` (jours écoulés depuis `last_contact`) à chaque ligne."""
+    today = today or timezone.localdate()
+    for row in rows:
+        row["days_since_contact"] = (today - row["last_contact"]).days
+    return rows
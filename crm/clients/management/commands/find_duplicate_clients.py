@@ -0,0 +1,54 @@
+"""
+Rapport des clients probablement en double.
+
+Usage :
+    python manage.py find_duplicate_clients                      # 50 premières paires
+    python manage.py find_duplicate_clients --limit 0 --csv doublons.csv
+    python manage.py find_duplicate_clients --window 20 --threshold 0.9
+
+Rapprochement par blocs indexés (e-mail, téléphone, entreprise, nom) et
+voisinage trié dans chaque bloc : voir `crm.clients.duplicates`. La commande
+ne modifie rien ; la fusion des fiches reste une décision humaine.
+"""
+
+import csv
+
+from django.core.management.base import BaseCommand
+
+from crm.clients.duplicates import REASON_LABELS, find_duplicates
+from crm.clients.models import Client
+
+
+class Command(BaseCommand):
+    help = "Liste les paires de clients probablement en double (e-mail, téléphone, nom / entreprise proches)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--window", type=int, help="Voisins comparés dans chaque bloc (DEDUP_WINDOW).")
+        parser.add_argument("--threshold", type=float, help="Similarité minimale, de 0 à 1 (DEDUP_SIMILARITY).")
+        parser.add_argument("--limit", type=int, default=50, help="Paires affichées (0 : toutes).")
+        parser.add_argument("--csv", help="Écrit toutes les paires dans ce fichier CSV.")
+
+    def handle(self, *args, **options):
+        pairs = find_duplicates(window=options.get("window"), threshold=options.get("threshold"))
+
+        if options.get("csv"):
+            with open(options["csv"], "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["client_a", "client_b", "score", "motifs"])
+                for p in pairs:
+                    writer.writerow([p.first_id, p.second_id, f"{p.score:.2f}", " ".join(sorted(p.reasons))])
+
+        shown = pairs[:options["limit"]] if options["limit"] else pairs
+        names = {
+            row["id"]: row
+            for row in Client.objects.filter(
+                pk__in={pk for p in shown for pk in (p.first_id, p.second_id)}
+            ).values("id", "full_name", "company_name")
+        }
+        for p in shown:
+            a, b = names[p.first_id], names[p.second_id]
+            reasons = ", ".join(REASON_LABELS[r] for r in sorted(p.reasons))
+            self.stdout.write(f"#{a['id']} {a['full_name']} ({a['company_name']}) ↔ "
+                              f"#{b['id']} {b['full_name']} ({b['company_name']}) — {p.score:.2f} : {reasons}")
+
+        self.stdout.write(self.style.SUCCESS(f"✅ {len(pairs)} paire(s) de doublons probables."))
@@ -0,0 +1,27 @@
+"""
+Commande de réconciliation des agrégats dénormalisés de `Client`.
+
+Usage :
+    python manage.py reconcile_clients               # tous les clients
+    python manage.py reconcile_clients --client 12   # un seul client
+
+Corrige les écarts laissés par les écritures en masse (`bulk_create`,
+`QuerySet.update()`) et rafraîchit `next_event_start` (les événements passés
+cessent d’être « prochains ») : à planifier, par exemple chaque nuit.
+"""
+
+from django.core.management.base import BaseCommand
+
+from crm.clients.rollups import reconcile
+
+
+class Command(BaseCommand):
+    help = "Recalcule les agrégats des clients (contrats, montants, prochain événement) et corrige les écarts."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--client", type=int, help="ID du client à réconcilier (sinon : tous).")
+
+    def handle(self, *args, **options):
+        client_id = options.get("client")
+        fixed = reconcile([client_id] if client_id else None)
+        self.stdout.write(self.style.SUCCESS(f"✅ {fixed} client(s) corrigé(s)."))
@@ -0,0 +1,56 @@
+# Generated by Django 5.2 on 2026-10-19 11:47
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='client',
+            name='company_name',
+            field=models.CharField(help_text='Nom de l’entreprise (raison sociale).', max_length=255, verbose_name='Entreprise'),
+        ),
+        migrations.AlterField(
+            model_name='client',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, help_text='Créé automatiquement à l’insertion.', verbose_name='Date de création'),
+        ),
+        migrations.AlterField(
+            model_name='client',
+            name='email',
+            field=models.EmailField(help_text='Adresse e-mail unique du client.', max_length=254, unique=True, verbose_name='Adresse e-mail'),
+        ),
+        migrations.AlterField(
+            model_name='client',
+            name='full_name',
+            field=models.CharField(help_text='Nom et prénom de l’interlocuteur principal.', max_length=255, verbose_name='Nom complet'),
+        ),
+        migrations.AlterField(
+            model_name='client',
+            name='last_contact',
+            field=models.DateField(help_text='Date du dernier échange avec ce client.', verbose_name='Dernier contact'),
+        ),
+        migrations.AlterField(
+            model_name='client',
+            name='phone',
+            field=models.CharField(help_text='Numéro de téléphone du client (format libre).', max_length=20, verbose_name='Téléphone'),
+        ),
+        migrations.AlterField(
+            model_name='client',
+            name='sales_contact',
+            field=models.ForeignKey(blank=True, help_text='Collaborateur (rôle COMMERCIAL) responsable de ce client.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='clients', to=settings.AUTH_USER_MODEL, verbose_name='Commercial en charge'),
+        ),
+        migrations.AlterField(
+            model_name='client',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, help_text='Mise à jour automatique à chaque modification.', verbose_name='Date de mise à jour'),
+        ),
+    ]
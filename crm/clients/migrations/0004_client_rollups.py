@@ -0,0 +1,83 @@
+# Generated by Django 5.2 on 2026-10-19 12:32
+
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+
+def backfill_rollups(apps, schema_editor):
+    """Calcule les agrégats des clients existants (une requête UPDATE ensembliste)."""
+    Client = apps.get_model('clients', 'Client')
+    Contract = apps.get_model('contracts', 'Contract')
+    Event = apps.get_model('events', 'Event')
+
+    def aggregate(expression, field):
+        rows = (Contract.objects.filter(client_id=OuterRef('pk')).order_by()
+                .values('client_id').annotate(value=expression).values('value'))
+        return Coalesce(Subquery(rows, output_field=field), Value(0), output_field=field)
+
+    amount = models.DecimalField(max_digits=14, decimal_places=2)
+    Client.objects.update(
+        contracts_count=aggregate(Count('id'), models.IntegerField()),
+        signed_contracts_count=aggregate(Count('id', filter=Q(is_signed=True)), models.IntegerField()),
+        contracts_total_amount=aggregate(Sum('total_amount'), amount),
+        contracts_amount_due=aggregate(Sum('amount_due'), amount),
+        next_event_start=Subquery(
+            Event.objects.filter(client_id=OuterRef('pk'), event_start__gte=timezone.now())
+            .order_by('event_start').values('event_start')[:1]
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0003_client_help_texts'),
+        ('contracts', '0002_initial'),
+        ('events', '0005_event_client_start_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='client',
+            name='contracts_amount_due',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0'), max_digits=14, verbose_name='Montant restant dû (€)'),
+        ),
+        migrations.AddField(
+            model_name='client',
+            name='contracts_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Nombre de contrats'),
+        ),
+        migrations.AddField(
+            model_name='client',
+            name='contracts_total_amount',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0'), max_digits=14, verbose_name='Montant total des contrats (€)'),
+        ),
+        migrations.AddField(
+            model_name='client',
+            name='next_event_start',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Prochain événement'),
+        ),
+        migrations.AddField(
+            model_name='client',
+            name='signed_contracts_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Contrats signés'),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['contracts_amount_due'], name='client_amount_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['contracts_count'], name='client_contracts_count_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['next_event_start'], name='client_next_event_idx'),
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2 on 2026-10-19 12:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+from crm.textsearch import normalize
+
+
+def backfill_search_keys(apps, schema_editor):
+    """Calcule les clés de recherche des clients existants (par lots de 1000)."""
+    Client = apps.get_model('clients', 'Client')
+    batch = []
+    for client in Client.objects.only('id', 'full_name', 'company_name').iterator(chunk_size=1000):
+        client.search_name = normalize(client.full_name)
+        client.search_company = normalize(client.company_name)
+        batch.append(client)
+        if len(batch) == 1000:
+            Client.objects.bulk_update(batch, ['search_name', 'search_company'])
+            batch = []
+    if batch:
+        Client.objects.bulk_update(batch, ['search_name', 'search_company'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0004_client_rollups'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='client',
+            name='search_company',
+            field=models.CharField(default='', editable=False, max_length=255, verbose_name='Entreprise (clé de recherche)'),
+        ),
+        migrations.AddField(
+            model_name='client',
+            name='search_name',
+            field=models.CharField(default='', editable=False, max_length=255, verbose_name='Nom (clé de recherche)'),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['search_name'], name='client_search_name_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['search_company'], name='client_search_company_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.RunPython(backfill_search_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.2 on 2026-10-19 12:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+from crm.textsearch import COMPANY_STOPWORDS, email_key, phone_key, token_key
+
+KEYS = ['email_key', 'phone_key', 'name_key', 'company_key']
+
+
+def backfill_duplicate_keys(apps, schema_editor):
+    """Calcule les clés de doublon des clients existants (par lots de 1000)."""
+    Client = apps.get_model('clients', 'Client')
+    batch = []
+    for client in Client.objects.only('id', 'email', 'phone', 'full_name', 'company_name').iterator(chunk_size=1000):
+        client.email_key = email_key(client.email)
+        client.phone_key = phone_key(client.phone)
+        client.name_key = token_key(client.full_name)
+        client.company_key = token_key(client.company_name, COMPANY_STOPWORDS)
+        batch.append(client)
+        if len(batch) == 1000:
+            Client.objects.bulk_update(batch, KEYS)
+            batch = []
+    if batch:
+        Client.objects.bulk_update(batch, KEYS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0005_search_keys'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='client',
+            name='company_key',
+            field=models.CharField(default='', editable=False, max_length=255, verbose_name='Entreprise (clé de doublon)'),
+        ),
+        migrations.AddField(
+            model_name='client',
+            name='email_key',
+            field=models.CharField(default='', editable=False, max_length=254, verbose_name='E-mail (clé de doublon)'),
+        ),
+        migrations.AddField(
+            model_name='client',
+            name='name_key',
+            field=models.CharField(default='', editable=False, max_length=255, verbose_name='Nom (clé de doublon)'),
+        ),
+        migrations.AddField(
+            model_name='client',
+            name='phone_key',
+            field=models.CharField(default='', editable=False, max_length=20, verbose_name='Téléphone (clé de doublon)'),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['email_key'], name='client_email_key_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['phone_key'], name='client_phone_key_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['company_key', 'search_name'], name='client_company_block_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['name_key', 'search_company'], name='client_name_block_idx'),
+        ),
+        migrations.RunPython(backfill_duplicate_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-19 12:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0006_duplicate_keys'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['sales_contact', 'last_contact', 'id'], name='client_followup_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['last_contact', 'id'], name='client_last_contact_idx'),
+        ),
+    ]
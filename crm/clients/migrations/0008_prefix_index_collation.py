@@ -0,0 +1,32 @@
+# Generated by Django 5.2 on 2026-10-19 13:23
+
+import crm.textsearch
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0007_followup_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='client',
+            name='client_search_name_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='client',
+            name='client_search_company_idx',
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=crm.textsearch.PrefixIndex(fields=['search_name'], name='client_search_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=crm.textsearch.PrefixIndex(fields=['search_company'], name='client_search_company_idx'),
+        ),
+    ]
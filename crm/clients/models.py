@@ -4,11 +4,27 @@ Ce module définit le modèle `Client`, qui représente un prospect ou un client
 actif de l’entreprise. Il inclut des informations d’identification, des
 coordonnées, un rattachement à un commercial, ainsi que des horodatages de
 création et de mise à jour.
+
+Les agrégats de contrats et d’événements du client (nombre de contrats,
+montants, prochain événement) y sont dénormalisés pour trier et filtrer la
+liste sans jointure ; ils sont maintenus par `crm.clients.rollups`.
 """
 
+from decimal import Decimal
+
 from django.db import models
 from django.conf import settings
 
+from crm.textsearch import COMPANY_STOPWORDS, PrefixIndex, email_key, normalize, phone_key, token_key
+
+# Colonnes dérivées recalculées par `Client.set_search_keys()`
+SEARCH_KEY_FIELDS = ("search_name", "search_company", "email_key", "phone_key", "name_key", "company_key")
+# Agrégats maintenus uniquement par UPDATE … F() (`crm.clients.rollups`), jamais par `save()`
+ROLLUP_FIELDS = (
+    "contracts_count", "signed_contracts_count",
+    "contracts_total_amount", "contracts_amount_due", "next_event_start",
+)
+
 
 class Client(models.Model):
     """Représente un client (prospect ou actif) de l'entreprise.
@@ -21,6 +37,18 @@ class Client(models.Model):
         - last_contact : date du dernier échange (utile pour le suivi commercial).
         - sales_contact : utilisateur (commercial) en charge de ce client.
 
+    Clés de recherche (autocomplétion, `crm.textsearch.normalize`) :
+        - search_name / search_company : `full_name` / `company_name` normalisés,
+          recalculés à chaque `save()` (et par `set_search_keys()` avant un `bulk_create`).
+        - email_key / phone_key / name_key / company_key : clés de rapprochement
+          des doublons (`crm.clients.duplicates`), maintenues de la même façon.
+
+    Agrégats maintenus (lecture seule, `crm.clients.rollups`) :
+        - contracts_count / signed_contracts_count : contrats du client / signés.
+        - contracts_total_amount / contracts_amount_due : sommes des montants
+          totaux / restant dus de ses contrats.
+        - next_event_start : début du prochain événement à venir (NULL si aucun).
+
     Champs techniques :
         - created_at : date/heure de création (définie automatiquement).
         - updated_at : date/heure de dernière mise à jour (mise à jour auto).
@@ -63,6 +91,73 @@ class Client(models.Model):
         help_text="Collaborateur (rôle COMMERCIAL) responsable de ce client."
     )
 
+    # ——— Clés de recherche (dérivées, `set_search_keys()`) ———
+    search_name = models.CharField(
+        max_length=255,
+        editable=False,
+        default="",
+        verbose_name="Nom (clé de recherche)",
+    )
+    search_company = models.CharField(
+        max_length=255,
+        editable=False,
+        default="",
+        verbose_name="Entreprise (clé de recherche)",
+    )
+
+    # ——— Clés de doublon (dérivées, `crm.clients.duplicates`) ———
+    email_key = models.CharField(
+        max_length=254,
+        editable=False,
+        default="",
+        verbose_name="E-mail (clé de doublon)",
+    )
+    phone_key = models.CharField(
+        max_length=20,
+        editable=False,
+        default="",
+        verbose_name="Téléphone (clé de doublon)",
+    )
+    name_key = models.CharField(
+        max_length=255,
+        editable=False,
+        default="",
+        verbose_name="Nom (clé de doublon)",
+    )
+    company_key = models.CharField(
+        max_length=255,
+        editable=False,
+        default="",
+        verbose_name="Entreprise (clé de doublon)",
+    )
+
+    # ——— Agrégats de contrats / événements (`crm.clients.rollups`) ———
+    contracts_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Nombre de contrats",
+    )
+    signed_contracts_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Contrats signés",
+    )
+    contracts_total_amount = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal("0"),
+        verbose_name="Montant total des contrats (€)",
+    )
+    contracts_amount_due = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal("0"),
+        verbose_name="Montant restant dû (€)",
+    )
+    next_event_start = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="Prochain événement",
+    )
+
     # ——— Horodatage ———
     created_at = models.DateTimeField(
         auto_now_add=True,
@@ -80,6 +175,50 @@ class Client(models.Model):
         verbose_name = "Client"
         verbose_name_plural = "Clients"
         ordering = ["-created_at"]
+        indexes = [
+            # Tri / filtres de la liste clients sur les agrégats
+            models.Index(fields=["contracts_amount_due"], name="client_amount_due_idx"),
+            models.Index(fields=["contracts_count"], name="client_contracts_count_idx"),
+            models.Index(fields=["next_event_start"], name="client_next_event_idx"),
+            # Liste de relance (`crm.clients.followup`) : par commercial, puis tous portefeuilles
+            models.Index(fields=["sales_contact", "last_contact", "id"], name="client_followup_idx"),
+            models.Index(fields=["last_contact", "id"], name="client_last_contact_idx"),
+            # Autocomplétion par préfixe : filtre et tri (collation "C" sous PostgreSQL)
+            PrefixIndex(fields=["search_name"], name="client_search_name_idx"),
+            PrefixIndex(fields=["search_company"], name="client_search_company_idx"),
+            # Doublons : égalité stricte, puis voisins triés dans un même bloc
+            models.Index(fields=["email_key"], name="client_email_key_idx"),
+            models.Index(fields=["phone_key"], name="client_phone_key_idx"),
+            models.Index(fields=["company_key", "search_name"], name="client_company_block_idx"),
+            models.Index(fields=["name_key", "search_company"], name="client_name_block_idx"),
+        ]
+
+    def set_search_keys(self) -> None:
+        """Recalcule les clés de recherche et de doublon depuis les champs saisis."""
+        self.search_name = normalize(self.full_name)
+        self.search_company = normalize(self.company_name)
+        self.email_key = email_key(self.email)
+        self.phone_key = phone_key(self.phone)
+        self.name_key = token_key(self.full_name)
+        self.company_key = token_key(self.company_name, COMPANY_STOPWORDS)
+
+    def save(self, *args, **kwargs):
+        """
+        Recalcule les clés dérivées. Sur une ligne existante, les agrégats ne sont
+        jamais réécrits : l’instance a pu être chargée avant une écriture de contrat
+        ou d’événement, ses valeurs seraient périmées.
+        """
+        self.set_search_keys()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, *SEARCH_KEY_FIELDS}
+        elif not self._state.adding and not kwargs.get("force_insert") and not args:
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key and f.name not in ROLLUP_FIELDS and f.attname not in deferred
+            ]
+        super().save(*args, **kwargs)
 
     def __str__(self) -> str:
         """Retourne une représentation lisible du client (nom + entreprise)."""
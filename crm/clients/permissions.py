@@ -12,60 +12,45 @@ l'utilisateur :
         * Lecture seule (SAFE_METHODS)
 """
 
-from rest_framework.permissions import BasePermission, SAFE_METHODS
+from rest_framework.permissions import SAFE_METHODS
 
+from crm.authorization import AccessContext, RolePermission
 
-class ClientPermission(BasePermission):
+
+class ClientPermission(RolePermission):
     """Implémente les règles d'accès au modèle Client selon le rôle utilisateur."""
 
-    def has_permission(self, request, view):
+    def has_role_permission(self, ctx: AccessContext, method: str) -> bool:
         """Vérifie les permissions globales selon la méthode HTTP et le rôle."""
-        user = request.user
-
-        # Refuser si utilisateur non authentifié
-        if not user or not user.is_authenticated:
-            return False
-
         # Rôle GESTION → accès complet
-        if user.role == "GESTION":
+        if ctx.is_gestion:
             return True
 
-        # Rôle COMMERCIAL
-        if user.role == "COMMERCIAL":
-            # Lecture autorisée
-            if request.method in SAFE_METHODS:
-                return True
-            # Création autorisée
-            if request.method == "POST":
-                return True
-            # PUT/PATCH seront filtrés au niveau objet
-            if request.method in ("PUT", "PATCH"):
-                return True
-            # Suppression interdite
-            return False
+        # Rôle COMMERCIAL : lecture, création et PUT/PATCH (filtrés au niveau objet) ;
+        # suppression interdite
+        if ctx.is_commercial:
+            return method in SAFE_METHODS or method in ("POST", "PUT", "PATCH")
 
         # Rôle SUPPORT → lecture seule
-        if user.role == "SUPPORT":
-            return request.method in SAFE_METHODS
+        if ctx.is_support:
+            return method in SAFE_METHODS
 
         # Par défaut → refuser
         return False
 
-    def has_object_permission(self, request, view, obj):
+    def has_role_object_permission(self, ctx: AccessContext, method: str, obj) -> bool:
         """Vérifie les permissions au niveau d'un objet Client précis."""
-        user = request.user
-
         # GESTION → accès complet
-        if user.role == "GESTION":
+        if ctx.is_gestion:
             return True
 
         # Lecture seule pour tous les rôles
-        if request.method in SAFE_METHODS:
+        if method in SAFE_METHODS:
             return True
 
         # COMMERCIAL → modification uniquement si c’est son client
-        if user.role == "COMMERCIAL":
-            return getattr(obj, "sales_contact_id", None) == user.id
+        if ctx.is_commercial:
+            return ctx.is_self(obj.sales_contact_id)
 
         # SUPPORT → jamais de modification
-        return False
\ No newline at end of file
+        return False
@@ -0,0 +1,117 @@
+"""
+Maintenance des agrégats dénormalisés de `Client`.
+
+- `apply_contract_delta` : incréments sur la ligne d’un client (F() expressions,
+  une seule requête UPDATE, sans lecture préalable) ;
+- `refresh_next_event` : recalcule `next_event_start` des clients donnés
+  (UPDATE avec sous-requête sur l’index `event_client_start_idx`) ;
+- `reconcile` : recalcule tous les agrégats depuis les tables sources et ne
+  réécrit que les clients en écart (commande `reconcile_clients`).
+
+Les signaux de `crm.clients.signals` appellent les deux premières fonctions à
+chaque écriture de `Contract` / `Event`. `next_event_start` vieillit avec le
+temps (un événement passé reste « prochain » jusqu’à la prochaine écriture) :
+`reconcile_clients` le rafraîchit, à planifier (ex. chaque nuit).
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Iterable, Optional
+
+from django.db.models import Count, DecimalField, F, IntegerField, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from crm.clients.models import ROLLUP_FIELDS, Client
+from crm.contracts.models import Contract
+from crm.events.models import Event
+
+# Clients réécrits par requête UPDATE lors d'une réconciliation
+RECONCILE_BATCH_SIZE = 1000
+
+
+def apply_contract_delta(client_id: Optional[int], **deltas) -> None:
+    """Incrémente les agrégats de contrats du client `client_id` (ex. contracts_count=1)."""
+    deltas = {k: v for k, v in deltas.items() if v}
+    if client_id is None or not deltas:
+        return
+    Client.objects.filter(pk=client_id).update(**{field: F(field) + value for field, value in deltas.items()})
+
+
+def _next_event_start():
+    return Subquery(
+        Event.objects.filter(client_id=OuterRef("pk"), event_start__gte=timezone.now())
+        .order_by("event_start")
+        .values("event_start")[:1]
+    )
+
+
+def refresh_next_event(client_ids: Iterable[Optional[int]]) -> None:
+    """Recalcule `next_event_start` des clients `client_ids` en une requête."""
+    ids = {pk for pk in client_ids if pk is not None}
+    if ids:
+        Client.objects.filter(pk__in=ids).update(next_event_start=_next_event_start())
+
+
+def _contract_aggregate(expression, output_field):
+    rows = (
+        Contract.objects.filter(client_id=OuterRef("pk"))
+        .order_by()
+        .values("client_id")
+        .annotate(value=expression)
+        .values("value")
+    )
+    return Coalesce(Subquery(rows, output_field=output_field), Value(0), output_field=output_field)
+
+
+def computed_rollups() -> dict:
+    """Expressions calculant chaque agrégat depuis les tables sources (annotations / UPDATE)."""
+    amount = DecimalField(max_digits=14, decimal_places=2)
+    return {
+        "contracts_count": _contract_aggregate(Count("id"), IntegerField()),
+        "signed_contracts_count": _contract_aggregate(Count("id", filter=Q(is_signed=True)), IntegerField()),
+        "contracts_total_amount": _contract_aggregate(Sum("total_amount"), amount),
+        "contracts_amount_due": _contract_aggregate(Sum("amount_due"), amount),
+        "next_event_start": _next_event_start(),
+    }
+
+
+def reconcile(client_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    Compare les agrégats stockés aux valeurs recalculées et corrige les clients
+    en écart (une requête de détection, puis un UPDATE par lot de
+    `RECONCILE_BATCH_SIZE` clients). Retourne leur nombre.
+    """
+    qs = Client.objects.all() if client_ids is None else Client.objects.filter(pk__in=list(client_ids))
+    computed = qs.annotate(**{f"computed_{name}": expr for name, expr in computed_rollups().items()})
+
+    # Écart explicite : `NOT (a = b)` vaut NULL en SQL dès qu'un côté est NULL
+    drift = Q()
+    for name in ROLLUP_FIELDS:
+        if name == "next_event_start":
+            stored, fresh = "next_event_start__isnull", "computed_next_event_start__isnull"
+            drift |= Q(**{stored: True, fresh: False}) | Q(**{stored: False, fresh: True})
+            drift |= Q(**{stored: False, fresh: False}) & ~Q(next_event_start=F("computed_next_event_start"))
+        else:
+            drift |= ~Q(**{name: F(f"computed_{name}")})
+    drifted = list(computed.filter(drift).values_list("pk", flat=True))
+
+    for start in range(0, len(drifted), RECONCILE_BATCH_SIZE):
+        Client.objects.filter(pk__in=drifted[start:start + RECONCILE_BATCH_SIZE]).update(**computed_rollups())
+    return len(drifted)
+
+
+def contract_contribution(state, sign: int) -> dict:
+    """Contribution d'un contrat (`state` = client, signé, montant total, montant dû) aux agrégats."""
+    _, is_signed, total_amount, amount_due = state
+    return {
+        "contracts_count": sign,
+        "signed_contracts_count": sign if is_signed else 0,
+        "contracts_total_amount": total_amount * sign,
+        "contracts_amount_due": amount_due * sign,
+    }
+
+
+def as_decimal(value) -> Decimal:
+    return Decimal(str(value)) if value is not None else Decimal("0")
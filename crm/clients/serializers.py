@@ -13,9 +13,10 @@ Bonnes pratiques :
 from rest_framework import serializers
 
 from crm.clients.models import Client
+from crm.fieldsets import SparseFieldsMixin
 
 
-class ClientSerializer(serializers.ModelSerializer):
+class ClientSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Sérialiseur principal pour le modèle `Client`.
 
     Cette classe :
@@ -28,6 +29,10 @@ class ClientSerializer(serializers.ModelSerializer):
     Champs calculés/annotés :
         sales_contact_username (CharField, read-only) :
             Dérivé de la relation `sales_contact.username`. Non modifiable via l’API.
+
+    Agrégats (read-only, maintenus par `crm.clients.rollups`) :
+        contracts_count, signed_contracts_count, contracts_total_amount,
+        contracts_amount_due, next_event_start.
     """
 
     # Champ dérivé : nom d'utilisateur du commercial associé (lecture seule)
@@ -49,6 +54,12 @@ class ClientSerializer(serializers.ModelSerializer):
             "last_contact",
             "sales_contact",
             "sales_contact_username",  # façade pratique pour le front/CLI
+            # Agrégats dénormalisés (contrats / événements du client)
+            "contracts_count",
+            "signed_contracts_count",
+            "contracts_total_amount",
+            "contracts_amount_due",
+            "next_event_start",
             "created_at",
             "updated_at",
         ]
@@ -58,6 +69,11 @@ class ClientSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
             "sales_contact_username",
+            "contracts_count",
+            "signed_contracts_count",
+            "contracts_total_amount",
+            "contracts_amount_due",
+            "next_event_start",
         ]
         # (Optionnel) messages d’aide côté OpenAPI/Swagger si nécessaire
         extra_kwargs = {
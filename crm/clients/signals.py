@@ -0,0 +1,112 @@
+"""
+Signaux maintenant les agrégats dénormalisés de `Client` (`crm.clients.rollups`).
+
+Principe (comme `crm.pipeline.signals`) :
+  - `post_init` mémorise la contribution d’un contrat tel que chargé (client,
+    signé, montants), sans requête supplémentaire ;
+  - `post_save` / `post_delete` d’un contrat retirent l’ancienne contribution et
+    ajoutent la nouvelle par F() expressions ; contrat chargé avec des champs
+    différés : recalcul de l’ancien client (relu en `pre_save`) et du nouveau ;
+  - toute écriture d’un événement recalcule `next_event_start` de son client,
+    et de son client précédent s’il a changé : `post_init` mémorise le client
+    chargé (relu en `pre_save` si `client_id` était différé).
+
+Les écritures en masse (`bulk_create`, `QuerySet.update()`) n’émettent pas de
+signaux : utiliser ensuite `python manage.py reconcile_clients`.
+"""
+
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from django.dispatch import receiver
+
+from crm.clients.rollups import apply_contract_delta, as_decimal, contract_contribution, reconcile, \
+    refresh_next_event
+from crm.contracts.models import Contract
+from crm.events.models import Event
+
+_STATE_ATTR = "_client_rollup_state"
+_EVENT_CLIENT_ATTR = "_client_rollup_client_id"
+_PREVIOUS_CLIENT_ATTR = "_client_rollup_previous_client_id"
+
+# Contrat chargé avec des champs différés (`only()` / `defer()`) : contribution inconnue
+UNKNOWN = object()
+
+
+def _contract_state(instance: Contract):
+    values = instance.__dict__
+    if not all(f in values for f in ("client_id", "is_signed", "total_amount", "amount_due")):
+        return UNKNOWN
+    return (
+        values["client_id"],
+        bool(values["is_signed"]),
+        as_decimal(values["total_amount"]),
+        as_decimal(values["amount_due"]),
+    )
+
+
+@receiver(post_init, sender=Contract)
+def _contract_post_init(sender, instance, **kwargs):
+    setattr(instance, _STATE_ATTR, _contract_state(instance) if instance.pk else None)
+
+
+@receiver(pre_save, sender=Contract)
+def _contract_pre_save(sender, instance, **kwargs):
+    if getattr(instance, _STATE_ATTR, None) is UNKNOWN:
+        # Contribution inconnue : seul le client enregistré est utile au repli
+        stored = Contract.objects.filter(pk=instance.pk).values_list("client_id", flat=True).first()
+        setattr(instance, _PREVIOUS_CLIENT_ATTR, stored)
+
+
+@receiver(post_save, sender=Contract)
+def _contract_post_save(sender, instance, created, **kwargs):
+    old_state = None if created else getattr(instance, _STATE_ATTR, None)
+    new_state = _contract_state(instance)
+
+    if old_state is UNKNOWN or new_state is UNKNOWN:
+        # Repli : recalcul ciblé de l’ancien et du nouveau client du contrat
+        if isinstance(old_state, tuple):
+            previous = old_state[0]
+        else:
+            previous = getattr(instance, _PREVIOUS_CLIENT_ATTR, None)
+        reconcile({pk for pk in (previous, instance.client_id) if pk is not None})
+    elif old_state is None:
+        apply_contract_delta(new_state[0], **contract_contribution(new_state, +1))
+    elif old_state != new_state:
+        removed = contract_contribution(old_state, -1)
+        added = contract_contribution(new_state, +1)
+        if old_state[0] == new_state[0]:
+            apply_contract_delta(new_state[0], **{k: removed[k] + added[k] for k in added})
+        else:
+            apply_contract_delta(old_state[0], **removed)
+            apply_contract_delta(new_state[0], **added)
+
+    setattr(instance, _STATE_ATTR, new_state)
+
+
+@receiver(post_delete, sender=Contract)
+def _contract_post_delete(sender, instance, **kwargs):
+    state = _contract_state(instance)
+    if state is UNKNOWN:
+        reconcile([instance.client_id])
+        return
+    apply_contract_delta(state[0], **contract_contribution(state, -1))
+
+
+@receiver(post_init, sender=Event)
+def _event_post_init(sender, instance, **kwargs):
+    loaded = instance.__dict__.get("client_id", UNKNOWN) if instance.pk else None
+    setattr(instance, _EVENT_CLIENT_ATTR, loaded)
+
+
+@receiver(pre_save, sender=Event)
+def _event_pre_save(sender, instance, **kwargs):
+    if getattr(instance, _EVENT_CLIENT_ATTR, None) is UNKNOWN:
+        stored = Event.objects.filter(pk=instance.pk).values_list("client_id", flat=True).first()
+        setattr(instance, _EVENT_CLIENT_ATTR, stored)
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def _event_changed(sender, instance, **kwargs):
+    previous = getattr(instance, _EVENT_CLIENT_ATTR, None)
+    refresh_next_event([instance.client_id, previous if previous is not UNKNOWN else None])
+    setattr(instance, _EVENT_CLIENT_ATTR, instance.client_id)
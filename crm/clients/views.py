@@ -14,17 +14,47 @@ Règles métier :
 
 Les permissions sont gérées par `ClientPermission` et certaines sécurités
 supplémentaires sont appliquées directement dans `perform_create` et `perform_update`.
+
+Création : refusée (HTTP 400, clé `duplicates`) si un client existant semble
+identique (e-mail ou téléphone normalisés, nom / entreprise proches, voir
+`crm.clients.duplicates`) ; `?allow_duplicate=true` confirme la création.
+
+Liste de relance : `GET /api/clients/to-call/?days=30` — clients non contactés
+depuis `days` jours, du plus ancien au plus récent, avec leur montant dû
+(COMMERCIAL : son portefeuille ; GESTION : tous, ou `?sales_contact=<id>`).
+Pages reprises après la dernière ligne (`next`, `?after=`), voir `crm.clients.followup`.
+
+Suppression : par lots, sans charger contrats et événements en mémoire (`crm.deletion`).
+
+Lecture : `?fields=` / `?omit=` / `?compact=true` (voir `crm.fieldsets`).
+
+Tri et filtres sur les agrégats dénormalisés (colonnes indexées, sans jointure) :
+    - `?ordering=-contracts_amount_due` (aussi `contracts_count`, `next_event_start`, …) ;
+    - `?contracts_amount_due__gt=0`, `?contracts_count__gte=2`,
+      `?next_event_start__lte=2026-12-31`, `?next_event_start__isnull=false`.
 """
 
+from django.conf import settings
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import viewsets
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.decorators import action
+from rest_framework.filters import OrderingFilter
+from rest_framework.exceptions import PermissionDenied, ValidationError
+
+from crm.authorization import access_context
 
+from crm.clients.duplicates import check_duplicates
+from crm.clients.followup import MAX_FOLLOW_UP_DAYS, followup_queryset, with_staleness
 from crm.clients.models import Client
 from crm.clients.permissions import ClientPermission
 from crm.clients.serializers import ClientSerializer
+from crm.compiled import CompiledListViewMixin
+from crm.deletion import delete_client
+from crm.fieldsets import SparseFieldsetViewMixin
+from crm.pagination import ClientPagination, FollowUpPagination
 
 
-class ClientViewSet(viewsets.ModelViewSet):
+class ClientViewSet(CompiledListViewMixin, SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """
     ViewSet pour la gestion des clients.
 
@@ -35,6 +65,24 @@ class ClientViewSet(viewsets.ModelViewSet):
     """
     serializer_class = ClientSerializer
     permission_classes = [ClientPermission]
+    pagination_class = ClientPagination
+
+    # Colonnes des tableaux CLI (`?compact=true`) ; `sales_contact` reste chargé pour les permissions
+    compact_fields = ("id", "full_name", "company_name", "email", "phone",
+                      "sales_contact_username", "last_contact", "created_at")
+    sparse_always = ("sales_contact",)
+
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_fields = {
+        "sales_contact": ["exact"],
+        "contracts_count": ["exact", "gte", "lte"],
+        "signed_contracts_count": ["exact", "gte", "lte"],
+        "contracts_amount_due": ["gt", "gte", "lt", "lte"],
+        "next_event_start": ["gte", "lte", "isnull"],
+    }
+    # Ajouter `id` en second critère (`?ordering=-contracts_amount_due,id`) pour des pages stables
+    ordering_fields = ["contracts_amount_due", "contracts_total_amount", "contracts_count",
+                       "signed_contracts_count", "next_event_start", "last_contact", "created_at", "id"]
 
     def get_queryset(self):
         """
@@ -73,8 +121,12 @@ class ClientViewSet(viewsets.ModelViewSet):
         - Si l'utilisateur est COMMERCIAL → forcer `sales_contact` = utilisateur connecté
           (sécurité côté serveur, ignore toute valeur envoyée par le client).
         - Autres rôles → création normale.
+        - Dans tous les cas, refus si un doublon probable existe, sauf
+          `?allow_duplicate=true` (création confirmée malgré l'avertissement).
         """
         user = self.request.user
+        if self.request.query_params.get("allow_duplicate", "").lower() not in ("1", "true"):
+            check_duplicates(serializer.validated_data)
         if user.role == "COMMERCIAL":
             serializer.save(sales_contact=user)
         else:
@@ -97,4 +149,39 @@ class ClientViewSet(viewsets.ModelViewSet):
                 raise PermissionDenied("Vous ne pouvez modifier que vos propres clients.")
             serializer.save(sales_contact=instance.sales_contact)
         else:
-            serializer.save()
\ No newline at end of file
+            serializer.save()
+
+    @action(detail=False, methods=["get"], url_path="to-call")
+    def to_call(self, request):
+        """
+        Clients à relancer : dernier contact vieux d'au moins `?days=` jours
+        (`FOLLOW_UP_DAYS` par défaut, `MAX_FOLLOW_UP_DAYS` au plus), triés par
+        ancienneté, paginés par clé.
+        """
+        ctx = access_context(request)
+        if ctx.is_commercial:
+            owner = ctx.user_id
+        elif ctx.is_gestion:
+            owner = request.query_params.get("sales_contact") or None
+            if owner is not None:
+                try:
+                    owner = int(owner)
+                except ValueError:
+                    raise ValidationError({"sales_contact": "ID de commercial attendu."})
+        else:
+            raise PermissionDenied("La liste de relance est réservée aux rôles COMMERCIAL et GESTION.")
+
+        try:
+            days = int(request.query_params.get("days", settings.FOLLOW_UP_DAYS))
+        except ValueError:
+            days = -1
+        if not 0 <= days <= MAX_FOLLOW_UP_DAYS:
+            raise ValidationError({"days": f"Nombre de jours entier entre 0 et {MAX_FOLLOW_UP_DAYS} attendu."})
+
+        paginator = FollowUpPagination()
+        page = paginator.paginate_queryset(followup_queryset(days, owner), request, view=self)
+        return paginator.get_paginated_response(with_staleness(page))
+
+    def perform_destroy(self, instance):
+        """Supprime le client, ses contrats et ses événements par lots (`crm.deletion.delete_client`)."""
+        delete_client(instance)
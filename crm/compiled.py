@@ -0,0 +1,189 @@
+"""
+Sérialisation « précompilée » des listes (lecture seule).
+
+`ModelSerializer.to_representation` résout, pour chaque ligne et chaque champ,
+la source (`get_attribute`), gère `SkipField`, puis convertit la valeur. Pour
+l’action `list`, `CompiledListViewMixin` remplace ce travail par un plan calculé
+une fois par (sérialiseur, sélection de champs) :
+
+    - clé étrangère (`PrimaryKeyRelatedField`) : lecture directe de `<fk>_id` ;
+    - champ de modèle / façade (`client.full_name`) : `getattr` en chaîne ;
+    - conversion : `str` / `int` pour les champs texte et entiers, fuseau horaire
+      résolu une fois par page pour les dates ISO 8601, sinon la méthode
+      `to_representation` du champ DRF (décimaux…) appelée directement.
+
+La sortie est identique à celle du sérialiseur (mêmes clés, même ordre, même
+omission d’une façade dont la relation est nulle). Tout champ dont la source
+n’est pas un chemin de champs de modèle suit le chemin DRF standard.
+Désactivable avec `FAST_LIST_SERIALIZATION = False`.
+"""
+
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import Callable
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.fields import SkipField, empty
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.settings import ISO_8601, api_settings
+
+# Conversions équivalentes à `to_representation` pour ces types exacts
+_DIRECT = {
+    serializers.CharField: str,
+    serializers.EmailField: str,
+    serializers.IntegerField: int,
+}
+
+_plans: dict[tuple, list] = {}
+
+
+class _Missing(Exception):
+    """Relation nulle au milieu d'une source pointée : DRF décide (None, défaut ou omission)."""
+
+
+def _chain(attrs: list[str]) -> Callable:
+    if len(attrs) == 1:
+        return attrgetter(attrs[0])
+
+    def get(instance):
+        for attr in attrs:
+            if instance is None:
+                raise _Missing
+            instance = getattr(instance, attr)
+        return instance
+    return get
+
+
+class _AwareDateTime:
+    """`DateTimeField` ISO 8601 : `bind()` résout le fuseau (requête courante) une fois par page."""
+
+    def __init__(self, field):
+        self.field = field
+
+    def bind(self) -> Callable:
+        field = self.field
+        tz = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+        if tz is None:
+            return field.to_representation
+
+        def convert(value):
+            if isinstance(value, str) or value.tzinfo is None:
+                return field.to_representation(value)
+            try:
+                value = value.astimezone(tz).isoformat()
+            except OverflowError:
+                return field.to_representation(value)
+            return value[:-6] + "Z" if value.endswith("+00:00") else value
+        return convert
+
+
+def _converter(field) -> Callable:
+    direct = _DIRECT.get(type(field))
+    if direct is not None:
+        return direct
+    if type(field) is serializers.DateTimeField:
+        output_format = getattr(field, "format", empty)
+        if output_format is empty:
+            output_format = api_settings.DATETIME_FORMAT
+        if isinstance(output_format, str) and output_format.lower() == ISO_8601:
+            return _AwareDateTime(field)
+    return field.to_representation
+
+
+def _model_path(model, attrs: list[str]):
+    """Retourne le champ de modèle final si `attrs` est un chemin de champs concrets, sinon None."""
+    field = None
+    for attr in attrs:
+        if model is None:
+            return None
+        try:
+            field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return None
+        model = field.related_model if field.is_relation else None
+    return field
+
+
+def _compile(serializer) -> list:
+    model = serializer.Meta.model
+    plan = []
+    for field in serializer._readable_fields:
+        attrs = field.source_attrs
+        model_field = _model_path(model, attrs) if field.source != "*" else None
+
+        if model_field is None:
+            plan.append((field.field_name, None, None, field))
+        elif (
+            isinstance(field, PrimaryKeyRelatedField)
+            and field.pk_field is None
+            and len(attrs) == 1
+            and model_field.is_relation
+        ):
+            plan.append((field.field_name, attrgetter(model_field.attname), None, field))
+        else:
+            plan.append((field.field_name, _chain(attrs), _converter(field), field))
+    return plan
+
+
+def _represent(plan: list, instance) -> dict:
+    row = {}
+    for name, getter, convert, field in plan:
+        if getter is None:
+            # Chemin DRF standard (méthode, propriété, source "*")
+            try:
+                attribute = field.get_attribute(instance)
+            except SkipField:
+                continue
+            row[name] = None if attribute is None else field.to_representation(attribute)
+            continue
+        try:
+            value = getter(instance)
+        except _Missing:
+            try:
+                value = field.get_attribute(instance)
+            except SkipField:
+                continue
+        if value is None:
+            row[name] = None
+        else:
+            row[name] = value if convert is None else convert(value)
+    return row
+
+
+class CompiledListSerializer:
+    """Équivalent lecture seule de `serializer_class(instances, many=True)` (attribut `.data`)."""
+
+    def __init__(self, instances, serializer):
+        self.instances = instances
+        key = (type(serializer), tuple(serializer.fields))
+        plan = _plans.get(key)
+        if plan is None:
+            plan = _plans[key] = _compile(serializer)
+        self.plan = plan
+
+    @property
+    def data(self) -> list[dict]:
+        plan = [
+            (name, getter, convert.bind() if isinstance(convert, _AwareDateTime) else convert, field)
+            for name, getter, convert, field in self.plan
+        ]
+        return [_represent(plan, instance) for instance in self.instances]
+
+
+class CompiledListViewMixin:
+    """ViewSet : sérialise l'action `list` via `CompiledListSerializer`."""
+
+    def get_serializer(self, *args, **kwargs):
+        if (
+            getattr(self, "action", None) == "list"
+            and kwargs.get("many")
+            and args
+            and getattr(settings, "FAST_LIST_SERIALIZATION", True)
+        ):
+            kwargs.pop("many")
+            kwargs.setdefault("context", self.get_serializer_context())
+            return CompiledListSerializer(args[0], self.get_serializer_class()(**kwargs))
+        return super().get_serializer(*args, **kwargs)
@@ -0,0 +1,142 @@
+"""
+Compression négociée des réponses HTTP (`Accept-Encoding`).
+
+`CompressionMiddleware` étend `GZipMiddleware` de Django :
+    - seuil configurable (`COMPRESSION_MIN_SIZE`, octets) : les petites réponses
+      (détails, erreurs) partent telles quelles (gzip conserve en plus le
+      minimum de 200 octets de Django) ;
+    - négociation avec q-values (`gzip;q=0` refuse gzip) ;
+    - zstd (`pip install zstandard`) et brotli (`pip install brotli`) sont proposés
+      s’ils sont installés, dans cet ordre de préférence, sinon gzip
+      (délégué à Django, avec sa protection BREACH) ;
+    - les réponses streamées (export ICS) sont compressées bloc par bloc.
+
+Les réponses déjà encodées sont ignorées ; `Vary: Accept-Encoding` est posé et un
+ETag fort devient faible, comme le fait Django.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Optional
+
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    brotli = None
+
+DEFAULT_MIN_SIZE = 1024
+ZSTD_LEVEL = 3
+BROTLI_QUALITY = 5
+
+
+class _Zstd:
+    def compress(self, data: bytes) -> bytes:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+
+    def stream(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+        for chunk in chunks:
+            data = compressor.compress(chunk) + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+            if data:
+                yield data
+        yield compressor.flush()
+
+
+class _Brotli:
+    def compress(self, data: bytes) -> bytes:
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+
+    def stream(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        for chunk in chunks:
+            data = compressor.process(chunk) + compressor.flush()
+            if data:
+                yield data
+        yield compressor.finish()
+
+
+# Ordre de préférence du serveur ; gzip est toujours disponible (Django)
+CODECS = {}
+if zstandard is not None:
+    CODECS["zstd"] = _Zstd()
+if brotli is not None:
+    CODECS["br"] = _Brotli()
+SUPPORTED = (*CODECS, "gzip")
+
+
+def parse_accept_encoding(header: str) -> dict[str, float]:
+    """`"gzip, br;q=0.5, zstd;q=0"` → {"gzip": 1.0, "br": 0.5, "zstd": 0.0}."""
+    accepted = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def negotiate(header: str, available: Iterable[str] = SUPPORTED) -> Optional[str]:
+    """Encodage retenu : meilleure q-value côté client, puis préférence serveur ; None si aucun."""
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    best, best_q = None, 0.0
+    for coding in available:
+        q = accepted.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """Compression gzip / brotli / zstd selon `Accept-Encoding`, au-delà de `COMPRESSION_MIN_SIZE` octets."""
+
+    def process_response(self, request, response):
+        if response.has_header("Content-Encoding"):
+            return response
+        min_size = getattr(settings, "COMPRESSION_MIN_SIZE", DEFAULT_MIN_SIZE)
+        if not response.streaming and len(response.content) < min_size:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        # Flux asynchrones : gzip uniquement (chemin Django)
+        available = ("gzip",) if response.streaming and response.is_async else SUPPORTED
+        coding = negotiate(request.META.get("HTTP_ACCEPT_ENCODING", ""), available)
+        if coding is None:
+            return response
+        if coding == "gzip":
+            return super().process_response(request, response)
+
+        codec = CODECS[coding]
+        if response.streaming:
+            response.streaming_content = codec.stream(response.streaming_content)
+            del response.headers["Content-Length"]
+        else:
+            compressed = codec.compress(response.content)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = coding
+        return response
@@ -0,0 +1,46 @@
+"""
+Filtres `django-filter` des contrats (`ContractViewSet`).
+
+`has_event` repose sur une sous-requête `EXISTS` corrélée sur `events_event.contract_id`,
+déjà indexée par la contrainte d’unicité du `OneToOneField` : `?has_event=false`
+devient un anti-join (`WHERE NOT EXISTS …`) évalué par la base, sans charger
+les événements.
+"""
+
+from django.db.models import Exists, OuterRef
+from django_filters import rest_framework as filters
+
+from crm.contracts.models import Contract
+from crm.events.models import Event
+
+
+def event_exists() -> Exists:
+    """Expression « ce contrat a déjà son événement » (annotation et filtre)."""
+    return Exists(Event.objects.filter(contract_id=OuterRef("pk")))
+
+
+class ContractFilter(filters.FilterSet):
+    """
+    Champs filtrables :
+        * is_signed : booléen (exact)
+        * has_event : booléen, contrat déjà pourvu (ou non) de son événement
+        * client / sales_contact : ID (exact)
+        * amount_due / total_amount : exact, gt, gte, lt, lte
+        * created_at : exact, gte, lte
+    """
+    has_event = filters.BooleanFilter(method="filter_has_event")
+
+    class Meta:
+        model = Contract
+        fields = {
+            "is_signed": ["exact"],
+            "client": ["exact"],
+            "sales_contact": ["exact"],
+            "amount_due": ["exact", "gt", "gte", "lt", "lte"],
+            "total_amount": ["exact", "gt", "gte", "lt", "lte"],
+            "created_at": ["exact", "gte", "lte"],
+            # Ajouter "updated_at" si un filtrage sur les mises à jour est nécessaire
+        }
+
+    def filter_has_event(self, queryset, name, value):
+        return queryset.filter(event_exists() if value else ~event_exists())
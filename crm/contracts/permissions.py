@@ -1,7 +1,9 @@
-from rest_framework.permissions import BasePermission, SAFE_METHODS
+from rest_framework.permissions import SAFE_METHODS
 
+from crm.authorization import AccessContext, RolePermission, client_owner_id
 
-class ContractPermission(BasePermission):
+
+class ContractPermission(RolePermission):
     """
     Classe de permissions pour la gestion des contrats.
 
@@ -11,29 +13,21 @@ class ContractPermission(BasePermission):
     - **SUPPORT** : lecture seule sur tous les contrats.
     """
 
-    def has_permission(self, request, view):
+    def has_role_permission(self, ctx: AccessContext, method: str) -> bool:
         """
         Vérifie si l'utilisateur a accès à la vue (niveau global, pas spécifique à un objet).
 
         - GESTION : accès complet, toutes méthodes HTTP autorisées.
         - COMMERCIAL & SUPPORT : accès uniquement en lecture (méthodes sûres : GET, HEAD, OPTIONS).
-        - Utilisateur non authentifié : aucun accès.
+        - Utilisateur non authentifié : aucun accès (géré par `RolePermission`).
         """
-        user = request.user
-
-        if not user or not user.is_authenticated:
-            return False
-
-        if user.role == "GESTION":
-            return True
-
-        if request.method in SAFE_METHODS:
+        if ctx.is_gestion:
             return True
 
         # Hors SAFE_METHODS, seul GESTION peut agir
-        return False
+        return method in SAFE_METHODS
 
-    def has_object_permission(self, request, view, obj):
+    def has_role_object_permission(self, ctx: AccessContext, method: str, obj) -> bool:
         """
         Vérifie les permissions spécifiques à un objet Contrat.
 
@@ -42,20 +36,21 @@ class ContractPermission(BasePermission):
             * Lecture seule (SAFE_METHODS) uniquement si le contrat concerne un de ses clients.
         - SUPPORT :
             * Lecture seule (SAFE_METHODS) sur tous les contrats.
-        """
-        user = request.user
 
+        La propriété est lue sur `client.sales_contact_id` (client chargé par la vue),
+        sans charger l'utilisateur commercial.
+        """
         # GESTION : accès complet
-        if user.role == "GESTION":
+        if ctx.is_gestion:
             return True
 
         # COMMERCIAL : lecture seule sur ses propres clients
-        if user.role == "COMMERCIAL" and request.method in SAFE_METHODS:
-            return obj.client.sales_contact == user
+        if ctx.is_commercial and method in SAFE_METHODS:
+            return ctx.is_self(client_owner_id(obj))
 
         # SUPPORT : lecture seule sur tout
-        if user.role == "SUPPORT" and request.method in SAFE_METHODS:
+        if ctx.is_support and method in SAFE_METHODS:
             return True
 
         # Par défaut : refus
-        return False
\ No newline at end of file
+        return False
@@ -1,9 +1,11 @@
 from rest_framework import serializers
 
 from crm.contracts.models import Contract
+from crm.events.models import Event
+from crm.fieldsets import SparseFieldsMixin
 
 
-class ContractSerializer(serializers.ModelSerializer):
+class ContractSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """
     Sérialiseur pour le modèle Contract.
 
@@ -12,6 +14,7 @@ class ContractSerializer(serializers.ModelSerializer):
       - Expose des champs "façades" en lecture seule pour faciliter l'affichage côté client :
           * `client_full_name` : nom complet du client lié
           * `sales_contact_username` : nom d'utilisateur du commercial en charge
+          * `has_event` : le contrat a-t-il déjà son événement (annotation `EXISTS` de la vue)
 
     Remarque :
       - Les champs dérivés (`client_full_name`, `sales_contact_username`) sont **read_only**,
@@ -30,17 +33,26 @@ class ContractSerializer(serializers.ModelSerializer):
         read_only=True
     )
 
+    # Lecture seule : annotation `has_event` du queryset de la vue, sinon une requête EXISTS
+    has_event = serializers.SerializerMethodField()
+
     class Meta:
         model = Contract
         fields = [
             'id',
             'client', 'client_full_name',
             'sales_contact', 'sales_contact_username',
-            'total_amount', 'amount_due', 'is_signed',
+            'total_amount', 'amount_due', 'is_signed', 'has_event',
             'created_at', 'updated_at',
         ]
         # Champs non éditables via l’API
         read_only_fields = [
             'id', 'created_at', 'updated_at',
-            'client_full_name', 'sales_contact_username',
-        ]
\ No newline at end of file
+            'client_full_name', 'sales_contact_username', 'has_event',
+        ]
+
+    def get_has_event(self, obj) -> bool:
+        annotated = getattr(obj, "has_event", None)
+        if annotated is not None:
+            return annotated
+        return obj.pk is not None and Event.objects.filter(contract_id=obj.pk).exists()
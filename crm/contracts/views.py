@@ -10,21 +10,27 @@ Fonctionnalités :
     - CRUD complet selon permissions.
     - Filtrage avancé via `django-filter` sur plusieurs champs :
         * is_signed : booléen (exact)
+        * has_event : booléen, via `EXISTS` sur l'événement du contrat (anti-join si false)
         * client : ID du client (exact)
         * sales_contact : ID du commercial (exact)
         * amount_due / total_amount : filtres numériques (exact, gt, gte, lt, lte)
         * created_at : filtres de date (exact, gte, lte)
+    - Lecture : `?fields=` / `?omit=` / `?compact=true` (voir `crm.fieldsets`).
 """
 
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import viewsets
 
+from crm.contracts.filters import ContractFilter, event_exists
 from crm.contracts.models import Contract
 from crm.contracts.permissions import ContractPermission
 from crm.contracts.serializers import ContractSerializer
+from crm.compiled import CompiledListViewMixin
+from crm.fieldsets import SparseFieldsetViewMixin
+from crm.pagination import ContractPagination
 
 
-class ContractViewSet(viewsets.ModelViewSet):
+class ContractViewSet(CompiledListViewMixin, SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """
     ViewSet principal pour la gestion des contrats.
 
@@ -37,37 +43,40 @@ class ContractViewSet(viewsets.ModelViewSet):
     """
     serializer_class = ContractSerializer
     permission_classes = [ContractPermission]
+    pagination_class = ContractPagination
+
+    # Colonnes des tableaux CLI (`?compact=true`) ; le commercial du client reste chargé
+    # pour les permissions objet
+    compact_fields = ("id", "client", "client_full_name", "sales_contact_username",
+                      "total_amount", "amount_due", "is_signed", "created_at")
+    sparse_always = ("client__sales_contact",)
     filter_backends = [DjangoFilterBackend]
 
-    # Champs disponibles pour le filtrage via paramètres de requête
-    # Exemple : ?is_signed=true&amount_due__gt=0&client=1
-    filterset_fields = {
-        "is_signed": ["exact"],
-        "client": ["exact"],
-        "sales_contact": ["exact"],
-        "amount_due": ["exact", "gt", "gte", "lt", "lte"],
-        "total_amount": ["exact", "gt", "gte", "lt", "lte"],
-        "created_at": ["exact", "gte", "lte"],
-        # Ajouter "updated_at" si un filtrage sur les mises à jour est nécessaire
-    }
+    # Filtres via paramètres de requête (voir `crm.contracts.filters`)
+    # Exemple : ?is_signed=true&has_event=false&amount_due__gt=0&client=1
+    filterset_class = ContractFilter
 
     def get_queryset(self):
         """
         Retourne le queryset adapté au rôle de l'utilisateur connecté.
         """
         user = self.request.user
+        # `client` est chargé par jointure : sérialisation et contrôle d'accès objet
+        # (`client.sales_contact_id`) sans requête supplémentaire.
+        # `has_event` : sous-requête EXISTS indexée, exposée par le sérialiseur
+        qs = Contract.objects.select_related("client", "sales_contact").annotate(has_event=event_exists())
 
         if user.role == "GESTION":
             # Accès à tous les contrats
-            return Contract.objects.all()
+            return qs
 
         if user.role == "COMMERCIAL":
             # Accès uniquement aux contrats liés à ses propres clients
-            return Contract.objects.filter(client__sales_contact=user)
+            return qs.filter(client__sales_contact=user)
 
         if user.role == "SUPPORT":
             # Accès en lecture seule à tous les contrats
-            return Contract.objects.all()
+            return qs
 
         # Aucun accès pour les rôles non reconnus
-        return Contract.objects.none()
\ No newline at end of file
+        return Contract.objects.none()
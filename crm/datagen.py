@@ -0,0 +1,280 @@
+"""
+Générateur de données synthétiques (déterministe et paramétrable).
+
+Utilisé par `seed.py` (jeu de démo) et pour les mesures de performance
+(jeux de plusieurs millions de lignes). À graine identique et sur une base
+vide, le contenu généré est identique d’une exécution à l’autre.
+
+Principes :
+    - un seul `random.Random(seed)` pilote tous les tirages (pas d’état global) ;
+    - insertion par lots (`bulk_create`) : utilisateurs, puis, lot de clients par
+      lot de clients, leurs contrats et les événements des contrats signés
+      (mémoire bornée par `batch_size`, quel que soit le volume total) ;
+    - un seul hachage de mot de passe, partagé par tous les comptes générés ;
+    - aucune migration n’est créée ni supprimée : le schéma doit être à jour ;
+    - compatible SQLite (≥ 3.35) et PostgreSQL (récupération des IDs à l’insertion).
+
+`bulk_create` ne déclenche pas les signaux : le pipeline commercial et les
+agrégats des clients sont recalculés en fin de génération (`rebuild_all`,
+`reconcile`).
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, time as dt_time, timedelta
+from decimal import Decimal
+from typing import Callable, Optional
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.utils import timezone
+
+from crm.clients.models import Client
+from crm.clients.rollups import reconcile
+from crm.contracts.models import Contract
+from crm.events.models import Event
+from crm.pipeline.services import rebuild_all
+
+User = get_user_model()
+
+FIRST_NAMES = [
+    "Jean", "Sophie", "Karim", "Emma", "Lucas", "Nora", "Antoine", "Lina", "Hugo", "Chloé",
+    "Mehdi", "Camille", "Louis", "Inès", "Thomas", "Léa", "Yanis", "Manon", "Paul", "Sarah",
+]
+LAST_NAMES = [
+    "Martin", "Durand", "Boulahya", "Lefèvre", "Petit", "Benali", "Girard", "Fontaine",
+    "Moreau", "Bernard", "Dubois", "Laurent", "Simon", "Michel", "Garcia", "Roux",
+]
+COMPANY_SUFFIXES = ["SARL", "SAS", "Consulting", "& Fils", "Group", "Studio", "Co.", "Industries"]
+EVENT_KINDS = [
+    "Formation produit", "Conférence annuelle", "Atelier découverte",
+    "Séminaire stratégique", "Présentation client", "Atelier technique",
+]
+EVENT_LOCATIONS = [
+    "Salle Eiffel - Paris", "Hôtel de Ville - Lyon", "Centre Expo - Marseille",
+    "Palais des Congrès - Lille", "Espace Atlantique - Nantes", "Salle Horizon - Toulouse",
+    "Château de Versailles", "Villa Méditerranée - Marseille",
+]
+EVENT_NOTES = [
+    "Prévoir café et viennoiseries.", "Matériel audio/vidéo requis.", "Invitations envoyées.",
+    "Salle confirmée.", "En attente de confirmation du client.",
+]
+
+
+@dataclass
+class GeneratorConfig:
+    """
+    Paramètres de génération.
+
+    Volumes :
+        - commercials / supports / gestion : nombre d’utilisateurs par rôle ;
+        - clients : nombre total de clients (répartis uniformément entre commerciaux) ;
+        - contracts_per_client : nombre moyen de contrats par client (0 à 2× la moyenne).
+    Ratios :
+        - unassigned_client_ratio : part de clients sans commercial ;
+        - signed_ratio : part de contrats signés ;
+        - paid_ratio : part de contrats signés entièrement payés ;
+        - event_ratio : part de contrats signés ayant un événement ;
+        - unassigned_event_ratio : part d’événements sans support.
+    Dates :
+        - last_contact_mean_days : âge moyen du dernier contact (loi exponentielle,
+          majorée par history_days) ;
+        - events_past_days / events_future_days : fenêtre des événements autour d’aujourd’hui.
+    """
+    seed: int = 42
+    commercials: int = 3
+    supports: int = 2
+    gestion: int = 1
+    clients: int = 50
+    contracts_per_client: float = 1.5
+    unassigned_client_ratio: float = 0.0
+    signed_ratio: float = 0.6
+    paid_ratio: float = 0.3
+    event_ratio: float = 0.8
+    unassigned_event_ratio: float = 0.2
+    last_contact_mean_days: int = 45
+    history_days: int = 365
+    events_past_days: int = 60
+    events_future_days: int = 180
+    batch_size: int = 2000
+    password: str = "Azerty123$"
+    email_domain: str = "exemple.com"
+    today: Optional[datetime] = field(default=None, repr=False)
+
+
+@dataclass
+class GenerationReport:
+    """Volumes insérés et durée totale."""
+    users: int = 0
+    clients: int = 0
+    contracts: int = 0
+    events: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows(self) -> int:
+        return self.users + self.clients + self.contracts + self.events
+
+
+class DataGenerator:
+    """Génère et insère un graphe utilisateurs → clients → contrats → événements."""
+
+    def __init__(self, config: GeneratorConfig, on_progress: Optional[Callable[[GenerationReport], None]] = None):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.on_progress = on_progress
+        self.now = config.today or timezone.now()
+        self.report = GenerationReport()
+
+    # ——— Utilisateurs ———
+
+    def _users(self) -> dict[str, list[int]]:
+        """Crée les comptes de chaque rôle (`commercial_1`, `support_1`, …) et retourne leurs IDs."""
+        cfg = self.config
+        password = make_password(cfg.password)
+        users = []
+        for role, count in (("COMMERCIAL", cfg.commercials), ("SUPPORT", cfg.supports), ("GESTION", cfg.gestion)):
+            for i in range(1, count + 1):
+                first, last = self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+                username = f"{role.lower()}_{i}"
+                users.append(User(
+                    username=username,
+                    email=f"{username}@{cfg.email_domain}",
+                    first_name=first,
+                    last_name=last,
+                    role=role,
+                    password=password,
+                ))
+
+        existing = list(
+            User.objects.filter(username__in=[u.username for u in users]).values_list("username", flat=True)[:3]
+        )
+        if existing:
+            raise ValueError(f"Utilisateurs déjà présents ({', '.join(existing)}…) : base non vide.")
+
+        for user in users:
+            user.set_search_keys()  # `bulk_create` n'appelle pas `save()`
+        User.objects.bulk_create(users, batch_size=cfg.batch_size)
+        self.report.users = len(users)
+        ids: dict[str, list[int]] = {"COMMERCIAL": [], "SUPPORT": [], "GESTION": []}
+        for user in users:
+            ids[user.role].append(user.pk)
+        return ids
+
+    # ——— Tirages ———
+
+    def _last_contact(self):
+        cfg = self.config
+        days = min(int(self.rng.expovariate(1 / max(cfg.last_contact_mean_days, 1))), cfg.history_days)
+        return (self.now - timedelta(days=days)).date()
+
+    def _amounts(self, signed: bool) -> tuple[Decimal, Decimal]:
+        total = round(min(self.rng.lognormvariate(8, 0.7), 9_999_999), 2)
+        if not signed:
+            due = total
+        elif self.rng.random() < self.config.paid_ratio:
+            due = 0
+        else:
+            due = round(self.rng.uniform(0, total), 2)
+        return Decimal(str(total)), Decimal(str(due))
+
+    def _event_window(self) -> tuple[datetime, datetime]:
+        cfg = self.config
+        day = self.rng.randint(-cfg.events_past_days, cfg.events_future_days)
+        date = (timezone.localtime(self.now) + timedelta(days=day)).date()
+        start = timezone.make_aware(datetime.combine(date, dt_time(self.rng.randint(8, 17))))
+        return start, start + timedelta(hours=self.rng.choice((1, 2, 3, 4, 8)))
+
+    # ——— Lots ———
+
+    def _client_batch(self, offset: int, size: int, commercial_ids: list[int]) -> list[Client]:
+        cfg = self.config
+        clients = []
+        for n in range(offset, offset + size):
+            first, last = self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+            assigned = bool(commercial_ids) and self.rng.random() >= cfg.unassigned_client_ratio
+            clients.append(Client(
+                full_name=f"{first} {last}",
+                email=f"{first}.{last}.{n + 1}@{cfg.email_domain}".lower(),
+                phone=f"0{self.rng.randint(6, 7)}{self.rng.randint(10_000_000, 99_999_999)}",
+                company_name=f"{self.rng.choice(LAST_NAMES)} {self.rng.choice(COMPANY_SUFFIXES)}",
+                last_contact=self._last_contact(),
+                sales_contact_id=commercial_ids[n % len(commercial_ids)] if assigned else None,
+            ))
+            clients[-1].set_search_keys()  # `bulk_create` n'appelle pas `save()`
+        return Client.objects.bulk_create(clients, batch_size=cfg.batch_size)
+
+    def _contract_batch(self, clients: list[Client]) -> list[Contract]:
+        cfg = self.config
+        contracts = []
+        for client in clients:
+            for _ in range(self.rng.randint(0, round(2 * cfg.contracts_per_client))):
+                signed = self.rng.random() < cfg.signed_ratio
+                total, due = self._amounts(signed)
+                contracts.append(Contract(
+                    client_id=client.pk,
+                    sales_contact_id=client.sales_contact_id,
+                    total_amount=total,
+                    amount_due=due,
+                    is_signed=signed,
+                ))
+        return Contract.objects.bulk_create(contracts, batch_size=cfg.batch_size)
+
+    def _event_batch(self, contracts: list[Contract], support_ids: list[int]) -> list[Event]:
+        cfg = self.config
+        events = []
+        for contract in contracts:
+            if not contract.is_signed or self.rng.random() >= cfg.event_ratio:
+                continue
+            start, end = self._event_window()
+            has_support = bool(support_ids) and self.rng.random() >= cfg.unassigned_event_ratio
+            events.append(Event(
+                contract_id=contract.pk,
+                client_id=contract.client_id,
+                support_contact_id=self.rng.choice(support_ids) if has_support else None,
+                event_name=f"{self.rng.choice(EVENT_KINDS)} #{self.report.events + len(events) + 1}",
+                event_start=start,
+                event_end=end,
+                location=self.rng.choice(EVENT_LOCATIONS),
+                attendees=self.rng.randint(5, 300),
+                notes=self.rng.choice(EVENT_NOTES),
+            ))
+        return Event.objects.bulk_create(events, batch_size=cfg.batch_size)
+
+    # ——— Orchestration ———
+
+    def run(self) -> GenerationReport:
+        """Insère le graphe complet puis recalcule le pipeline commercial et les agrégats clients."""
+        if not connection.features.can_return_rows_from_bulk_insert:
+            raise RuntimeError("La base doit renvoyer les IDs à l'insertion groupée (SQLite ≥ 3.35 ou PostgreSQL).")
+
+        started = time.perf_counter()
+        cfg = self.config
+        with transaction.atomic():
+            ids = self._users()
+
+        for offset in range(0, cfg.clients, cfg.batch_size):
+            size = min(cfg.batch_size, cfg.clients - offset)
+            with transaction.atomic():
+                clients = self._client_batch(offset, size, ids["COMMERCIAL"])
+                contracts = self._contract_batch(clients)
+                events = self._event_batch(contracts, ids["SUPPORT"])
+            self.report.clients += len(clients)
+            self.report.contracts += len(contracts)
+            self.report.events += len(events)
+            if self.on_progress:
+                self.on_progress(self.report)
+
+        rebuild_all()
+        reconcile()
+        self.report.seconds = time.perf_counter() - started
+        return self.report
+
+
+def generate(config: Optional[GeneratorConfig] = None, **kwargs) -> GenerationReport:
+    """Raccourci : `generate(clients=100_000, seed=1)`."""
+    return DataGenerator(config or GeneratorConfig(**kwargs)).run()
@@ -0,0 +1,141 @@
+"""
+Suppression rapide des clients et des utilisateurs à gros volume de données liées.
+
+`Model.delete()` passe par le collecteur de Django, qui charge en mémoire chaque
+ligne dépendante (contrats et événements d’un client ; clients, contrats et
+événements d’un utilisateur, mis à NULL) avant d’écrire. Ici, les dépendances
+sont traitées par lots de clés primaires (`DELETE_CHUNK_SIZE`), chacun dans sa
+propre transaction courte :
+
+    - `delete_client` : DELETE des événements puis des contrats du client, puis
+      suppression du client lui-même (qui n’a plus de dépendances) ;
+    - `delete_user` : UPDATE … SET NULL de `Client.sales_contact`,
+      `Contract.sales_contact` et `Event.support_contact`, puis suppression du compte.
+
+Événements et contrats sont supprimés sans instancier les objets (`_raw_delete`,
+le chemin « fast delete » de Django) : aucun signal n’est émis. Chaque lot fait
+donc lui-même, dans sa transaction, ce que feraient les signaux : la contribution
+des contrats supprimés est retirée de `PipelineSummary` et des agrégats des
+clients (`apply_contract_delta`, un agrégat par lot), et `next_event_start` des
+clients des événements supprimés est recalculé (`refresh_next_event`).
+Une interruption laisse un état cohérent lot par lot ; relancer la suppression la termine.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+
+from crm.clients.models import Client
+from crm.clients.rollups import apply_contract_delta, refresh_next_event
+from crm.contracts.models import Contract
+from crm.events.models import Event
+from crm.pipeline.services import apply_delta
+
+
+def _chunk_size() -> int:
+    return getattr(settings, "DELETE_CHUNK_SIZE", 1000)
+
+
+def _pk_chunks(queryset, size: int) -> Iterator[list[int]]:
+    """Lots de clés primaires croissantes (pagination par clé, sans OFFSET)."""
+    last = 0
+    while True:
+        pks = list(queryset.filter(pk__gt=last).order_by("pk").values_list("pk", flat=True)[:size])
+        if not pks:
+            return
+        yield pks
+        last = pks[-1]
+
+
+def _delete_events(queryset, size: int) -> int:
+    deleted = 0
+    for pks in _pk_chunks(queryset, size):
+        with transaction.atomic():
+            batch = Event.objects.filter(pk__in=pks)
+            client_ids = set(batch.values_list("client_id", flat=True).distinct().order_by())
+            deleted += batch._raw_delete(batch.db)
+            refresh_next_event(client_ids)
+    return deleted
+
+
+def _delete_contracts(queryset, size: int) -> int:
+    deleted = 0
+    for pks in _pk_chunks(queryset, size):
+        with transaction.atomic():
+            batch = Contract.objects.filter(pk__in=pks)
+            contributions = list(
+                batch.filter(sales_contact__isnull=False)
+                .values("sales_contact_id")
+                .annotate(
+                    n=Count("id"),
+                    unsigned=Count("id", filter=Q(is_signed=False)),
+                    due=Sum("amount_due"),
+                )
+                .order_by()
+            )
+            rollups = list(
+                batch.values("client_id")
+                .annotate(
+                    n=Count("id"),
+                    signed=Count("id", filter=Q(is_signed=True)),
+                    total=Sum("total_amount"),
+                    due=Sum("amount_due"),
+                )
+                .order_by()
+            )
+            deleted += batch._raw_delete(batch.db)
+            # Après l’écriture, comme depuis les signaux (cf. `apply_delta`)
+            for row in contributions:
+                apply_delta(
+                    row["sales_contact_id"],
+                    contracts_count=-row["n"],
+                    unsigned_contracts_count=-row["unsigned"],
+                    amount_due_total=-row["due"],
+                )
+            for row in rollups:
+                apply_contract_delta(
+                    row["client_id"],
+                    contracts_count=-row["n"],
+                    signed_contracts_count=-row["signed"],
+                    contracts_total_amount=-row["total"],
+                    contracts_amount_due=-row["due"],
+                )
+    return deleted
+
+
+def delete_client(client: Client) -> dict[str, int]:
+    """Supprime `client` avec ses contrats et événements ; retourne {table: lignes supprimées}."""
+    size = _chunk_size()
+    counts = {
+        "events": _delete_events(
+            Event.objects.filter(Q(client_id=client.pk) | Q(contract__client_id=client.pk)), size
+        ),
+        "contracts": _delete_contracts(Contract.objects.filter(client_id=client.pk), size),
+    }
+    # Plus aucune dépendance : le collecteur ne supprime que la ligne (signal post_delete du pipeline inclus)
+    counts["clients"] = client.delete()[1].get(Client._meta.label, 0)
+    return counts
+
+
+def delete_user(user) -> dict[str, int]:
+    """
+    Supprime le compte `user` ; ses clients, contrats et événements perdent leur
+    responsable. Retourne {table: lignes détachées}.
+    """
+    size = _chunk_size()
+    counts = {}
+    for label, model, field in (
+        ("clients", Client, "sales_contact"),
+        ("contracts", Contract, "sales_contact"),
+        ("events", Event, "support_contact"),
+    ):
+        counts[label] = 0
+        for pks in _pk_chunks(model.objects.filter(**{f"{field}_id": user.pk}), size):
+            with transaction.atomic():
+                counts[label] += model.objects.filter(pk__in=pks).update(**{field: None})
+    user.delete()
+    return counts
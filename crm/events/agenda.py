@@ -0,0 +1,177 @@
+"""
+Vue agenda des événements (regroupement par jour / semaine) et export ICS.
+
+Le périmètre est défini par une fenêtre `[start, end[` (dates locales, `end` exclue)
+appliquée sur `event_start`, ce qui permet à la base d’utiliser l’index sur
+`event_start` au lieu de parcourir toutes les lignes paginées.
+
+Ce module fournit :
+  - `parse_agenda_window` : lecture/validation des paramètres `start`, `end`, `bucket` ;
+  - `agenda_rows` : lignes compactes (dicts) de la fenêtre, triées par début ;
+  - `bucket_events` : regroupement des lignes par jour ou par semaine ISO ;
+  - `iter_ics` : générateur de lignes iCalendar (RFC 5545) pour un export en streaming.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from typing import Iterable, Iterator, Optional
+
+from django.db.models import F, QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+
+# Regroupements disponibles
+AGENDA_BUCKETS = ("day", "week")
+
+# Fenêtre maximale pour la réponse JSON (l’export ICS, lui, est streamé)
+MAX_AGENDA_DAYS = 93
+MAX_ICS_DAYS = 366
+
+# Colonnes compactes renvoyées par l’agenda (pas d’instanciation de modèles)
+AGENDA_FIELDS = ("id", "event_name", "event_start", "event_end", "location", "attendees")
+
+
+def _parse_day(value: Optional[str], param: str) -> Optional[date]:
+    if not value:
+        return None
+    parsed = parse_date(value)
+    if parsed is None:
+        raise ValidationError({param: "Date attendue au format AAAA-MM-JJ."})
+    return parsed
+
+
+def parse_agenda_window(params, max_days: int = MAX_AGENDA_DAYS) -> tuple[datetime, datetime, str]:
+    """
+    Retourne `(window_start, window_end, bucket)` à partir des query params.
+
+    - start  : premier jour inclus (défaut : aujourd’hui)
+    - end    : jour exclu (défaut : start + 7 jours)
+    - bucket : "day" (défaut) ou "week"
+    Lève une `ValidationError` si la fenêtre est invalide ou dépasse `max_days`.
+    """
+    start = _parse_day(params.get("start"), "start") or timezone.localdate()
+    end = _parse_day(params.get("end"), "end") or start + timedelta(days=7)
+    bucket = params.get("bucket") or "day"
+
+    if bucket not in AGENDA_BUCKETS:
+        raise ValidationError({"bucket": f"Valeurs possibles : {', '.join(AGENDA_BUCKETS)}."})
+    if end <= start:
+        raise ValidationError({"end": "La date de fin doit être postérieure à la date de début."})
+    if (end - start).days > max_days:
+        raise ValidationError({"end": f"La fenêtre ne peut pas dépasser {max_days} jours."})
+
+    tz = timezone.get_current_timezone()
+    return (
+        datetime.combine(start, time.min, tzinfo=tz),
+        datetime.combine(end, time.min, tzinfo=tz),
+        bucket,
+    )
+
+
+def agenda_rows(queryset: QuerySet, window_start: datetime, window_end: datetime) -> QuerySet:
+    """Lignes compactes des événements démarrant dans la fenêtre, triées par début."""
+    return (
+        queryset.filter(event_start__gte=window_start, event_start__lt=window_end)
+        .order_by("event_start", "id")
+        .values(
+            *AGENDA_FIELDS,
+            client_full_name=F("client__full_name"),
+            support_contact_username=F("support_contact__username"),
+        )
+    )
+
+
+def _bucket_key(moment: datetime, bucket: str) -> date:
+    local_day = timezone.localtime(moment).date()
+    if bucket == "week":
+        return local_day - timedelta(days=local_day.weekday())  # lundi de la semaine ISO
+    return local_day
+
+
+def bucket_events(rows: Iterable[dict], bucket: str) -> list[dict]:
+    """
+    Regroupe des lignes triées par `event_start` en compartiments consécutifs.
+
+    Retour : [{"key": "AAAA-MM-JJ", "count": n, "events": [...]}, ...]
+    (pour "week", `key` est le lundi de la semaine).
+    """
+    buckets: list[dict] = []
+    current_key = None
+    for row in rows:
+        row["event_start"] = timezone.localtime(row["event_start"])
+        row["event_end"] = timezone.localtime(row["event_end"])
+        key = _bucket_key(row["event_start"], bucket)
+        if key != current_key:
+            buckets.append({"key": key.isoformat(), "count": 0, "events": []})
+            current_key = key
+        buckets[-1]["events"].append(row)
+        buckets[-1]["count"] += 1
+    return buckets
+
+
+# ——————————————————————————————————————————————————————————————
+# Export iCalendar
+# ——————————————————————————————————————————————————————————————
+
+def _ics_text(value) -> str:
+    """Échappe un texte selon RFC 5545 (antislash, virgule, point-virgule, retours ligne)."""
+    s = "" if value is None else str(value)
+    return (
+        s.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _ics_datetime(value: datetime) -> str:
+    return value.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+ICS_LINE_OCTETS = 75
+
+
+def _ics_line(line: str) -> str:
+    """
+    Replie les lignes longues (RFC 5545 § 3.1) : 75 octets UTF-8 au plus par ligne,
+    espace de continuation compris, sans couper un caractère multi-octets.
+    """
+    if len(line.encode("utf-8")) <= ICS_LINE_OCTETS:
+        return line + "\r\n"
+    chunks, start, size = [], 0, 0
+    for i, char in enumerate(line):
+        width = len(char.encode("utf-8"))
+        limit = ICS_LINE_OCTETS if not chunks else ICS_LINE_OCTETS - 1
+        if size + width > limit:
+            chunks.append(line[start:i])
+            start, size = i, 0
+        size += width
+    chunks.append(line[start:])
+    return "\r\n ".join(chunks) + "\r\n"
+
+
+def iter_ics(rows: Iterable[dict]) -> Iterator[str]:
+    """Génère un calendrier ICS ligne par ligne (adapté à `StreamingHttpResponse`)."""
+    yield _ics_line("BEGIN:VCALENDAR")
+    yield _ics_line("VERSION:2.0")
+    yield _ics_line("PRODID:-//Epic CRM//Agenda//FR")
+    yield _ics_line("CALSCALE:GREGORIAN")
+    stamp = _ics_datetime(timezone.now())
+    for row in rows:
+        summary = row["event_name"]
+        if row.get("client_full_name"):
+            summary = f"{summary} — {row['client_full_name']}"
+        yield _ics_line("BEGIN:VEVENT")
+        yield _ics_line(f"UID:event-{row['id']}@epic-crm")
+        yield _ics_line(f"DTSTAMP:{stamp}")
+        yield _ics_line(f"DTSTART:{_ics_datetime(row['event_start'])}")
+        yield _ics_line(f"DTEND:{_ics_datetime(row['event_end'])}")
+        yield _ics_line(f"SUMMARY:{_ics_text(summary)}")
+        yield _ics_line(f"LOCATION:{_ics_text(row['location'])}")
+        if row.get("support_contact_username"):
+            yield _ics_line(f"DESCRIPTION:{_ics_text('Support : ' + row['support_contact_username'])}")
+        yield _ics_line("END:VEVENT")
+    yield _ics_line("END:VCALENDAR")
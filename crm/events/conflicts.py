@@ -0,0 +1,147 @@
+"""
+Détection des conflits de planning pour les événements.
+
+Deux ressources ne peuvent pas être occupées deux fois sur le même créneau :
+  - un collaborateur SUPPORT (`support_contact`),
+  - un lieu (`location`).
+
+Deux intervalles [start, end[ se chevauchent si `a.start < b.end` et `b.start < a.end`.
+
+Ce module fournit :
+  - `find_conflicting_events` : requête ciblée (indexée) pour un créneau donné,
+    utilisée à la création / modification d’un événement ;
+  - `check_event_conflicts` : lève une `ValidationError` DRF si un conflit existe ;
+  - `detect_conflicts` : balayage (sweep line) de tous les événements en O(n log n + k)
+    pour produire le rapport global des conflits.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterable, Optional
+
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import ValidationError
+
+from crm.events.models import Event
+
+
+def find_conflicting_events(
+    event_start: datetime,
+    event_end: datetime,
+    support_contact_id: Optional[int] = None,
+    location: Optional[str] = None,
+    exclude_pk: Optional[int] = None,
+) -> QuerySet:
+    """
+    Retourne les événements qui chevauchent [event_start, event_end[ sur le même
+    support ou le même lieu.
+
+    La requête s’appuie sur les index composites (support_contact, event_start)
+    et (location, event_start) : seules les lignes de la ressource concernée
+    dont le début précède `event_end` sont parcourues.
+    """
+    resource_filter = Q()
+    if support_contact_id is not None:
+        resource_filter |= Q(support_contact_id=support_contact_id)
+    if location:
+        resource_filter |= Q(location=location)
+    if not resource_filter:
+        return Event.objects.none()
+
+    qs = Event.objects.filter(
+        resource_filter,
+        event_start__lt=event_end,
+        event_end__gt=event_start,
+    )
+    if exclude_pk is not None:
+        qs = qs.exclude(pk=exclude_pk)
+    return qs.order_by("event_start")
+
+
+def check_event_conflicts(
+    event_start: datetime,
+    event_end: datetime,
+    support_contact_id: Optional[int] = None,
+    location: Optional[str] = None,
+    exclude_pk: Optional[int] = None,
+) -> None:
+    """
+    Vérifie l’absence de conflit pour un créneau et lève une `ValidationError`
+    (HTTP 400) détaillant les événements en conflit le cas échéant.
+    """
+    if not event_start or not event_end:
+        return
+
+    conflicts = list(
+        find_conflicting_events(
+            event_start, event_end, support_contact_id, location, exclude_pk
+        ).values("id", "event_name", "support_contact_id", "location")[:10]
+    )
+    if not conflicts:
+        return
+
+    errors: dict[str, list[str]] = {}
+    for other in conflicts:
+        if support_contact_id is not None and other["support_contact_id"] == support_contact_id:
+            errors.setdefault("support_contact", []).append(
+                f"Le support est déjà affecté à l’événement #{other['id']} "
+                f"({other['event_name']}) sur ce créneau."
+            )
+        if location and other["location"] == location:
+            errors.setdefault("location", []).append(
+                f"Le lieu est déjà occupé par l’événement #{other['id']} "
+                f"({other['event_name']}) sur ce créneau."
+            )
+    raise ValidationError(errors)
+
+
+def detect_conflicts(rows: Iterable[tuple]) -> list[dict]:
+    """
+    Calcule tous les conflits à partir de lignes
+    `(id, support_contact_id, location, event_start, event_end)` triées par `event_start`.
+
+    Algorithme (sweep line) :
+      - pour chaque ressource, un tas (min-heap) contient les fins des événements actifs ;
+      - à chaque nouvel événement, on retire les événements terminés (fin <= début),
+        les événements restants chevauchent forcément l’événement courant.
+    Complexité : O(n log n + k) avec k le nombre de paires en conflit.
+    """
+    active: dict[tuple[str, object], list[tuple[datetime, int]]] = defaultdict(list)
+    conflicts: list[dict] = []
+
+    for event_id, support_id, location, start, end in rows:
+        keys = []
+        if support_id is not None:
+            keys.append(("support_contact", support_id))
+        if location:
+            keys.append(("location", location))
+
+        for key in keys:
+            heap = active[key]
+            while heap and heap[0][0] <= start:
+                heapq.heappop(heap)
+            for _, other_id in heap:
+                conflicts.append({
+                    "resource": key[0],
+                    "value": key[1],
+                    "events": [other_id, event_id],
+                })
+            heapq.heappush(heap, (end, event_id))
+
+    return conflicts
+
+
+def conflicts_report(queryset: QuerySet) -> list[dict]:
+    """
+    Produit le rapport des conflits pour un queryset d’événements (déjà filtré par rôle).
+    Les lignes sont lues sous forme de tuples triés par la base (pas d’instanciation de modèles).
+    """
+    rows = (
+        queryset.order_by("event_start", "id")
+        .values_list("id", "support_contact_id", "location", "event_start", "event_end")
+        .iterator(chunk_size=2000)
+    )
+    return detect_conflicts(rows)
@@ -0,0 +1,281 @@
+"""
+Import en masse d’événements depuis un fichier CSV.
+
+Encodage : UTF-8 (avec ou sans BOM) ; à défaut, Windows-1252 (export Excel FR),
+choisi par `open_csv` après un premier passage sur les octets du fichier.
+
+Colonnes attendues (en-tête obligatoire, séparateur `,` ou `;` détecté automatiquement) :
+    contract, event_name, event_start, event_end, location, attendees[, notes][, support_contact]
+
+Règles de validation (identiques à celles de la CLI, `cli/validators`) :
+    - `validate_attendees`   : nombre de participants entier strictement positif ;
+    - `validate_event_dates` : dates au format libre FR (ex. « 29/05/2025 14:00 ») ou ISO 8601
+      (« 2025-05-29 14:00 », heure locale si pas de fuseau), début dans le futur,
+      fin postérieure au début ;
+    - contrat existant, signé, sans événement (OneToOne), non présent deux fois dans le fichier ;
+    - COMMERCIAL : uniquement les contrats de ses propres clients ;
+    - `support_contact` (facultatif) : ID d’un utilisateur de rôle SUPPORT.
+
+Traitement :
+    - lecture en flux (ligne à ligne), regroupement par paquets de `chunk_size` lignes ;
+    - par paquet : UNE requête pour résoudre les contrats (+ présence d’un événement)
+      et UNE pour les supports, puis `bulk_create` dans une transaction dédiée ;
+    - après chaque paquet validé, `on_checkpoint(report)` permet de persister la
+      dernière ligne traitée (reprise via `start_row`).
+
+Les conflits de planning ne sont pas bloquants ici : ils sont visibles via
+`GET /api/events/conflicts/` après l’import.
+"""
+
+from __future__ import annotations
+
+import codecs
+import csv
+import io
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional, TextIO
+
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from cli.validators.attendees_validator import validate_attendees
+from cli.validators.exceptions import ValidationError as RowValidationError
+from cli.validators.validate_event_dates import validate_event_dates
+from crm.clients.rollups import refresh_next_event
+from crm.contracts.models import Contract
+from crm.events.models import Event
+
+User = get_user_model()
+
+REQUIRED_COLUMNS = ("contract", "event_name", "event_start", "event_end", "location", "attendees")
+DEFAULT_CHUNK_SIZE = 200
+FALLBACK_ENCODING = "cp1252"
+
+
+@dataclass
+class ImportReport:
+    """Bilan d’un import : lignes créées, erreurs par ligne et dernière ligne traitée."""
+    created: int = 0
+    last_row: int = 0
+    errors: list[dict] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def detect_encoding(binary: BinaryIO, block_size: int = 64 * 1024) -> str:
+    """
+    "utf-8-sig" si tout le contenu est de l’UTF-8 valide, sinon `FALLBACK_ENCODING`.
+    Lecture par blocs (décodeur incrémental, mémoire constante), puis retour au début.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        while block := binary.read(block_size):
+            decoder.decode(block)
+        decoder.decode(b"", final=True)
+        return "utf-8-sig"
+    except UnicodeDecodeError:
+        return FALLBACK_ENCODING
+    finally:
+        binary.seek(0)
+
+
+def open_csv(binary: BinaryIO) -> TextIO:
+    """Flux texte sur un CSV binaire, dans l’encodage détecté par `detect_encoding`."""
+    encoding = detect_encoding(binary)
+    errors = "strict" if encoding == "utf-8-sig" else "replace"  # octets non définis en cp1252
+    return io.TextIOWrapper(binary, encoding=encoding, errors=errors, newline="")
+
+
+def read_csv(stream: TextIO) -> Iterator[dict]:
+    """
+    Lit un CSV en flux et retourne un itérateur de dicts (clés en minuscules).
+    Détecte le séparateur (`,` ou `;` — export Excel FR) sur la ligne d’en-tête.
+    """
+    header = stream.readline()
+    try:
+        delimiter = csv.Sniffer().sniff(header, delimiters=",;").delimiter
+    except csv.Error:
+        delimiter = ","
+    columns = [c.strip().lower() for c in next(csv.reader([header], delimiter=delimiter), [])]
+
+    missing = [c for c in REQUIRED_COLUMNS if c not in columns]
+    if missing:
+        raise RowValidationError(f"Colonnes manquantes : {', '.join(missing)}")
+
+    for values in csv.reader(stream, delimiter=delimiter):
+        if not any(v.strip() for v in values):
+            continue
+        yield {col: (values[i].strip() if i < len(values) else "") for i, col in enumerate(columns)}
+
+
+def _as_int(value: str) -> Optional[int]:
+    value = (value or "").strip()
+    return int(value) if value.isdigit() else None
+
+
+def _aware(dt):
+    return timezone.make_aware(dt) if timezone.is_naive(dt) else dt
+
+
+def _french_datetime(value: str) -> str:
+    """
+    Convertit une date ISO 8601 (fréquente dans les exports tableur) au format
+    « JJ/MM/AAAA HH:MM » compris par le validateur CLI ; les autres formats sont
+    transmis tels quels. Une date avec fuseau est ramenée à l’heure locale.
+    """
+    try:
+        parsed = datetime.fromisoformat(value.strip())
+    except ValueError:
+        return value
+    if timezone.is_aware(parsed):
+        parsed = timezone.make_naive(parsed)
+    return parsed.strftime("%d/%m/%Y %H:%M")
+
+
+class _Chunk:
+    """Références pré-chargées pour un paquet de lignes (2 requêtes au total)."""
+
+    def __init__(self, rows: list[tuple[int, dict]]):
+        contract_ids = {cid for _, row in rows if (cid := _as_int(row.get("contract")))}
+        support_ids = {sid for _, row in rows if (sid := _as_int(row.get("support_contact")))}
+
+        self.contracts = {
+            c.id: c
+            for c in Contract.objects.filter(id__in=contract_ids)
+            .select_related("client")
+            .annotate(has_event=Exists(Event.objects.filter(contract=OuterRef("pk"))))
+        }
+        self.support_ids = set(
+            User.objects.filter(id__in=support_ids, role="SUPPORT").values_list("id", flat=True)
+        ) if support_ids else set()
+
+
+def _build_event(row: dict, chunk: _Chunk, user, seen_contracts: set) -> tuple[Optional[Event], list[str]]:
+    """Valide une ligne et retourne (Event non sauvegardé, []) ou (None, erreurs)."""
+    errors: list[str] = []
+
+    contract_id = _as_int(row.get("contract"))
+    contract = chunk.contracts.get(contract_id) if contract_id else None
+    if contract is None:
+        errors.append("Contrat introuvable (ID entier attendu).")
+    elif not contract.is_signed:
+        errors.append("Ce contrat n'est pas encore signé.")
+    elif contract.has_event or contract.id in seen_contracts:
+        errors.append("Un événement existe déjà pour ce contrat.")
+    elif user is not None and user.role == "COMMERCIAL" and contract.client.sales_contact_id != user.id:
+        errors.append("Vous ne pouvez créer un événement que pour vos propres clients.")
+
+    if not row.get("event_name"):
+        errors.append("Le nom de l'événement est requis.")
+    if not row.get("location"):
+        errors.append("Le lieu est requis.")
+
+    try:
+        attendees = validate_attendees(row.get("attendees", ""))
+    except RowValidationError as e:
+        errors.append(str(e))
+
+    try:
+        start, end = validate_event_dates(
+            _french_datetime(row.get("event_start", "")),
+            _french_datetime(row.get("event_end", "")),
+        )
+    except RowValidationError as e:
+        errors.append(str(e))
+    except TypeError:
+        # Date avec fuseau non ISO : non comparable à l'heure locale naïve du validateur CLI
+        errors.append("Dates invalides : heure locale attendue (sans fuseau).")
+
+    support_id = None
+    if row.get("support_contact"):
+        support_id = _as_int(row["support_contact"])
+        if support_id not in chunk.support_ids:
+            errors.append("support_contact doit être l'ID d'un utilisateur SUPPORT.")
+
+    if errors:
+        return None, errors
+
+    return Event(
+        contract=contract,
+        client=contract.client,
+        support_contact_id=support_id,
+        event_name=row["event_name"],
+        event_start=_aware(start),
+        event_end=_aware(end),
+        location=row["location"],
+        attendees=attendees,
+        notes=row.get("notes", ""),
+    ), []
+
+
+def _insert(events: list[tuple[int, Event]], report: ImportReport) -> None:
+    """Insère un paquet en une transaction ; en cas de course sur l’unicité, repli ligne à ligne."""
+    try:
+        with transaction.atomic():
+            Event.objects.bulk_create([e for _, e in events])
+            # `bulk_create` n'émet pas post_save : prochain événement des clients concernés
+            refresh_next_event({e.client_id for _, e in events})
+        report.created += len(events)
+        return
+    except IntegrityError:
+        pass
+
+    for index, event in events:
+        try:
+            with transaction.atomic():
+                event.save()
+            report.created += 1
+        except IntegrityError:
+            report.errors.append({"row": index, "errors": ["Un événement existe déjà pour ce contrat."]})
+
+
+def import_events(
+    rows: Iterable[dict],
+    user=None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    start_row: int = 0,
+    on_checkpoint: Optional[Callable[[ImportReport], None]] = None,
+) -> ImportReport:
+    """
+    Importe des lignes d’événements par paquets transactionnels.
+
+    - `user` : utilisateur à l’origine de l’import (règles COMMERCIAL), None pour la commande.
+    - `start_row` : lignes de données déjà traitées (reprise après interruption).
+    - `on_checkpoint` : appelé après chaque paquet validé (persistance de la reprise).
+    """
+    report = ImportReport(last_row=start_row)
+    seen_contracts: set[int] = set()
+    pending: list[tuple[int, dict]] = []
+
+    def flush():
+        if not pending:
+            return
+        chunk = _Chunk(pending)
+        to_create: list[tuple[int, Event]] = []
+        for index, row in pending:
+            event, errors = _build_event(row, chunk, user, seen_contracts)
+            if errors:
+                report.errors.append({"row": index, "errors": errors})
+                continue
+            seen_contracts.add(event.contract_id)
+            to_create.append((index, event))
+        if to_create:
+            _insert(to_create, report)
+        report.last_row = pending[-1][0]
+        pending.clear()
+        if on_checkpoint:
+            on_checkpoint(report)
+
+    for index, row in enumerate(rows, start=1):
+        if index <= start_row:
+            continue
+        pending.append((index, row))
+        if len(pending) >= chunk_size:
+            flush()
+    flush()
+
+    return report
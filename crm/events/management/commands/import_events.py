@@ -0,0 +1,75 @@
+"""
+Import en masse d'événements depuis un CSV (voir `crm.events.importer`).
+
+Usage :
+    python manage.py import_events evenements.csv
+    python manage.py import_events evenements.csv --chunk-size 500 --errors erreurs.csv
+    python manage.py import_events evenements.csv --resume   # reprend après interruption
+
+Un point de reprise (`<fichier>.checkpoint.json`) est écrit après chaque paquet
+validé ; il est supprimé une fois l'import terminé.
+"""
+
+import csv
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from crm.events.importer import DEFAULT_CHUNK_SIZE, RowValidationError, import_events, open_csv, read_csv
+
+
+class Command(BaseCommand):
+    help = "Importe des événements depuis un CSV, par paquets transactionnels avec reprise."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Chemin du fichier CSV.")
+        parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                            help=f"Lignes par transaction (défaut : {DEFAULT_CHUNK_SIZE}).")
+        parser.add_argument("--checkpoint", help="Fichier de reprise (défaut : <path>.checkpoint.json).")
+        parser.add_argument("--resume", action="store_true", help="Reprend depuis le point de reprise.")
+        parser.add_argument("--errors", help="Écrit le rapport d'erreurs dans ce fichier CSV.")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not os.path.exists(path):
+            raise CommandError(f"Fichier introuvable : {path}")
+        checkpoint_path = options.get("checkpoint") or f"{path}.checkpoint.json"
+
+        start_row = 0
+        if options["resume"] and os.path.exists(checkpoint_path):
+            with open(checkpoint_path) as f:
+                start_row = json.load(f).get("last_row", 0)
+            self.stdout.write(f"↪️  Reprise après la ligne {start_row}.")
+
+        def save_checkpoint(report):
+            with open(checkpoint_path, "w") as f:
+                json.dump({"source": path, "last_row": report.last_row, "created": report.created}, f)
+            self.stdout.write(f"   ➡ Ligne {report.last_row} : {report.created} événement(s) créé(s)")
+
+        with open(path, "rb") as binary, open_csv(binary) as stream:
+            try:
+                report = import_events(
+                    read_csv(stream),
+                    chunk_size=options["chunk_size"],
+                    start_row=start_row,
+                    on_checkpoint=save_checkpoint,
+                )
+            except RowValidationError as e:
+                raise CommandError(str(e))
+
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+        if options.get("errors") and report.errors:
+            with open(options["errors"], "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["row", "errors"])
+                for err in report.errors:
+                    writer.writerow([err["row"], " | ".join(err["errors"])])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Import terminé : {report.created} créé(s), {len(report.errors)} ligne(s) en erreur."
+        ))
+        for err in report.errors[:20]:
+            self.stdout.write(self.style.WARNING(f"   ⚠ Ligne {err['row']} : {' | '.join(err['errors'])}"))
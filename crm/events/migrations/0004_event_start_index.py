@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-19 11:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_event_conflict_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['event_start'], name='event_start_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-19 12:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0004_event_start_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['client', 'event_start'], name='event_client_start_idx'),
+        ),
+    ]
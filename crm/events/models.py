@@ -85,6 +85,15 @@ class Event(models.Model):
         verbose_name = "Événement"
         verbose_name_plural = "Événements"
         ordering = ["-event_start"]   # tri décroissant par date de début
+        indexes = [
+            # Agenda / filtres de plage sur la date de début
+            models.Index(fields=["event_start"], name="event_start_idx"),
+            # Détection des conflits de planning (support / lieu sur un créneau)
+            models.Index(fields=["support_contact", "event_start"], name="event_support_start_idx"),
+            models.Index(fields=["location", "event_start"], name="event_location_start_idx"),
+            # Prochain événement d'un client (`Client.next_event_start`)
+            models.Index(fields=["client", "event_start"], name="event_client_start_idx"),
+        ]
 
     def __str__(self) -> str:
         """Représentation lisible de l’événement (utile dans l’admin et les logs)."""
@@ -1,53 +1,46 @@
 # crm/events/permissions.py
 
-from rest_framework.permissions import BasePermission, SAFE_METHODS
+from rest_framework.permissions import SAFE_METHODS
 
-class EventPermission(BasePermission):
+from crm.authorization import AccessContext, RolePermission, client_owner_id
+
+
+class EventPermission(RolePermission):
     """
     COMMERCIAL : peut créer un événement (contrat signé) pour ses clients.
     GESTION    : accès complet (CRUD).
     SUPPORT    : lecture + modification (PUT/PATCH) uniquement de ses événements.
     """
 
-    def has_permission(self, request, view):
-        user = request.user
-        if not user or not user.is_authenticated:
-            return False
-
-        if user.role in ["GESTION", "COMMERCIAL"]:
+    def has_role_permission(self, ctx: AccessContext, method: str) -> bool:
+        if ctx.is_gestion or ctx.is_commercial:
             return True
 
-        if user.role == "SUPPORT":
+        if ctx.is_support:
             # Autoriser lecture ET update (PUT/PATCH). Pas de POST/DELETE.
-            if request.method in SAFE_METHODS:
-                return True
-            if request.method in ("PUT", "PATCH"):
-                return True
-            return False
+            return method in SAFE_METHODS or method in ("PUT", "PATCH")
 
         return False
 
-    def has_object_permission(self, request, view, obj):
-        user = request.user
-
-        if user.role == "GESTION":
+    def has_role_object_permission(self, ctx: AccessContext, method: str, obj) -> bool:
+        if ctx.is_gestion:
             return True
 
-        if request.method in SAFE_METHODS:
+        if method in SAFE_METHODS:
             # COMMERCIAL/SUPPORT peuvent lire ce que leur get_queryset expose
             # (déjà filtré par la view), mais on reste prudent :
-            if user.role == "COMMERCIAL":
-                return obj.client.sales_contact_id == user.id
-            if user.role == "SUPPORT":
-                return obj.support_contact_id == user.id
+            if ctx.is_commercial:
+                return ctx.is_self(client_owner_id(obj))
+            if ctx.is_support:
+                return ctx.is_self(obj.support_contact_id)
             return False
 
-        if user.role == "COMMERCIAL":
+        if ctx.is_commercial:
             # Commercial n’édite pas l’événement (selon ta règle actuelle)
             return False
 
-        if user.role == "SUPPORT":
+        if ctx.is_support:
             # Support peut modifier uniquement ses événements
-            return obj.support_contact_id == user.id and request.method in ("PUT", "PATCH")
+            return ctx.is_self(obj.support_contact_id) and method in ("PUT", "PATCH")
 
-        return False
\ No newline at end of file
+        return False
@@ -10,9 +10,10 @@ Ce module définit le sérialiseur principal utilisé par l’API pour :
 from rest_framework import serializers
 
 from crm.events.models import Event
+from crm.fieldsets import SparseFieldsMixin
 
 
-class EventSerializer(serializers.ModelSerializer):
+class EventSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """
     Sérialiseur pour le modèle `Event`.
 
@@ -34,7 +35,6 @@ class EventSerializer(serializers.ModelSerializer):
         help_text="Nom complet du client lié à l’événement (lecture seule).",
     )
     contract_id = serializers.IntegerField(
-        source="contract.id",
         read_only=True,
         help_text="Identifiant du contrat lié (doublon pratique de `contract`).",
     )
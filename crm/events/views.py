@@ -1,13 +1,23 @@
 # crm/events/views.py
-from rest_framework import viewsets
-from rest_framework.exceptions import PermissionDenied
 
+from django.http import StreamingHttpResponse
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.response import Response
+
+from crm.events.agenda import MAX_ICS_DAYS, agenda_rows, bucket_events, iter_ics, parse_agenda_window
+from crm.events.conflicts import check_event_conflicts, conflicts_report
+from crm.events.importer import DEFAULT_CHUNK_SIZE, RowValidationError, import_events, open_csv, read_csv
 from crm.events.models import Event
 from crm.events.permissions import EventPermission
 from crm.events.serializers import EventSerializer
+from crm.compiled import CompiledListViewMixin
+from crm.fieldsets import SparseFieldsetViewMixin
+from crm.pagination import EventPagination
 
 
-class EventViewSet(viewsets.ModelViewSet):
+class EventViewSet(CompiledListViewMixin, SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """
     Gestion des événements avec filtrage par rôle.
 
@@ -20,9 +30,30 @@ class EventViewSet(viewsets.ModelViewSet):
     - SUPPORT :
         * list/retrieve : uniquement ses événements assignés (support_contact = lui)
         * update        : uniquement ses événements (notes, horaires, etc.).
+
+    Planning :
+        * création / modification refusées (400) si le support ou le lieu est déjà
+          occupé sur le créneau demandé.
+        * `GET /api/events/conflicts/` : rapport des conflits existants (périmètre du rôle).
+        * `GET /api/events/agenda/` : événements regroupés par jour/semaine sur une fenêtre.
+        * `GET /api/events/agenda/ics/` : export iCalendar (streamé) de la même fenêtre.
+
+    Lecture :
+        * `?fields=` / `?omit=` / `?compact=true` (voir `crm.fieldsets`) : champs
+          renvoyés et colonnes / jointures chargées limités à la sélection.
+
+    Import :
+        * `POST /api/events/import/` (multipart, champ `file`) : import CSV par paquets
+          transactionnels (GESTION, ou COMMERCIAL pour ses propres contrats).
     """
     serializer_class = EventSerializer
     permission_classes = [EventPermission]
+    pagination_class = EventPagination
+
+    # Colonnes des tableaux CLI (`?compact=true`, sans `notes` ni horodatages)
+    compact_fields = ("id", "event_name", "client", "client_full_name", "support_contact",
+                      "support_contact_username", "event_start", "event_end", "location", "attendees")
+    sparse_always = ("client__sales_contact", "support_contact")
 
     def get_queryset(self):
         """Filtrage automatique selon le rôle de l'utilisateur."""
@@ -71,12 +102,22 @@ class EventViewSet(viewsets.ModelViewSet):
         if user.role == "COMMERCIAL" and client.sales_contact_id != user.id:
             raise PermissionDenied("Vous ne pouvez créer un événement que pour vos propres clients.")
 
+        # 📅 Support / lieu déjà occupés sur ce créneau ?
+        support_contact = serializer.validated_data.get("support_contact")
+        check_event_conflicts(
+            serializer.validated_data.get("event_start"),
+            serializer.validated_data.get("event_end"),
+            support_contact_id=support_contact.id if support_contact else None,
+            location=serializer.validated_data.get("location"),
+        )
+
         serializer.save(client=client)
 
     def perform_update(self, serializer):
         """
         - Empêche changement de contrat/client après création.
         - Vérifie qu'un SUPPORT ne met à jour que ses propres événements.
+        - Vérifie l'absence de conflit de planning avec les valeurs résultantes.
         """
         user = self.request.user
         instance = self.get_object()
@@ -94,4 +135,92 @@ class EventViewSet(viewsets.ModelViewSet):
         if user.role == "SUPPORT" and instance.support_contact_id != user.id:
             raise PermissionDenied("Vous ne pouvez modifier que vos propres événements.")
 
-        serializer.save()
\ No newline at end of file
+        # 📅 Conflits évalués sur l'état final (valeurs envoyées sinon valeurs actuelles)
+        if "support_contact" in data:
+            support_contact_id = data["support_contact"].id if data["support_contact"] else None
+        else:
+            support_contact_id = instance.support_contact_id
+        check_event_conflicts(
+            data.get("event_start", instance.event_start),
+            data.get("event_end", instance.event_end),
+            support_contact_id=support_contact_id,
+            location=data.get("location", instance.location),
+            exclude_pk=instance.pk,
+        )
+
+        serializer.save()
+
+    @action(detail=False, methods=["get"], url_path="conflicts")
+    def conflicts(self, request):
+        """
+        Rapport des conflits de planning sur le périmètre visible de l'utilisateur.
+
+        Chaque entrée : {"resource": "support_contact" | "location", "value": ..., "events": [id_a, id_b]}
+        """
+        report = conflicts_report(self.filter_queryset(self.get_queryset()))
+        return Response({"count": len(report), "results": report})
+
+    @action(detail=False, methods=["get"], url_path="agenda")
+    def agenda(self, request):
+        """
+        Agenda du périmètre visible, regroupé par jour ou par semaine.
+
+        Query params : start=AAAA-MM-JJ (inclus), end=AAAA-MM-JJ (exclu), bucket=day|week.
+        Une seule requête SQL (filtre de plage sur `event_start`), sans pagination.
+        """
+        window_start, window_end, bucket = parse_agenda_window(request.query_params)
+        rows = agenda_rows(self.filter_queryset(self.get_queryset()), window_start, window_end)
+        buckets = bucket_events(rows, bucket)
+        return Response({
+            "start": window_start.date().isoformat(),
+            "end": window_end.date().isoformat(),
+            "bucket": bucket,
+            "count": sum(b["count"] for b in buckets),
+            "buckets": buckets,
+        })
+
+    @action(detail=False, methods=["get"], url_path="agenda/ics", url_name="agenda-ics")
+    def agenda_ics(self, request):
+        """Export iCalendar de la fenêtre demandée, streamé ligne par ligne (grandes plages)."""
+        window_start, window_end, _ = parse_agenda_window(request.query_params, max_days=MAX_ICS_DAYS)
+        rows = agenda_rows(self.filter_queryset(self.get_queryset()), window_start, window_end)
+        response = StreamingHttpResponse(
+            iter_ics(rows.iterator(chunk_size=2000)),
+            content_type="text/calendar; charset=utf-8",
+        )
+        response["Content-Disposition"] = 'attachment; filename="agenda.ics"'
+        return response
+
+    @action(detail=False, methods=["post"], url_path="import")
+    def import_csv(self, request):
+        """
+        Importe un CSV d'événements (voir `crm.events.importer` pour le format).
+
+        Paramètres :
+          - file (multipart)     : fichier CSV (UTF-8 ou Windows-1252, séparateur `,` ou `;`)
+          - start_row (optionnel): lignes de données déjà importées (reprise)
+        Réponse : {"created", "last_row", "errors": [{"row", "errors"}]}
+        """
+        if request.user.role not in ("GESTION", "COMMERCIAL"):
+            raise PermissionDenied("Import réservé aux rôles GESTION et COMMERCIAL.")
+
+        upload = request.FILES.get("file")
+        if upload is None:
+            raise ValidationError({"file": "Fichier CSV requis."})
+        start_row = request.data.get("start_row") or 0
+        if not str(start_row).isdigit():
+            raise ValidationError({"start_row": "Entier positif attendu."})
+
+        stream = open_csv(upload.file)
+        try:
+            report = import_events(
+                read_csv(stream),
+                user=request.user,
+                chunk_size=DEFAULT_CHUNK_SIZE,
+                start_row=int(start_row),
+            )
+        except RowValidationError as e:
+            raise ValidationError({"file": str(e)})
+
+        code = status.HTTP_201_CREATED if report.created else status.HTTP_200_OK
+        return Response(report.as_dict(), status=code)
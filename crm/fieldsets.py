@@ -0,0 +1,114 @@
+"""
+Champs à la demande (« sparse fieldsets ») pour les lectures des ViewSets CRM.
+
+Paramètres de requête (actions `list` et `retrieve` uniquement) :
+    - `?fields=id,full_name`     : uniquement ces champs ;
+    - `?omit=notes,updated_at`   : tous les champs sauf ceux-ci ;
+    - `?compact=true`            : jeu réduit défini par la vue (`compact_fields`),
+                                   utilisé par les tableaux de la CLI.
+
+La requête SQL suit la sélection : les colonnes non demandées sont différées
+(`only()`) et seules les relations nécessaires aux façades demandées
+(`client_full_name`, `sales_contact_username`, …) sont jointes. Les chemins de
+`sparse_always` restent chargés pour les contrôles d’accès objet
+(`crm.authorization.client_owner_id`).
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.exceptions import ValidationError
+
+SPARSE_ACTIONS = ("list", "retrieve")
+
+
+def _split(value: Optional[str]) -> list[str]:
+    return [name.strip() for name in (value or "").split(",") if name.strip()]
+
+
+def prune_queryset(queryset, serializer_class, fields: Iterable[str], always: Iterable[str] = ()):
+    """
+    Restreint `queryset` aux colonnes et jointures utilisées par `fields` du sérialiseur.
+    Si un champ ne correspond pas à une colonne (méthode, propriété), la requête est laissée intacte.
+    """
+    model = queryset.model
+    serializer_fields = serializer_class().fields
+    columns = {model._meta.pk.name}
+    relations = set()
+
+    # Les annotations du queryset (ex. `has_event`) sont conservées par `only()`
+    paths = [serializer_fields[name].source.replace(".", "__") for name in fields
+             if name not in queryset.query.annotations]
+    for path in [*paths, *always]:
+        head, _, tail = path.partition("__")
+        try:
+            field = model._meta.get_field(head)
+        except FieldDoesNotExist:
+            return queryset
+        columns.add(field.name)
+        if tail:
+            if not field.is_relation or "__" in tail:
+                return queryset
+            relations.add(field.name)
+            columns.add(f"{field.name}__{tail}")
+
+    return queryset.select_related(None).select_related(*relations).only(*columns)
+
+
+class SparseFieldsMixin:
+    """Sérialiseur : ne conserve que les champs listés dans `context["fields"]` (si fourni)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        selected = self.context.get("fields")
+        if selected is not None:
+            for name in set(self.fields) - set(selected):
+                self.fields.pop(name)
+
+
+class SparseFieldsetViewMixin:
+    """
+    ViewSet : lit `fields` / `omit` / `compact`, transmet la sélection au
+    sérialiseur (contexte) et élague le queryset dans `filter_queryset`.
+    """
+    compact_fields: tuple[str, ...] = ()
+    sparse_always: tuple[str, ...] = ()
+
+    def get_sparse_fields(self) -> Optional[list[str]]:
+        """Champs demandés (ordre du sérialiseur), ou None pour la représentation complète."""
+        if hasattr(self, "_sparse_fields"):
+            return self._sparse_fields
+        self._sparse_fields = None
+        if getattr(self, "action", None) not in SPARSE_ACTIONS:
+            return None
+
+        params = self.request.query_params
+        available = list(self.get_serializer_class()().fields)
+        compact = params.get("compact", "").lower() in ("1", "true", "yes")
+        requested = list(self.compact_fields) if compact and self.compact_fields else _split(params.get("fields"))
+        omitted = _split(params.get("omit"))
+
+        unknown = sorted(set(requested + omitted) - set(available))
+        if unknown:
+            raise ValidationError({
+                "fields": [f"Champs inconnus : {', '.join(unknown)}. Disponibles : {', '.join(available)}."]
+            })
+
+        selected = [name for name in available if (not requested or name in requested) and name not in omitted]
+        if len(selected) < len(available):
+            self._sparse_fields = selected
+        return self._sparse_fields
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["fields"] = self.get_sparse_fields()
+        return context
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        fields = self.get_sparse_fields()
+        if fields is None:
+            return queryset
+        return prune_queryset(queryset, self.get_serializer_class(), fields, self.sparse_always)
@@ -0,0 +1,43 @@
+"""
+Génère le schéma OpenAPI une fois par déploiement.
+
+Usage :
+    python manage.py build_schema                  # dans OPENAPI_SCHEMA_DIR
+    python manage.py build_schema --output build/  # dossier explicite
+
+Écrit `openapi.yaml`, `openapi.json` et `openapi.version` (empreinte du code) ; les
+workers qui ont `OPENAPI_SCHEMA_DIR` pointant sur ce dossier les servent sans
+introspection tant que l'empreinte correspond au code déployé (voir `crm.schema`).
+"""
+
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from crm.schema import VERSION_FILE, clear_schema_cache, code_version, render_default_schemas
+
+
+class Command(BaseCommand):
+    help = "Génère les rendus YAML / JSON du schéma OpenAPI servis par /api/schema/."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", help="Dossier de sortie (défaut : OPENAPI_SCHEMA_DIR).")
+
+    def handle(self, *args, **options):
+        output = options.get("output") or settings.OPENAPI_SCHEMA_DIR
+        if not output:
+            raise CommandError("Indiquez --output ou définissez OPENAPI_SCHEMA_DIR.")
+        directory = Path(output)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        # Rendus frais : ni cache mémoire ni fichiers d'un déploiement précédent
+        for name in ("openapi.yaml", "openapi.json", VERSION_FILE):
+            (directory / name).unlink(missing_ok=True)
+        clear_schema_cache()
+
+        for fmt, content in render_default_schemas().items():
+            (directory / f"openapi.{fmt}").write_bytes(content)
+            self.stdout.write(f"📄 {directory / f'openapi.{fmt}'} ({len(content)} octets)")
+        (directory / VERSION_FILE).write_text(code_version() + "\n")
+        self.stdout.write(self.style.SUCCESS("✅ Schéma OpenAPI généré."))
@@ -0,0 +1,27 @@
+"""
+Préchauffe le processus courant et affiche la durée de chaque étape.
+
+Usage :
+    python manage.py warmup           # routes, ViewSets, JWT, i18n, base
+    python manage.py warmup --schema  # + rendu du schéma OpenAPI
+
+Utile pour vérifier le préchauffage exécuté au démarrage des workers
+(`WARMUP_ON_STARTUP`, voir `crm.warmup`).
+"""
+
+from django.core.management.base import BaseCommand
+
+from crm.warmup import warm_up
+
+
+class Command(BaseCommand):
+    help = "Construit à l'avance les structures paresseuses (routes, sérialiseurs, JWT, accès base)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--schema", action="store_true", help="Rend aussi le schéma OpenAPI.")
+
+    def handle(self, *args, **options):
+        timings = warm_up(schema=options["schema"] or None)
+        for step, seconds in timings.items():
+            self.stdout.write(f"🔥 {step:<16} {seconds * 1000:8.1f} ms")
+        self.stdout.write(self.style.SUCCESS(f"✅ Préchauffage terminé ({sum(timings.values()) * 1000:.0f} ms)."))
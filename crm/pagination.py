@@ -0,0 +1,315 @@
+"""
+Politique de pagination par ressource.
+
+Chaque ViewSet déclare sa classe (`pagination_class`) : taille de page par
+défaut adaptée au poids des lignes et plafond strict. Le client choisit sa
+taille avec `?page_size=N` (ramenée au plafond si elle le dépasse) ou
+`?page_size=max` pour la plus grande page autorisée (listes de sélection
+de la CLI).
+
+Total (`count`) : sur PostgreSQL, un `COUNT(*)` parcourt tout le périmètre.
+`EstimatedCountPaginator` demande d'abord une estimation au planificateur
+(`pg_class.reltuples` si le queryset n'est pas filtré, sinon le nombre de lignes
+prévu par `EXPLAIN`) ; au-delà de `PAGINATION_ESTIMATE_THRESHOLD` lignes,
+l'estimation est renvoyée (avec `"count_estimated": true`), en deçà le comptage
+exact reste bon marché. Une estimation ne sert qu'à l'affichage : la validité
+de la page et le lien `next` viennent alors, comme en mode sans total, d'une
+lecture de `page_size + 1` lignes. Le total est mis en cache quelques secondes par
+périmètre (même requête SQL, donc même rôle / filtres) :
+`PAGINATION_COUNT_CACHE_TTL`.
+
+Mode sans total (`?count=false`, utilisé par les tableaux de la CLI) : aucune
+requête de comptage ; la page est lue avec une ligne de plus (`page_size + 1`)
+pour savoir s'il existe une page suivante. La réponse contient `next`,
+`previous` et `results`, sans `count`.
+
+Pagination par clé (`KeysetPagination`, listes de travail parcourues dans
+l'ordre) : la page suivante reprend après la dernière ligne lue
+(`?after=<valeur>,<id>`), par une condition servie par l'index de tri au lieu
+d'un `OFFSET` : chaque page coûte le même prix, quelle que soit sa position.
+La réponse contient `next` et `results`.
+"""
+
+import hashlib
+import json
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+MAX_PAGE_SIZE_KEYWORD = "max"
+COUNT_QUERY_PARAM = "count"
+FALSE_VALUES = ("0", "false", "no")
+COUNT_CACHE_KEY = "pagination:count:{}"
+
+
+def _planner_estimate(queryset) -> Optional[int]:
+    """Nombre de lignes estimé par PostgreSQL, ou None (autre moteur, table jamais analysée)."""
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    query = queryset.query
+    with connection.cursor() as cursor:
+        if not query.where and not query.distinct and not query.is_sliced:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [connection.ops.quote_name(queryset.model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+            if row and row[0] >= 0:
+                return int(row[0])
+
+        sql, params = queryset.order_by().query.sql_with_params()
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _scope_key(queryset) -> Optional[str]:
+    try:
+        sql, params = queryset.order_by().query.sql_with_params()
+    except Exception:  # requête vide (EmptyResultSet) ou non compilable : pas de cache
+        return None
+    digest = hashlib.sha1(f"{queryset.db}|{sql}|{params!r}".encode()).hexdigest()
+    return COUNT_CACHE_KEY.format(digest)
+
+
+class ProbedPage(Page):
+    """Page lue avec une ligne de plus : page suivante connue sans total exact."""
+
+    def __init__(self, object_list, number, paginator, probed_next: bool):
+        super().__init__(object_list, number, paginator)
+        self.probed_next = probed_next
+
+    def has_next(self):
+        return self.probed_next
+
+    def next_page_number(self):
+        return self.number + 1
+
+    def previous_page_number(self):
+        return self.number - 1
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    `Paginator` dont le total vient d'une estimation du planificateur sur les grands
+    périmètres. Le total estimé n'est qu'affiché : `validate_number` ne borne alors
+    pas la page par le haut et `page()` lit `per_page + 1` lignes (`ProbedPage`).
+    """
+
+    is_estimated = False
+
+    def validate_number(self, number):
+        self.count  # noqa: B018 — fixe `is_estimated`
+        if not self.is_estimated:
+            return super().validate_number(number)
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.is_estimated:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+        return ProbedPage(rows[:self.per_page], number, self, probed_next=len(rows) > self.per_page)
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not hasattr(queryset, "query"):
+            return super().count
+        if queryset.query.is_empty():
+            return 0
+
+        ttl = getattr(settings, "PAGINATION_COUNT_CACHE_TTL", 5)
+        key = _scope_key(queryset) if ttl else None
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                self.is_estimated = cached[1]
+                return cached[0]
+
+        threshold = getattr(settings, "PAGINATION_ESTIMATE_THRESHOLD", 10_000)
+        estimate = _planner_estimate(queryset)
+        if estimate is not None and estimate >= threshold:
+            count, self.is_estimated = estimate, True
+        else:
+            count = queryset.count()
+
+        if key is not None:
+            cache.set(key, (count, self.is_estimated), ttl)
+        return count
+
+
+class CRMPagination(PageNumberPagination):
+    """Pagination par numéro de page avec `page_size` choisi par le client, plafonné."""
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    django_paginator_class = EstimatedCountPaginator
+
+    def get_page_size(self, request):
+        if request.query_params.get(self.page_size_query_param, "").strip().lower() == MAX_PAGE_SIZE_KEYWORD:
+            return self.max_page_size
+        return super().get_page_size(request)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.without_count = request.query_params.get(COUNT_QUERY_PARAM, "").lower() in FALSE_VALUES
+        if not self.without_count:
+            return super().paginate_queryset(queryset, request, view)
+
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+        self.request = request
+        raw = request.query_params.get(self.page_query_param, "1")
+        try:
+            self.page_number = int(raw)
+            if self.page_number < 1:
+                raise ValueError
+        except ValueError:
+            raise NotFound(self.invalid_page_message.format(page_number=raw, message="page invalide"))
+
+        offset = (self.page_number - 1) * page_size
+        rows = list(queryset[offset:offset + page_size + 1])
+        self.has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        if not rows and self.page_number > 1:
+            raise NotFound(self.invalid_page_message.format(page_number=self.page_number, message="page vide"))
+        return rows
+
+    def get_paginated_response(self, data):
+        if self.without_count:
+            return Response({
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            })
+        response = super().get_paginated_response(data)
+        if getattr(self.page.paginator, "is_estimated", False):
+            response.data["count_estimated"] = True
+        return response
+
+    def get_next_link(self):
+        if not self.without_count:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), self.page_query_param, self.page_number + 1)
+
+    def get_previous_link(self):
+        if not self.without_count:
+            return super().get_previous_link()
+        if self.page_number <= 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.page_number == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, self.page_number - 1)
+
+
+class ClientPagination(CRMPagination):
+    page_size = 20
+    max_page_size = 200
+
+
+class ContractPagination(CRMPagination):
+    page_size = 20
+    max_page_size = 200
+
+
+class EventPagination(CRMPagination):
+    """Lignes plus lourdes (notes, lieux) : pages plus courtes."""
+    page_size = 10
+    max_page_size = 100
+
+
+class UserPagination(CRMPagination):
+    page_size = 25
+    max_page_size = 200
+
+
+class KeysetPagination(BasePagination):
+    """
+    Pages successives triées sur (`ordering_field`, id), reprises après la
+    dernière ligne lue (`?after=`). Le queryset doit déjà être trié ainsi ;
+    les lignes peuvent être des instances ou des dictionnaires (`values()`).
+    """
+    ordering_field = ""
+    page_size = 25
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    cursor_query_param = "after"
+
+    def get_page_size(self, request) -> int:
+        raw = request.query_params.get(self.page_size_query_param, "").strip().lower()
+        if raw == MAX_PAGE_SIZE_KEYWORD:
+            return self.max_page_size
+        return min(int(raw), self.max_page_size) if raw.isdigit() and int(raw) > 0 else self.page_size
+
+    def _after(self, queryset, raw: str):
+        """Restreint `queryset` aux lignes situées après le curseur `valeur,id`."""
+        value, _, pk = raw.rpartition(",")
+        field = queryset.model._meta.get_field(self.ordering_field)
+        try:
+            value, pk = field.to_python(value), int(pk)
+        except (DjangoValidationError, ValueError):
+            raise NotFound("Curseur de pagination invalide.")
+        name = self.ordering_field
+        # `>=` d'abord : borne basse de l'intervalle lu dans l'index
+        return queryset.filter(Q(**{f"{name}__gte": value}) & (Q(**{f"{name}__gt": value}) | Q(pk__gt=pk)))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        raw = request.query_params.get(self.cursor_query_param)
+        if raw:
+            queryset = self._after(queryset, raw)
+        page_size = self.get_page_size(request)
+        rows = list(queryset[:page_size + 1])
+        self.has_next = len(rows) > page_size
+        self.rows = rows[:page_size]
+        return self.rows
+
+    def _cursor(self, row) -> str:
+        get = row.get if isinstance(row, dict) else lambda name: getattr(row, name)
+        value = get(self.ordering_field)
+        return f"{value.isoformat() if hasattr(value, 'isoformat') else value},{get('id')}"
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param,
+                                   self._cursor(self.rows[-1]))
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+
+class FollowUpPagination(KeysetPagination):
+    """Clients à relancer : du contact le plus ancien au plus récent."""
+    ordering_field = "last_contact"
+    page_size = 25
+    max_page_size = 200
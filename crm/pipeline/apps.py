@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class PipelineConfig(AppConfig):
+    """Application du pipeline commercial (read model maintenu par signaux)."""
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'crm.pipeline'
+
+    def ready(self):
+        # Enregistre les signaux de maintenance incrémentale de PipelineSummary
+        from crm.pipeline import signals  # noqa: F401
@@ -0,0 +1,28 @@
+"""
+Commande de réparation du read model `PipelineSummary`.
+
+Usage :
+    python manage.py rebuild_pipeline            # recalcule tous les commerciaux
+    python manage.py rebuild_pipeline --user 12  # recalcule un seul commercial
+"""
+
+from django.core.management.base import BaseCommand
+
+from crm.pipeline.services import rebuild_all, rebuild_summary
+
+
+class Command(BaseCommand):
+    help = "Recalcule les agrégats du pipeline commercial depuis les tables sources."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, help="ID du commercial à recalculer (sinon : tous).")
+
+    def handle(self, *args, **options):
+        user_id = options.get("user")
+        if user_id:
+            summary = rebuild_summary(user_id)
+            self.stdout.write(self.style.SUCCESS(f"✅ Pipeline recalculé : {summary}"))
+            return
+
+        count = rebuild_all()
+        self.stdout.write(self.style.SUCCESS(f"✅ {count} pipeline(s) recalculé(s)."))
@@ -0,0 +1,35 @@
+# Generated by Django 5.2 on 2026-10-19 11:51
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PipelineSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('clients_count', models.PositiveIntegerField(default=0, verbose_name='Nombre de clients')),
+                ('contracts_count', models.PositiveIntegerField(default=0, verbose_name='Nombre de contrats')),
+                ('unsigned_contracts_count', models.PositiveIntegerField(default=0, verbose_name='Contrats non signés')),
+                ('amount_due_total', models.DecimalField(decimal_places=2, default=Decimal('0'), max_digits=14, verbose_name='Montant total restant dû (€)')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Date de mise à jour')),
+                ('sales_contact', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='pipeline_summary', to=settings.AUTH_USER_MODEL, verbose_name='Commercial')),
+            ],
+            options={
+                'verbose_name': 'Pipeline commercial',
+                'verbose_name_plural': 'Pipelines commerciaux',
+                'ordering': ['sales_contact_id'],
+            },
+        ),
+    ]
@@ -0,0 +1,69 @@
+"""Modèle de lecture (read model) du pipeline commercial.
+
+`PipelineSummary` matérialise, pour chaque commercial (`sales_contact`), les
+agrégats affichés dans sa vue pipeline. Les compteurs sont maintenus de façon
+incrémentale par les signaux de `crm.pipeline.signals` à chaque écriture sur
+`Client` et `Contract` ; aucune agrégation n’est recalculée à la lecture.
+
+La commande `rebuild_pipeline` permet de recalculer l’ensemble en cas de dérive
+(ex. mises à jour en masse via `QuerySet.update()`, qui n’émettent pas de signaux).
+"""
+
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import models
+
+
+class PipelineSummary(models.Model):
+    """Agrégats du pipeline d’un commercial.
+
+    Champs :
+        - sales_contact : commercial concerné (une ligne par commercial).
+        - clients_count : nombre de clients dont il est le `sales_contact`.
+        - contracts_count : nombre de contrats dont il est le `sales_contact`.
+        - unsigned_contracts_count : contrats non signés parmi ceux-ci.
+        - amount_due_total : somme des montants restant dus sur ses contrats.
+        - updated_at : date de dernière modification de la ligne.
+    """
+
+    sales_contact = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="pipeline_summary",
+        verbose_name="Commercial",
+    )
+    clients_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Nombre de clients",
+    )
+    contracts_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Nombre de contrats",
+    )
+    unsigned_contracts_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Contrats non signés",
+    )
+    amount_due_total = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal("0"),
+        verbose_name="Montant total restant dû (€)",
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="Date de mise à jour",
+    )
+
+    class Meta:
+        verbose_name = "Pipeline commercial"
+        verbose_name_plural = "Pipelines commerciaux"
+        ordering = ["sales_contact_id"]
+
+    def __str__(self) -> str:
+        """Représentation lisible (commercial + volumes)."""
+        return (
+            f"Pipeline de {self.sales_contact_id} : {self.clients_count} clients, "
+            f"{self.unsigned_contracts_count} contrats non signés"
+        )
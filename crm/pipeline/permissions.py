@@ -0,0 +1,18 @@
+"""Permissions du pipeline commercial.
+
+- GESTION : lecture de tous les pipelines.
+- COMMERCIAL : lecture de son propre pipeline.
+- SUPPORT : aucun accès.
+"""
+
+from crm.authorization import AccessContext, RolePermission
+
+
+class PipelinePermission(RolePermission):
+    """Lecture seule, réservée aux rôles GESTION et COMMERCIAL."""
+
+    def has_role_permission(self, ctx: AccessContext, method: str) -> bool:
+        return super().has_role_permission(ctx, method) and (ctx.is_gestion or ctx.is_commercial)
+
+    def has_role_object_permission(self, ctx: AccessContext, method: str, obj) -> bool:
+        return ctx.is_gestion or ctx.is_self(obj.sales_contact_id)
@@ -0,0 +1,32 @@
+"""Sérialiseurs du pipeline commercial (lecture seule)."""
+
+from rest_framework import serializers
+
+from crm.pipeline.models import PipelineSummary
+
+
+class PipelineSummarySerializer(serializers.ModelSerializer):
+    """
+    Expose les agrégats matérialisés d’un commercial.
+
+    Champ façade :
+      - `sales_contact_username` : nom d’utilisateur du commercial (lecture seule).
+    """
+
+    sales_contact_username = serializers.CharField(
+        source="sales_contact.username",
+        read_only=True,
+    )
+
+    class Meta:
+        model = PipelineSummary
+        fields = [
+            "sales_contact",
+            "sales_contact_username",
+            "clients_count",
+            "contracts_count",
+            "unsigned_contracts_count",
+            "amount_due_total",
+            "updated_at",
+        ]
+        read_only_fields = fields
@@ -0,0 +1,108 @@
+"""
+Maintenance du read model `PipelineSummary`.
+
+- `apply_delta` : applique des incréments (F() expressions, une seule requête UPDATE)
+  sur la ligne d’un commercial ; si la ligne n’existe pas encore, elle est calculée
+  à partir de l’état courant de la base (auto-réparation, sans double comptage).
+- `rebuild_summary` : recalcule la ligne d’un commercial (3 agrégats indexés).
+- `rebuild_all` : recalcule toutes les lignes (commande `rebuild_pipeline`).
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Optional
+
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+
+from crm.clients.models import Client
+from crm.contracts.models import Contract
+from crm.pipeline.models import PipelineSummary
+
+
+def _contract_aggregates(qs) -> dict:
+    return qs.aggregate(
+        contracts_count=Count("id"),
+        unsigned_contracts_count=Count("id", filter=Q(is_signed=False)),
+        amount_due_total=Sum("amount_due"),
+    )
+
+
+def rebuild_summary(user_id: int) -> PipelineSummary:
+    """Recalcule (et enregistre) la ligne du commercial `user_id` depuis les tables sources."""
+    contracts = _contract_aggregates(Contract.objects.filter(sales_contact_id=user_id))
+    values = {
+        "clients_count": Client.objects.filter(sales_contact_id=user_id).count(),
+        "contracts_count": contracts["contracts_count"],
+        "unsigned_contracts_count": contracts["unsigned_contracts_count"],
+        "amount_due_total": contracts["amount_due_total"] or Decimal("0"),
+    }
+    summary, _ = PipelineSummary.objects.update_or_create(sales_contact_id=user_id, defaults=values)
+    return summary
+
+
+def apply_delta(user_id: Optional[int], **deltas) -> None:
+    """
+    Incrémente les compteurs du commercial `user_id` (ex. clients_count=1).
+
+    Appelée depuis les signaux post_save / post_delete : la base reflète déjà
+    l’écriture, donc si la ligne n’existe pas encore, un recalcul de ce seul
+    commercial donne directement la bonne valeur (le delta n’est pas réappliqué).
+    """
+    deltas = {k: v for k, v in deltas.items() if v}
+    if user_id is None or not deltas:
+        return
+
+    updated = PipelineSummary.objects.filter(sales_contact_id=user_id).update(
+        updated_at=timezone.now(),
+        **{field: F(field) + value for field, value in deltas.items()},
+    )
+    if not updated:
+        rebuild_summary(user_id)
+
+
+@transaction.atomic
+def rebuild_all() -> int:
+    """
+    Recalcule toutes les lignes en 2 requêtes d’agrégation groupées par commercial
+    (au lieu d’un recalcul par utilisateur) puis les réécrit. Retourne le nombre de lignes.
+    """
+    rows: dict[int, dict] = {}
+
+    for row in (
+        Client.objects.filter(sales_contact__isnull=False)
+        .values("sales_contact_id")
+        .annotate(n=Count("id"))
+        .order_by()
+    ):
+        rows.setdefault(row["sales_contact_id"], {})["clients_count"] = row["n"]
+
+    for row in (
+        Contract.objects.filter(sales_contact__isnull=False)
+        .values("sales_contact_id")
+        .annotate(
+            contracts_count=Count("id"),
+            unsigned_contracts_count=Count("id", filter=Q(is_signed=False)),
+            amount_due_total=Sum("amount_due"),
+        )
+        .order_by()
+    ):
+        rows.setdefault(row.pop("sales_contact_id"), {}).update(row)
+
+    PipelineSummary.objects.all().delete()
+    PipelineSummary.objects.bulk_create(
+        [
+            PipelineSummary(
+                sales_contact_id=user_id,
+                clients_count=values.get("clients_count", 0),
+                contracts_count=values.get("contracts_count", 0),
+                unsigned_contracts_count=values.get("unsigned_contracts_count", 0),
+                amount_due_total=values.get("amount_due_total") or Decimal("0"),
+            )
+            for user_id, values in rows.items()
+        ],
+        batch_size=1000,
+    )
+    return len(rows)
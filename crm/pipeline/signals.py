@@ -0,0 +1,151 @@
+"""
+Signaux maintenant `PipelineSummary` de façon incrémentale.
+
+Principe :
+  - `post_init` mémorise la contribution d’une instance (commercial + valeurs utiles)
+    telle que chargée depuis la base, sans requête supplémentaire ;
+  - `pre_save` relit en base la contribution enregistrée si elle est inconnue
+    (champs différés), pour que l’ancien commercial soit lui aussi mis à jour ;
+  - `post_save` retire l’ancienne contribution et ajoute la nouvelle ;
+  - `post_delete` retire la contribution de l’instance supprimée
+    (y compris lors des suppressions en cascade d’un client).
+
+Les mises à jour en masse (`QuerySet.update()`) n’émettent pas de signaux :
+utiliser ensuite `python manage.py rebuild_pipeline`.
+"""
+
+from decimal import Decimal
+
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from django.dispatch import receiver
+
+from crm.clients.models import Client
+from crm.contracts.models import Contract
+from crm.pipeline.services import apply_delta, rebuild_summary
+
+_STATE_ATTR = "_pipeline_state"
+
+# État inconnu : instance chargée avec des champs différés (`only()` / `defer()`).
+# On lit `instance.__dict__` pour ne jamais déclencher de requête dans `post_init`.
+UNKNOWN = object()
+
+
+def _client_state(instance: Client):
+    return instance.__dict__.get("sales_contact_id", UNKNOWN)
+
+
+CONTRACT_STATE_FIELDS = ("sales_contact_id", "is_signed", "amount_due")
+
+
+def _contract_state(instance: Contract):
+    return _contract_values_state(instance.__dict__)
+
+
+def _contract_values_state(values: dict):
+    if not all(f in values for f in CONTRACT_STATE_FIELDS):
+        return UNKNOWN
+    amount_due = values["amount_due"]
+    return (
+        values["sales_contact_id"],
+        bool(values["is_signed"]),
+        Decimal(str(amount_due)) if amount_due is not None else Decimal("0"),
+    )
+
+
+def _contract_contribution(state, sign: int) -> dict:
+    _, is_signed, amount_due = state
+    return {
+        "contracts_count": sign,
+        "unsigned_contracts_count": 0 if is_signed else sign,
+        "amount_due_total": amount_due * sign,
+    }
+
+
+def _merge(a: dict, b: dict) -> dict:
+    return {k: a.get(k, 0) + b.get(k, 0) for k in {*a, *b}}
+
+
+def _rebuild_owners(*owners) -> None:
+    """Repli si un état est inconnu : recalcul ciblé des commerciaux concernés."""
+    for owner in {o for o in owners if o is not None and o is not UNKNOWN}:
+        rebuild_summary(owner)
+
+
+# ——————————————————————————————————————————————————————————————
+# Client → clients_count
+# ——————————————————————————————————————————————————————————————
+
+@receiver(post_init, sender=Client)
+def _client_post_init(sender, instance, **kwargs):
+    setattr(instance, _STATE_ATTR, _client_state(instance) if instance.pk else None)
+
+
+@receiver(pre_save, sender=Client)
+def _client_pre_save(sender, instance, **kwargs):
+    if getattr(instance, _STATE_ATTR, None) is UNKNOWN:
+        stored = Client.objects.filter(pk=instance.pk).values_list("sales_contact_id", flat=True).first()
+        setattr(instance, _STATE_ATTR, stored)
+
+
+@receiver(post_save, sender=Client)
+def _client_post_save(sender, instance, created, **kwargs):
+    old_owner = None if created else getattr(instance, _STATE_ATTR, None)
+    new_owner = instance.sales_contact_id
+    if old_owner is UNKNOWN:
+        _rebuild_owners(new_owner)
+    elif created or old_owner != new_owner:
+        apply_delta(old_owner, clients_count=-1)
+        apply_delta(new_owner, clients_count=1)
+    setattr(instance, _STATE_ATTR, new_owner)
+
+
+@receiver(post_delete, sender=Client)
+def _client_post_delete(sender, instance, **kwargs):
+    apply_delta(instance.sales_contact_id, clients_count=-1)
+
+
+# ——————————————————————————————————————————————————————————————
+# Contract → contracts_count, unsigned_contracts_count, amount_due_total
+# ——————————————————————————————————————————————————————————————
+
+@receiver(post_init, sender=Contract)
+def _contract_post_init(sender, instance, **kwargs):
+    setattr(instance, _STATE_ATTR, _contract_state(instance) if instance.pk else None)
+
+
+@receiver(pre_save, sender=Contract)
+def _contract_pre_save(sender, instance, **kwargs):
+    if getattr(instance, _STATE_ATTR, None) is UNKNOWN:
+        stored = Contract.objects.filter(pk=instance.pk).values(*CONTRACT_STATE_FIELDS).first()
+        setattr(instance, _STATE_ATTR, _contract_values_state(stored) if stored else None)
+
+
+@receiver(post_save, sender=Contract)
+def _contract_post_save(sender, instance, created, **kwargs):
+    old_state = None if created else getattr(instance, _STATE_ATTR, None)
+    new_state = _contract_state(instance)
+
+    if old_state is UNKNOWN or new_state is UNKNOWN:
+        old_owner = old_state[0] if isinstance(old_state, tuple) else None
+        _rebuild_owners(old_owner, instance.sales_contact_id)
+    elif old_state is None:
+        apply_delta(new_state[0], **_contract_contribution(new_state, +1))
+    elif old_state != new_state:
+        removed = _contract_contribution(old_state, -1)
+        added = _contract_contribution(new_state, +1)
+        if old_state[0] == new_state[0]:
+            apply_delta(new_state[0], **_merge(removed, added))
+        else:
+            apply_delta(old_state[0], **removed)
+            apply_delta(new_state[0], **added)
+
+    setattr(instance, _STATE_ATTR, new_state)
+
+
+@receiver(post_delete, sender=Contract)
+def _contract_post_delete(sender, instance, **kwargs):
+    state = _contract_state(instance)
+    if state is UNKNOWN:
+        _rebuild_owners(instance.sales_contact_id)
+        return
+    apply_delta(state[0], **_contract_contribution(state, -1))
@@ -0,0 +1,17 @@
+"""
+Routeur DRF pour l'API du pipeline commercial.
+
+Inclus dans `epic_crm/urls.py` via :
+      path('api/pipeline/', include('crm.pipeline.urls'))
+"""
+
+from rest_framework.routers import DefaultRouter
+
+from crm.pipeline.views import PipelineSummaryViewSet
+
+app_name = "pipeline"
+
+router = DefaultRouter()
+router.register(r"", PipelineSummaryViewSet, basename="pipeline")
+
+urlpatterns = router.urls
@@ -0,0 +1,63 @@
+"""
+ViewSet du pipeline commercial.
+
+Règles d'accès :
+    - GESTION    : liste / détail de tous les pipelines.
+    - COMMERCIAL : uniquement son propre pipeline (`GET /api/pipeline/me/`).
+    - SUPPORT    : aucun accès.
+
+Les agrégats sont lus tels quels depuis `PipelineSummary` (maintenu par signaux) ;
+seuls les prochains événements sont lus à la demande (requête bornée, indexée sur `event_start`).
+"""
+
+from django.utils import timezone
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from crm.events.models import Event
+from crm.pipeline.models import PipelineSummary
+from crm.pipeline.permissions import PipelinePermission
+from crm.pipeline.serializers import PipelineSummarySerializer
+from crm.pipeline.services import rebuild_summary
+
+# Nombre de prochains événements renvoyés avec le pipeline
+UPCOMING_EVENTS_LIMIT = 5
+
+
+class PipelineSummaryViewSet(viewsets.ReadOnlyModelViewSet):
+    """Lecture des pipelines commerciaux matérialisés."""
+    serializer_class = PipelineSummarySerializer
+    permission_classes = [PipelinePermission]
+
+    def get_queryset(self):
+        """GESTION : tous les pipelines ; COMMERCIAL : le sien uniquement."""
+        user = self.request.user
+        qs = PipelineSummary.objects.select_related("sales_contact")
+
+        if user.role == "GESTION":
+            return qs
+        if user.role == "COMMERCIAL":
+            return qs.filter(sales_contact=user)
+        return PipelineSummary.objects.none()
+
+    @action(detail=False, methods=["get"], url_path="me")
+    def me(self, request):
+        """
+        Pipeline de l'utilisateur connecté + ses prochains événements.
+
+        Si la ligne n'existe pas encore (commercial sans historique), elle est
+        calculée une seule fois puis maintenue par les signaux.
+        """
+        user = request.user
+        summary = self.get_queryset().filter(sales_contact=user).first() or rebuild_summary(user.id)
+
+        upcoming = list(
+            Event.objects.filter(client__sales_contact=user, event_start__gte=timezone.now())
+            .order_by("event_start")
+            .values("id", "event_name", "event_start", "location", "client_id")[:UPCOMING_EVENTS_LIMIT]
+        )
+
+        data = PipelineSummarySerializer(summary).data
+        data["upcoming_events"] = upcoming
+        return Response(data)
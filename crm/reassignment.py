@@ -0,0 +1,120 @@
+"""
+Réaffectation en masse du portefeuille d’un collaborateur vers un autre.
+
+Au départ d’un commercial ou d’un support, ses clients, contrats et événements
+changent de responsable en une instruction UPDATE par table, dans une seule
+transaction (tout ou rien), au lieu d’un PATCH par objet. Un sous-ensemble peut
+être ciblé (`client_ids`) et un essai à blanc (`dry_run`) ne fait que compter.
+
+Les tables déplacées dépendent du rôle du destinataire : `sales_contact` des
+clients et contrats vers un COMMERCIAL, `support_contact` des événements vers
+un SUPPORT. `QuerySet.update()` n’émet pas les signaux du pipeline : les lignes
+`PipelineSummary` des deux commerciaux sont recalculées après l’écriture.
+
+L’UPDATE des événements contourne aussi le contrôle de double réservation fait
+à la création / modification (`crm.events.conflicts`) : les créneaux déplacés
+sont donc confrontés à ceux déjà tenus par le destinataire (`detect_conflicts`).
+L’essai à blanc liste ces conflits ; le transfert est refusé s’il y en a, sauf
+`allow_conflicts`.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from crm.clients.models import Client
+from crm.contracts.models import Contract
+from crm.events.conflicts import detect_conflicts
+from crm.events.models import Event
+from crm.pipeline.services import rebuild_summary
+
+# {ressource: (modèle, champ responsable, rôle attendu du destinataire)}
+RESOURCES = {
+    "clients": (Client, "sales_contact", "COMMERCIAL"),
+    "contracts": (Contract, "sales_contact", "COMMERCIAL"),
+    "events": (Event, "support_contact", "SUPPORT"),
+}
+
+
+def resources_for_role(role: str) -> list[str]:
+    """Ressources qu’un collaborateur de rôle `role` peut recevoir."""
+    return [name for name, (_, _, expected) in RESOURCES.items() if expected == role]
+
+
+def _queryset(resource: str, source_id: int, client_ids: Optional[Iterable[int]]):
+    model, field, _ = RESOURCES[resource]
+    qs = model.objects.filter(**{f"{field}_id": source_id})
+    if client_ids is not None:
+        qs = qs.filter(**{"pk__in" if model is Client else "client_id__in": list(client_ids)})
+    return qs
+
+
+def event_conflicts(source_id: int, target_id: int, client_ids: Optional[Iterable[int]] = None) -> list[dict]:
+    """
+    Paires {"event", "conflicts_with"} entre un événement qui passerait de
+    `source_id` à `target_id` et un événement que `target_id` suit déjà sur un
+    créneau qui le chevauche. Une seule lecture triée, balayée comme si tous les
+    événements appartenaient déjà au destinataire.
+    """
+    moved = _queryset("events", source_id, client_ids)
+    rows = (
+        Event.objects.filter(Q(support_contact_id=target_id) | Q(pk__in=moved.values("pk")))
+        .order_by("event_start", "id")
+        .values_list("id", "support_contact_id", "event_start", "event_end")
+    )
+    moved_ids = set()
+    swept = []
+    for pk, support_id, start, end in rows:
+        if support_id != target_id:
+            moved_ids.add(pk)
+        swept.append((pk, target_id, None, start, end))
+
+    pairs = []
+    for conflict in detect_conflicts(swept):
+        first, second = conflict["events"]
+        if (first in moved_ids) != (second in moved_ids):
+            event, other = (first, second) if first in moved_ids else (second, first)
+            pairs.append({"event": event, "conflicts_with": other})
+    return pairs
+
+
+def reassign_portfolio(source, target, resources: Iterable[str], client_ids: Optional[Iterable[int]] = None,
+                       dry_run: bool = False, allow_conflicts: bool = False) -> dict:
+    """
+    Transfère à `target` les `resources` suivies par `source` (limitées à `client_ids`
+    si fourni) ; retourne {ressource: lignes concernées}, plus `conflicts` (voir
+    `event_conflicts`) si des événements sont déplacés. `dry_run` : compte sans écrire.
+
+    Lève une `ValidationError` (HTTP 400) si des événements déplacés chevauchent
+    ceux du destinataire, sauf `allow_conflicts`.
+    """
+    resources = [r for r in RESOURCES if r in set(resources)]
+    if dry_run:
+        counts = {r: _queryset(r, source.pk, client_ids).count() for r in resources}
+        if "events" in resources:
+            counts["conflicts"] = event_conflicts(source.pk, target.pk, client_ids)
+        return counts
+
+    now = timezone.now()
+    with transaction.atomic():
+        conflicts = event_conflicts(source.pk, target.pk, client_ids) if "events" in resources else []
+        if conflicts and not allow_conflicts:
+            raise ValidationError({"events": [
+                f"L’événement #{c['event']} chevauche l’événement #{c['conflicts_with']} "
+                f"déjà affecté au destinataire." for c in conflicts
+            ]})
+        counts = {
+            r: _queryset(r, source.pk, client_ids).update(**{RESOURCES[r][1]: target, "updated_at": now})
+            for r in resources
+        }
+        if counts.get("clients") or counts.get("contracts"):
+            rebuild_summary(source.pk)
+            rebuild_summary(target.pk)
+    if "events" in resources:
+        counts["conflicts"] = conflicts
+    return counts
@@ -0,0 +1,81 @@
+"""
+Rendu et lecture JSON accélérés (optionnels).
+
+Si `orjson` est installé (`pip install orjson`), `FastJSONRenderer` et
+`FastJSONParser` l’utilisent ; sinon ils se comportent exactement comme les
+classes DRF dont ils héritent. La sortie est identique octet pour octet à celle
+de `JSONRenderer` en mode compact (réglages DRF par défaut) : UTF-8 non échappé,
+séparateurs courts, `\\u2028` / `\\u2029` échappés. Les types inconnus d’orjson
+(chaînes paresseuses, Decimal, QuerySet…) passent par l’encodeur de DRF.
+orjson écrit NaN et ±inf comme `null` là où DRF refuse ces flottants (« Out of
+range float values ») : si la sortie contient `null`, les données sont vérifiées
+et le rendu est confié à DRF dès qu’un flottant non fini est présent (même erreur).
+L’indentation (navigateur, `; indent=4`) reste confiée à DRF.
+"""
+
+import math
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    orjson = None
+
+_default = encoders.JSONEncoder().default
+
+
+def _has_non_finite(data) -> bool:
+    """Vrai si `data` contient un flottant NaN ou infini (parcours des dict / listes / tuples)."""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+class FastJSONRenderer(JSONRenderer):
+    """`JSONRenderer` servi par orjson lorsque la sortie compacte standard est demandée."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Cas non couverts (ex. entiers > 64 bits) : rendu DRF
+            return super().render(data, accepted_media_type, renderer_context)
+        if b"null" in ret and _has_non_finite(data):
+            # NaN / ±inf rendus `null` par orjson : DRF lève son erreur habituelle
+            return super().render(data, accepted_media_type, renderer_context)
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+class FastJSONParser(JSONParser):
+    """`JSONParser` servi par orjson (corps UTF-8)."""
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get("encoding", "utf-8")
+        if orjson is None or encoding.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -0,0 +1,152 @@
+"""
+Schéma OpenAPI mis en cache (`/api/schema/`, utilisé par `/api/docs/` et `/api/redoc/`).
+
+`SpectacularAPIView` inspecte tous les ViewSets et sérialiseurs à chaque appel.
+`CachedSpectacularAPIView` rend le schéma une fois par variante (format YAML / JSON
+négocié, `lang`, `version`) puis sert les octets depuis la mémoire du processus,
+avec un `ETag` : un client qui renvoie `If-None-Match` reçoit `304` sans corps.
+
+Par déploiement, `python manage.py build_schema` écrit les rendus par défaut dans
+`OPENAPI_SCHEMA_DIR`, avec `openapi.version` : l’empreinte du code qui les a produits
+(`code_version()` : sources de `crm/` et `epic_crm/`, versions de Django, DRF et
+drf-spectacular). Les workers ne lisent ces fichiers que si l’empreinte est celle
+du code en cours ; sinon (déploiement sans `build_schema`), le schéma est régénéré
+et un avertissement journalisé. En `DEBUG`, le cache est désactivé (le code change
+à chaud).
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import logging
+from importlib.metadata import PackageNotFoundError, version as package_version
+from pathlib import Path
+from typing import Optional
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.test import RequestFactory
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from drf_spectacular.views import SpectacularAPIView
+
+logger = logging.getLogger("crm.schema")
+
+# {(format, media_type, version, lang): (content, content_type, etag, disposition)}
+_rendered: dict[tuple, tuple] = {}
+
+# Variantes par défaut (écrites par `build_schema`, préchargées)
+DEFAULT_MEDIA_TYPES = ("application/vnd.oai.openapi", "application/vnd.oai.openapi+json")
+VERSION_FILE = "openapi.version"
+# Code dont dépend le schéma (relatif à BASE_DIR) et paquets qui le produisent
+SOURCE_DIRS = ("crm", "epic_crm")
+PACKAGES = ("django", "djangorestframework", "drf-spectacular", "djangorestframework-simplejwt")
+
+
+def _schema_dir() -> Optional[Path]:
+    path = getattr(settings, "OPENAPI_SCHEMA_DIR", "")
+    return Path(path) if path else None
+
+
+def _etag(content: bytes) -> str:
+    return '"{}"'.format(hashlib.sha256(content).hexdigest()[:32])
+
+
+def clear_schema_cache() -> None:
+    _rendered.clear()
+    code_version.cache_clear()
+
+
+@functools.cache
+def code_version() -> str:
+    """Empreinte (sha256) des sources du projet et des versions des paquets ; calculée une fois par processus."""
+    digest = hashlib.sha256()
+    for name in PACKAGES:
+        try:
+            digest.update(f"{name}=={package_version(name)}\n".encode())
+        except PackageNotFoundError:
+            digest.update(f"{name}\n".encode())
+    base = Path(settings.BASE_DIR)
+    for path in sorted(p for d in SOURCE_DIRS for p in (base / d).rglob("*.py")):
+        digest.update(str(path.relative_to(base)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def stored_version(directory: Path) -> Optional[str]:
+    try:
+        return (directory / VERSION_FILE).read_text().strip()
+    except OSError:
+        return None
+
+
+class ClaimsJWTScheme(SimpleJWTScheme):
+    """Documente `ClaimsJWTAuthentication` comme le schéma Bearer JWT de SimpleJWT."""
+    target_class = "crm.users.authentication.ClaimsJWTAuthentication"
+
+
+class CachedSpectacularAPIView(SpectacularAPIView):
+    """`SpectacularAPIView` servi depuis un rendu en mémoire (ou sur disque), avec ETag."""
+    # True : cache utilisé même en DEBUG (commande `build_schema`)
+    force_cache = False
+
+    def _get_schema_response(self, request):
+        if settings.DEBUG and not self.force_cache:
+            return super()._get_schema_response(request)
+
+        renderer, media_type = request.accepted_renderer, request.accepted_media_type
+        version = self.api_version or request.version or self._get_version_parameter(request)
+        key = (renderer.format, media_type, version, request.GET.get("lang"))
+
+        entry = _rendered.get(key)
+        if entry is None:
+            entry = _rendered[key] = self._load(request, renderer, media_type, version, key)
+        content, content_type, etag, disposition = entry
+
+        if etag in _if_none_match(request):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(content, content_type=content_type)
+            response["Content-Disposition"] = disposition
+        response["ETag"] = etag
+        return response
+
+    def _load(self, request, renderer, media_type, version, key) -> tuple:
+        content_type = f"{media_type}; charset={renderer.charset}" if renderer.charset else media_type
+        disposition = f'inline; filename="{self._get_filename(request, version)}"'
+
+        path = self._disk_path(key)
+        if path is not None and path.exists() and stored_version(path.parent) == code_version():
+            content = path.read_bytes()
+        else:
+            if path is not None and path.exists():
+                logger.warning("%s ne correspond pas au code déployé : schéma régénéré "
+                               "(relancer `manage.py build_schema`)", path)
+            response = super()._get_schema_response(request)
+            content = renderer.render(response.data, media_type, self.get_renderer_context())
+        return content, content_type, _etag(content), disposition
+
+    @staticmethod
+    def _disk_path(key) -> Optional[Path]:
+        directory = _schema_dir()
+        fmt, media_type, version, lang = key
+        if directory is None or version or lang or media_type not in DEFAULT_MEDIA_TYPES:
+            return None
+        return directory / f"openapi.{fmt}"
+
+
+def _if_none_match(request) -> set[str]:
+    header = request.META.get("HTTP_IF_NONE_MATCH", "")
+    # Un ETag affaibli par la compression (W/"...") désigne le même contenu
+    return {tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()}
+
+
+def render_default_schemas() -> dict[str, bytes]:
+    """Rend les variantes par défaut (YAML, JSON) et remplit le cache ; {format: contenu}."""
+    view = CachedSpectacularAPIView.as_view(force_cache=True)
+    rendered = {}
+    for media_type in DEFAULT_MEDIA_TYPES:
+        request = RequestFactory().get("/api/schema/", HTTP_ACCEPT=media_type)
+        response = view(request)
+        rendered["json" if media_type.endswith("+json") else "yaml"] = response.content
+    return rendered
@@ -0,0 +1,95 @@
+"""
+Normalisation de texte et recherche par préfixe sur colonne indexée.
+
+`normalize()` produit la clé de recherche stockée à côté des noms (`Client.search_name`,
+`Client.search_company`, `User.search_username`) : minuscules, accents retirés,
+ponctuation et espaces multiples réduits à une espace. « Élodie  Dupont-Martin »
+devient « elodie dupont martin ».
+
+Clés de rapprochement (détection des doublons, `crm.clients.duplicates`) :
+    - `email_key()` : adresse en minuscules ;
+    - `phone_key()` : chiffres seuls, indicatif +33 / 0033 ramené au 0 national ;
+    - `token_key()` : mots normalisés triés, sans doublon ni mot vide
+      (« Dupont & Fils SARL » et « SARL Dupont et Fils » donnent « dupont fils »).
+
+`prefix_filter()` traduit « commence par » en condition servie par l’index de
+la colonne normalisée (`PrefixIndex`), et `prefix_key()` donne l’expression de
+tri correspondante. La condition est un intervalle `>= 'pré' AND < 'prf'` en
+comparaison binaire, lu sur l’index B-tree qui rend aussi les lignes déjà triées :
+    - PostgreSQL : sur `search_x COLLATE "C"`, indexée telle quelle. Sous la
+      collation de la base, un index `varchar_pattern_ops` servirait `LIKE 'pré%'`
+      mais pas le tri : toutes les correspondances seraient triées avant le `LIMIT` ;
+    - autres bases (SQLite) : sur la colonne elle-même (comparaison binaire par défaut).
+Les clés étant en ASCII, l’ordre binaire est aussi celui de Python (fusion des
+résultats de plusieurs colonnes).
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+
+from django.db import connection, models
+from django.db.models import F, Q
+from django.db.models.functions import Collate
+from django.db.models.lookups import GreaterThanOrEqual, LessThan
+
+_SEPARATORS = re.compile(r"[^0-9a-z]+")
+_NON_DIGITS = re.compile(r"\D+")
+
+# Formes juridiques et mots de liaison ignorés dans les noms d'entreprise
+COMPANY_STOPWORDS = frozenset({
+    "sa", "sas", "sasu", "sarl", "eurl", "sci", "snc", "scop", "inc", "ltd", "llc", "gmbh",
+    "co", "cie", "et", "and", "group", "groupe", "the", "le", "la", "les",
+})
+
+
+def normalize(text: str | None) -> str:
+    """Clé de recherche de `text` (minuscules ASCII, chiffres, espaces simples)."""
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    ascii_text = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _SEPARATORS.sub(" ", ascii_text).strip()
+
+
+def email_key(email: str | None) -> str:
+    """Adresse e-mail comparable (« Jean.Dupont@Exemple.fr » → « jean.dupont@exemple.fr »)."""
+    return (email or "").strip().casefold()
+
+
+def phone_key(phone: str | None) -> str:
+    """Numéro comparable (chiffres seuls, format national français) ; "" si trop court."""
+    digits = _NON_DIGITS.sub("", phone or "")
+    if digits.startswith("00"):
+        digits = digits[2:]
+    if digits.startswith("33") and len(digits) == 11:
+        digits = "0" + digits[2:]
+    return digits if len(digits) >= 6 else ""
+
+
+def token_key(text: str | None, stopwords: frozenset = frozenset()) -> str:
+    """Mots normalisés de `text`, triés et dédoublonnés, hors `stopwords`."""
+    return " ".join(sorted({word for word in normalize(text).split() if word not in stopwords}))
+
+
+class PrefixIndex(models.Index):
+    """Index de `prefix_filter()` / `prefix_key()` : colonnes sous la collation "C" sous PostgreSQL."""
+
+    def create_sql(self, model, schema_editor, using="", **kwargs):
+        if schema_editor.connection.vendor != "postgresql":
+            return super().create_sql(model, schema_editor, using=using, **kwargs)
+        index = models.Index(*(Collate(F(field), "C") for field in self.fields), name=self.name)
+        return index.create_sql(model, schema_editor, using=using, **kwargs)
+
+
+def prefix_key(field: str):
+    """Expression de tri servie par le `PrefixIndex` de `field` (ordre binaire)."""
+    return Collate(F(field), "C") if connection.vendor == "postgresql" else F(field)
+
+
+def prefix_filter(field: str, prefix: str) -> Q:
+    """Condition « `field` commence par `prefix` » (`prefix` déjà normalisé, non vide)."""
+    key = prefix_key(field)
+    upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    return Q(GreaterThanOrEqual(key, prefix), LessThan(key, upper))
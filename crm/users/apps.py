@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class UsersConfig(AppConfig):
+    """Application utilisateurs (révocation des claims JWT maintenue par signaux)."""
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'crm.users'
+
+    def ready(self):
+        # Enregistre les signaux d'invalidation (profil en cache, claims des tokens)
+        from crm.users import signals  # noqa: F401
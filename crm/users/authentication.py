@@ -0,0 +1,167 @@
+"""
+Authentification JWT sans lecture systématique de la table des utilisateurs.
+
+- `RoleTokenObtainPairSerializer` : ajoute au token les claims `role`, `username`
+  et `auth_time` (instant de connexion, recopié dans les access tokens rafraîchis) ;
+  la réponse de connexion embarque aussi le profil (`user`, voir `crm.users.profile`).
+- `ClaimsJWTAuthentication` :
+    * méthodes sûres (GET, HEAD, OPTIONS) : utilisateur léger construit à partir des
+      claims (instance `User` non rechargée, aucune requête SQL) ;
+    * écritures : utilisateur réel, servi par un cache en mémoire du processus à durée
+      de vie courte (`AUTH_USER_CACHE_TTL`, 30 s par défaut) ; chaque requête reçoit
+      sa propre copie de l’instance (threads concurrents, modifications locales) ;
+    * tokens émis avant une révocation (`revoke_user_tokens`, appelée par les
+      signaux de `crm.users.signals` à chaque changement de rôle, désactivation ou
+      suppression) : repli sur la base, comme `JWTAuthentication` (rôle à jour,
+      utilisateur supprimé/inactif refusé).
+
+Les marqueurs de révocation sont stockés dans le cache Django (`default`) : en
+déploiement multi-processus, configurer un cache partagé (Redis, Memcached) pour
+qu’un changement de rôle soit vu par tous les workers.
+"""
+
+from __future__ import annotations
+
+import copy
+import time
+from threading import Lock
+from typing import Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.settings import api_settings
+
+from crm.users.profile import remember_profile
+
+User = get_user_model()
+
+REVOCATION_KEY = "auth:revoked:{}"
+
+
+def _revocation_ttl() -> int:
+    """Un marqueur doit survivre à tous les tokens émis avant lui (durée du refresh token)."""
+    return int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds())
+
+
+class _UserCache:
+    """
+    Cache des utilisateurs (écritures) : {user_id: (expiration, user)}, propre au
+    processus. `get` / `set` copient l’instance : aucune n’est partagée entre requêtes.
+    """
+
+    def __init__(self):
+        self._entries: dict[int, tuple[float, object]] = {}
+        self._lock = Lock()
+
+    @property
+    def ttl(self) -> float:
+        return getattr(settings, "AUTH_USER_CACHE_TTL", 30)
+
+    def get(self, user_id: int):
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return copy.copy(entry[1])
+
+    def set(self, user_id: int, user) -> None:
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl, copy.copy(user))
+
+    def discard(self, user_id: int) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+user_cache = _UserCache()
+
+
+def revoke_user_tokens(user_id: int) -> None:
+    """
+    Invalide les claims des tokens déjà émis pour `user_id` (changement de rôle,
+    désactivation, suppression) : ils restent utilisables mais l’utilisateur est
+    alors relu en base à chaque requête, jusqu’à la prochaine connexion.
+    """
+    cache.set(REVOCATION_KEY.format(user_id), time.time(), timeout=_revocation_ttl())
+    user_cache.discard(user_id)
+
+
+def is_revoked(user_id, auth_time: Optional[float]) -> bool:
+    """Vrai si une révocation de `user_id` est postérieure à la connexion `auth_time`."""
+    if auth_time is None:
+        return True
+    revoked_at: Optional[float] = cache.get(REVOCATION_KEY.format(user_id))
+    return revoked_at is not None and auth_time <= revoked_at
+
+
+def claims_are_current(validated_token) -> bool:
+    """Vrai si le rôle porté par le token peut être utilisé sans relire l’utilisateur."""
+    if "role" not in validated_token:
+        return False
+    return not is_revoked(validated_token[api_settings.USER_ID_CLAIM], validated_token.get("auth_time"))
+
+
+class RoleTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Token de connexion enrichi des claims nécessaires à `ClaimsJWTAuthentication`, plus le profil."""
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        # `self.user` est déjà chargé par l'authentification : aucune requête de plus
+        data["user"] = remember_profile(self.user)
+        return data
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token["role"] = user.role
+        token["username"] = user.username
+        token["auth_time"] = time.time()
+        return token
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """`JWTAuthentication` qui évite la requête utilisateur quand les claims suffisent."""
+
+    def authenticate(self, request):
+        result = super().authenticate(request)
+        if result is None:
+            return None
+        _, validated_token = result
+        return self.resolve_user(validated_token, request.method in SAFE_METHODS), validated_token
+
+    def get_user(self, validated_token):
+        # L'utilisateur est résolu dans `resolve_user`, qui connaît la méthode HTTP.
+        return None
+
+    def resolve_user(self, validated_token, safe: bool):
+        if not claims_are_current(validated_token):
+            return super().get_user(validated_token)
+
+        user_id = validated_token[api_settings.USER_ID_CLAIM]
+        if safe:
+            return self.token_user(validated_token)
+
+        user = user_cache.get(user_id)
+        if user is None:
+            user = super().get_user(validated_token)
+            user_cache.set(user_id, user)
+        return user
+
+    def token_user(self, validated_token):
+        """Instance `User` minimale (id, username, rôle) construite sans requête SQL."""
+        user = User(
+            id=validated_token[api_settings.USER_ID_CLAIM],
+            username=validated_token.get("username", ""),
+            role=validated_token["role"],
+        )
+        user._state.adding = False
+        user._state.db = "default"
+        user.is_token_user = True
+        return user
@@ -0,0 +1,56 @@
+"""
+Création en masse de comptes utilisateurs depuis un CSV.
+
+Usage :
+    python manage.py provision_users comptes.csv
+    python manage.py provision_users comptes.csv --workers 8
+
+Colonnes (en-tête obligatoire) : username, email, role, password. Le lot est
+validé entièrement (`UserSerializer`) avant toute écriture, puis inséré en une
+transaction ; les mots de passe sont hachés par un pool de processus
+(`crm.users.services.provision_users`), réservé à la ligne de commande.
+"""
+
+import csv
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from crm.users.serializers import UserSerializer
+from crm.users.services import provision_users
+
+COLUMNS = ("username", "email", "role", "password")
+
+
+class Command(BaseCommand):
+    help = "Crée des utilisateurs depuis un CSV (username, email, role, password), hachage multi-processus."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Chemin du fichier CSV.")
+        parser.add_argument("--workers", type=int, help="Processus de hachage (défaut : nombre de cœurs).")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not os.path.exists(path):
+            raise CommandError(f"Fichier introuvable : {path}")
+
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            reader = csv.DictReader(f)
+            missing = [c for c in COLUMNS if c not in (reader.fieldnames or [])]
+            if missing:
+                raise CommandError(f"Colonnes manquantes : {', '.join(missing)}")
+            rows = [{c: (row[c] or "").strip() for c in COLUMNS} for row in reader]
+        if not rows:
+            raise CommandError("Aucun utilisateur dans le fichier.")
+
+        serializer = UserSerializer(data=rows, many=True)
+        if not serializer.is_valid():
+            errors = [f"ligne {n} : {e}" for n, e in enumerate(serializer.errors, start=2) if e]
+            raise CommandError("Lot invalide, rien n'a été créé :\n" + "\n".join(errors))
+        usernames = [row["username"] for row in serializer.validated_data]
+        duplicates = sorted({u for u in usernames if usernames.count(u) > 1})
+        if duplicates:
+            raise CommandError(f"Doublon dans le lot : {', '.join(duplicates)}.")
+
+        users = provision_users(serializer.validated_data, workers=options.get("workers"), processes=True)
+        self.stdout.write(self.style.SUCCESS(f"✅ {len(users)} utilisateur(s) créé(s)."))
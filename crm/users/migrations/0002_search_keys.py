@@ -0,0 +1,40 @@
+# Generated by Django 5.2 on 2026-10-19 12:36
+
+from django.db import migrations, models
+
+from crm.textsearch import normalize
+
+
+def backfill_search_keys(apps, schema_editor):
+    """Calcule la clé de recherche des utilisateurs existants (par lots de 1000)."""
+    User = apps.get_model('users', 'User')
+    batch = []
+    for user in User.objects.only('id', 'username').iterator(chunk_size=1000):
+        user.search_username = normalize(user.username)
+        batch.append(user)
+        if len(batch) == 1000:
+            User.objects.bulk_update(batch, ['search_username'])
+            batch = []
+    if batch:
+        User.objects.bulk_update(batch, ['search_username'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='search_username',
+            field=models.CharField(default='', editable=False, max_length=150, verbose_name='Nom d’utilisateur (clé de recherche)'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['search_username'], name='user_search_username_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.RunPython(backfill_search_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-19 13:23
+
+import crm.textsearch
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0002_search_keys'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='user',
+            name='user_search_username_idx',
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=crm.textsearch.PrefixIndex(fields=['search_username'], name='user_search_username_idx'),
+        ),
+    ]
@@ -1,7 +1,29 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from crm.textsearch import PrefixIndex, normalize
+
+# Durée cumulée (s) du hachage des mots de passe dans la requête en cours ;
+# None hors mesure (seule `LoginView` l'active, voir `crm.users.token_views`)
+password_hashing_seconds: ContextVar[Optional[list[float]]] = ContextVar("password_hashing_seconds", default=None)
+
+
+@contextmanager
+def _timed_hashing():
+    total = password_hashing_seconds.get()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if total is not None:
+            total[0] += time.perf_counter() - started
+
 
 class UserRole(models.TextChoices):
     """
@@ -32,6 +54,7 @@ class User(AbstractUser):
     - role : rôle fonctionnel dans l’organisation (COMMERCIAL, SUPPORT, GESTION)
     - created_at : date de création de l’utilisateur
     - updated_at : date de dernière modification du profil
+    - search_username : `username` normalisé (autocomplétion, recalculé à chaque `save()`)
 
     Remarques :
     - `EMAIL_FIELD` et `REQUIRED_FIELDS` sont ajustés pour imposer l’email et le rôle.
@@ -50,11 +73,43 @@ class User(AbstractUser):
         auto_now=True,
         verbose_name=_("Date de mise à jour")
     )
+    search_username = models.CharField(
+        max_length=150,
+        editable=False,
+        default="",
+        verbose_name=_("Nom d’utilisateur (clé de recherche)")
+    )
 
     # Force l’utilisation de l’email comme champ principal pour la communication
     EMAIL_FIELD = "email"
     REQUIRED_FIELDS = ["email", "role"]
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Autocomplétion par préfixe : filtre et tri (collation "C" sous PostgreSQL)
+            PrefixIndex(fields=["search_username"], name="user_search_username_idx"),
+        ]
+
+    def set_search_keys(self) -> None:
+        """Recalcule la clé de recherche depuis `username`."""
+        self.search_username = normalize(self.username)
+
+    def save(self, *args, **kwargs):
+        self.set_search_keys()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "search_username"}
+        super().save(*args, **kwargs)
+
+    def check_password(self, raw_password):
+        with _timed_hashing():
+            return super().check_password(raw_password)
+
+    def set_password(self, raw_password):
+        # Aussi appelé par `ModelBackend` pour un compte inconnu (durée égalisée)
+        with _timed_hashing():
+            super().set_password(raw_password)
+
     def __str__(self):
         """Retourne une représentation lisible de l’utilisateur."""
         return f"{self.username} ({self.get_role_display()})"
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""
+Profil de l’utilisateur connecté (`GET /api/users/me/` et réponse de connexion).
+
+Le profil sérialisé est conservé dans le cache Django (`default`) pendant
+`USER_PROFILE_CACHE_TTL` secondes. La connexion l’y dépose déjà : la CLI obtient
+tokens et profil en une requête, et un `/me/` suivant ne touche pas la base.
+Toute modification ou suppression du compte via l’API l’invalide (`forget_profile`).
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from crm.users.serializers import UserSerializer
+
+User = get_user_model()
+
+PROFILE_KEY = "users:profile:{}"
+
+
+def _ttl() -> int:
+    return getattr(settings, "USER_PROFILE_CACHE_TTL", 60)
+
+
+def remember_profile(user) -> dict:
+    """Sérialise `user` et met le profil en cache ; retourne le profil."""
+    profile = dict(UserSerializer(user).data)
+    cache.set(PROFILE_KEY.format(user.pk), profile, _ttl())
+    return profile
+
+
+def get_profile(user_id: int) -> Optional[dict]:
+    """Profil de `user_id` (cache, sinon base) ; None si le compte n’existe plus ou est inactif."""
+    profile = cache.get(PROFILE_KEY.format(user_id))
+    if profile is not None:
+        return profile
+    user = User.objects.filter(pk=user_id, is_active=True).first()
+    return remember_profile(user) if user is not None else None
+
+
+def forget_profile(user_id: int) -> None:
+    cache.delete(PROFILE_KEY.format(user_id))
@@ -1,6 +1,8 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 
+from crm.reassignment import RESOURCES, resources_for_role
+
 # Récupère le modèle utilisateur actif défini dans settings.AUTH_USER_MODEL
 User = get_user_model()
 
@@ -64,4 +66,38 @@ class UserSerializer(serializers.ModelSerializer):
         if password:
             instance.set_password(password)  # Hachage sécurisé
         instance.save()
-        return instance
\ No newline at end of file
+        return instance
+
+class ReassignmentSerializer(serializers.Serializer):
+    """
+    Paramètres de `POST /api/users/{id}/reassign/` (portefeuille de l'utilisateur `id`).
+
+    - to : destinataire actif, différent de la source
+    - resources : "clients", "contracts", "events" (défaut : tout ce que le rôle du destinataire peut recevoir)
+    - client_ids : limite la réaffectation à ces clients (et à leurs contrats / événements)
+    - dry_run : compte les lignes concernées (et les conflits de planning) sans rien modifier
+    - allow_conflicts : transfère les événements même s'ils chevauchent ceux du destinataire
+    """
+    to = serializers.PrimaryKeyRelatedField(queryset=User.objects.filter(is_active=True))
+    resources = serializers.ListField(
+        child=serializers.ChoiceField(choices=["clients", "contracts", "events"]),
+        required=False, allow_empty=False,
+    )
+    client_ids = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False)
+    dry_run = serializers.BooleanField(default=False)
+    allow_conflicts = serializers.BooleanField(default=False)
+
+    def validate(self, attrs):
+        source, target = self.context["source"], attrs["to"]
+        if target.pk == source.pk:
+            raise serializers.ValidationError({"to": "Le destinataire doit être un autre utilisateur."})
+
+        allowed = resources_for_role(target.role)
+        resources = attrs.get("resources") or allowed
+        refused = [r for r in resources if r not in allowed]
+        if refused or not resources:
+            raise serializers.ValidationError({"resources": [
+                f"« {r} » ne peut être confié qu'à un utilisateur {RESOURCES[r][2]}." for r in refused
+            ] or [f"Aucune ressource ne peut être confiée à un utilisateur {target.role}."]})
+        attrs["resources"] = resources
+        return attrs
@@ -0,0 +1,74 @@
+"""
+Provisionnement en masse des comptes utilisateurs.
+
+Le hachage des mots de passe (PBKDF2, volontairement coûteux) domine le temps de
+création d’un compte. `hash_passwords` le répartit :
+  - dans une requête HTTP (`POST /api/users/bulk/`) : petit pool de threads
+    (`hashlib.pbkdf2_hmac` relâche le GIL) ; pas de processus démarré par requête
+    dans un worker gunicorn ;
+  - en ligne de commande (`python manage.py provision_users`, `processes=True`) :
+    pool de processus sur tous les cœurs.
+Les petits lots, ou un seul worker, sont hachés dans le thread courant. Les
+comptes sont ensuite insérés en une transaction (`bulk_create`).
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+User = get_user_model()
+
+# Taille maximale d'un lot accepté par l'API
+BULK_MAX_USERS = 500
+# En dessous de ce nombre de mots de passe, le pool coûte plus qu'il ne rapporte
+POOL_THRESHOLD = 8
+# Threads de hachage par requête HTTP (plafonnés au nombre de cœurs)
+REQUEST_HASH_THREADS = 4
+
+
+def _init_worker() -> None:
+    """Initialise Django dans les processus du pool (nécessaire en mode `spawn`)."""
+    import django
+
+    django.setup()
+
+
+def hash_passwords(passwords: list[str], workers: Optional[int] = None, processes: bool = False) -> list[str]:
+    """
+    Retourne les hachages de `passwords` (même ordre), en parallèle si utile :
+    threads par défaut, processus si `processes` (commandes, jamais en requête HTTP).
+    """
+    cpus = os.cpu_count() or 1
+    workers = workers or (cpus if processes else min(REQUEST_HASH_THREADS, cpus))
+    if len(passwords) < POOL_THRESHOLD or workers < 2:
+        return [make_password(p) for p in passwords]
+    if not processes:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(make_password, passwords))
+
+    chunksize = max(1, len(passwords) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        return list(pool.map(make_password, passwords, chunksize=chunksize))
+
+
+def provision_users(rows: list[dict], workers: Optional[int] = None, processes: bool = False) -> list:
+    """
+    Crée les utilisateurs décrits par `rows` (données validées par `UserSerializer`,
+    mot de passe en clair sous la clé `password`) et retourne les instances créées.
+    `workers` / `processes` : voir `hash_passwords`.
+    """
+    hashes = hash_passwords([row["password"] for row in rows], workers=workers, processes=processes)
+    users = [
+        User(**{k: v for k, v in row.items() if k != "password"}, password=hashed)
+        for row, hashed in zip(rows, hashes)
+    ]
+    for user in users:
+        user.set_search_keys()  # `bulk_create` n'appelle pas `save()`
+    with transaction.atomic():
+        return User.objects.bulk_create(users)
@@ -0,0 +1,58 @@
+"""
+Signaux invalidant ce qui est dérivé d’un compte utilisateur.
+
+Principe (comme `crm.pipeline.signals`) :
+  - `post_init` mémorise le rôle et l’activation tels que chargés, sans requête ;
+  - `post_save` oublie le profil en cache (`forget_profile`) et l’utilisateur du
+    cache des écritures ; si le rôle ou l’activation a changé (ou n’était pas
+    chargé), les claims des tokens déjà émis sont révoqués (`revoke_user_tokens`) ;
+  - `post_delete` révoque toujours.
+
+Toute écriture par `save()` / `delete()` est couverte (API, admin, shell,
+commandes). Les écritures en masse (`QuerySet.update()`) n’émettent pas de
+signaux : appeler `revoke_user_tokens` pour les comptes concernés.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from crm.users.authentication import revoke_user_tokens, user_cache
+from crm.users.profile import forget_profile
+
+User = get_user_model()
+
+_STATE_ATTR = "_claims_state"
+
+# Instance chargée avec des champs différés (`only()` / `defer()`) : état inconnu
+UNKNOWN = object()
+
+
+def _claims_state(instance):
+    values = instance.__dict__
+    if "role" not in values or "is_active" not in values:
+        return UNKNOWN
+    return values["role"], values["is_active"]
+
+
+@receiver(post_init, sender=User)
+def _user_post_init(sender, instance, **kwargs):
+    setattr(instance, _STATE_ATTR, _claims_state(instance) if instance.pk else None)
+
+
+@receiver(post_save, sender=User)
+def _user_post_save(sender, instance, created, **kwargs):
+    old_state = None if created else getattr(instance, _STATE_ATTR, None)
+    new_state = _claims_state(instance)
+
+    forget_profile(instance.pk)
+    user_cache.discard(instance.pk)
+    if not created and (old_state is UNKNOWN or new_state is UNKNOWN or old_state != new_state):
+        revoke_user_tokens(instance.pk)
+    setattr(instance, _STATE_ATTR, new_state)
+
+
+@receiver(post_delete, sender=User)
+def _user_post_delete(sender, instance, **kwargs):
+    forget_profile(instance.pk)
+    revoke_user_tokens(instance.pk)
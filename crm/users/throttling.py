@@ -0,0 +1,149 @@
+"""
+Limitation du débit de connexion (`POST /api/auth/jwt/create/`).
+
+Chaque tentative consomme un jeton dans deux seaux (token bucket) : un par
+adresse IP et un par nom d’utilisateur. Un seau contient au plus `capacity`
+jetons et se remplit entièrement en `period` secondes ; vide, la requête est
+refusée (429) avant toute vérification de mot de passe, l’opération la plus
+coûteuse de l’API.
+
+Réglages (`settings.LOGIN_THROTTLE`) :
+    - BACKEND : stockage des seaux. `LocalBucketBackend` (mémoire du processus,
+      par défaut) ou `CacheBucketBackend` (cache Django, partagé entre workers si
+      le cache l’est) — toute classe exposant `consume()` / `reset()` convient ;
+    - RATES : {"ip": (capacity, period), "username": (capacity, period)}.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from threading import Lock
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+from rest_framework.throttling import BaseThrottle
+
+DEFAULT_RATES = {"ip": (20, 60), "username": (5, 60)}
+
+
+class LocalBucketBackend:
+    """Seaux en mémoire du processus (un dict protégé par un verrou)."""
+
+    # Au-delà, les seaux pleins (équivalents à une absence d'entrée) sont purgés
+    MAX_ENTRIES = 10_000
+
+    def __init__(self):
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = Lock()
+
+    def consume(self, key: str, capacity: int, period: float, now: Optional[float] = None) -> float:
+        """Consomme un jeton ; retourne 0 si accepté, sinon l'attente (s) avant le prochain jeton."""
+        now = time.monotonic() if now is None else now
+        rate = capacity / period
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            if tokens < 1:
+                self._buckets[key] = (tokens, now)
+                return (1 - tokens) / rate
+            self._buckets[key] = (tokens - 1, now)
+            if len(self._buckets) > self.MAX_ENTRIES:
+                self._prune(now, rate, capacity)
+            return 0.0
+
+    def _prune(self, now: float, rate: float, capacity: int) -> None:
+        self._buckets = {
+            k: (t, u) for k, (t, u) in self._buckets.items() if t + (now - u) * rate < capacity
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+class CacheBucketBackend:
+    """
+    Seaux stockés dans le cache Django (Redis / Memcached pour un partage entre workers).
+    La lecture-écriture n'est pas atomique : sous forte concurrence quelques
+    tentatives de plus peuvent passer, ce qui reste acceptable pour une limite de débit.
+    """
+
+    PREFIX = "throttle:login:"
+
+    def _cache_key(self, key: str) -> str:
+        # Nom d'utilisateur libre : clé hachée (compatible Memcached)
+        return self.PREFIX + hashlib.sha1(key.encode()).hexdigest()
+
+    def consume(self, key: str, capacity: int, period: float, now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        rate = capacity / period
+        cache_key = self._cache_key(key)
+        tokens, updated = cache.get(cache_key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated) * rate)
+        wait = 0.0 if tokens >= 1 else (1 - tokens) / rate
+        cache.set(cache_key, (tokens - 1 if not wait else tokens, now), timeout=int(period) + 1)
+        return wait
+
+    def reset(self) -> None:
+        """Nécessite un cache supportant `delete_pattern` (django-redis) ; sinon, expiration naturelle."""
+        if hasattr(cache, "delete_pattern"):
+            cache.delete_pattern(self.PREFIX + "*")
+
+
+_backend = None
+
+
+def get_backend():
+    """Instance unique du backend configuré (créée au premier appel)."""
+    global _backend
+    if _backend is None:
+        path = getattr(settings, "LOGIN_THROTTLE", {}).get("BACKEND", "crm.users.throttling.LocalBucketBackend")
+        _backend = import_string(path)()
+    return _backend
+
+
+def reset_login_throttles() -> None:
+    """Vide tous les seaux (tests, déblocage manuel)."""
+    get_backend().reset()
+
+
+class LoginThrottle(BaseThrottle):
+    """Seau de connexion ; `scope` = "ip" ou "username"."""
+    scope = "ip"
+
+    def __init__(self):
+        self._wait = 0.0
+
+    def get_rate(self) -> tuple[int, float]:
+        rates = getattr(settings, "LOGIN_THROTTLE", {}).get("RATES", {})
+        return tuple(rates.get(self.scope, DEFAULT_RATES[self.scope]))
+
+    def get_key(self, request) -> Optional[str]:
+        return self.get_ident(request)
+
+    def allow_request(self, request, view) -> bool:
+        key = self.get_key(request)
+        if not key:
+            return True
+        capacity, period = self.get_rate()
+        self._wait = get_backend().consume(f"{self.scope}:{key}", capacity, period)
+        return self._wait == 0
+
+    def wait(self) -> Optional[float]:
+        return self._wait or None
+
+
+class LoginIPThrottle(LoginThrottle):
+    scope = "ip"
+
+
+class LoginUsernameThrottle(LoginThrottle):
+    scope = "username"
+
+    def get_key(self, request) -> Optional[str]:
+        data = request.data if hasattr(request.data, "get") else {}
+        username = data.get("username")
+        return str(username).strip().lower() if username else None
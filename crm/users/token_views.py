@@ -0,0 +1,100 @@
+"""
+Vues JWT du projet (remplacent les vues SimpleJWT dans `epic_crm/urls.py`).
+
+- `LoginView` (`POST /api/auth/jwt/create/`) : limitée par IP et par nom
+  d’utilisateur (`crm.users.throttling`) ; le temps passé en base et le temps de
+  hachage du mot de passe (`User.check_password` / `set_password`, mesurés
+  directement) sont journalisés (`crm.auth`, niveau DEBUG). L’en-tête
+  `Server-Timing` (`db`, `hash`, `total`, en ms) n’est renvoyé qu’en `DEBUG` :
+  sur un endpoint non authentifié, il servirait d’oracle temporel.
+- `CachedTokenRefreshView` (`POST /api/auth/jwt/refresh/`) : un refresh token déjà
+  vérifié récemment (`AUTH_REFRESH_CACHE_TTL`, 30 s) renvoie le même access token
+  sans nouvelle vérification ni lecture de l’utilisateur ; une révocation
+  (`revoke_user_tokens`) invalide l’entrée.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from rest_framework.response import Response
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+
+from crm.users.authentication import is_revoked
+from crm.users.models import password_hashing_seconds
+from crm.users.throttling import LoginIPThrottle, LoginUsernameThrottle
+
+logger = logging.getLogger("crm.auth")
+
+REFRESH_CACHE_KEY = "auth:refresh:{}"
+
+
+class _DBTimer:
+    """`execute_wrapper` cumulant la durée des requêtes SQL."""
+
+    def __init__(self):
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - started
+
+
+class LoginView(TokenObtainPairView):
+    """Obtention du couple access/refresh, limitée et instrumentée."""
+    throttle_classes = [LoginIPThrottle, LoginUsernameThrottle]
+
+    def post(self, request, *args, **kwargs):
+        timer, hashing = _DBTimer(), [0.0]
+        token = password_hashing_seconds.set(hashing)
+        started = time.perf_counter()
+        try:
+            with connection.execute_wrapper(timer):
+                response = super().post(request, *args, **kwargs)
+        finally:
+            password_hashing_seconds.reset(token)
+        total = time.perf_counter() - started
+
+        timings = {"db": timer.seconds, "hash": hashing[0], "total": total}
+        if settings.DEBUG:
+            response["Server-Timing"] = ", ".join(f"{name};dur={value * 1000:.1f}" for name, value in timings.items())
+        logger.debug("login status=%s db=%.1fms hash=%.1fms", response.status_code,
+                     timings["db"] * 1000, timings["hash"] * 1000)
+        return response
+
+
+class CachedTokenRefreshView(TokenRefreshView):
+    """Rafraîchissement avec cache court des refresh tokens déjà vérifiés."""
+
+    def post(self, request, *args, **kwargs):
+        raw = request.data.get("refresh") if hasattr(request.data, "get") else None
+        if not raw or api_settings.ROTATE_REFRESH_TOKENS:
+            # Rotation : chaque appel doit produire un nouveau refresh token
+            return super().post(request, *args, **kwargs)
+
+        key = REFRESH_CACHE_KEY.format(hashlib.sha256(str(raw).encode()).hexdigest())
+        hit = cache.get(key)
+        if hit and not is_revoked(hit["user_id"], hit["auth_time"]):
+            return Response(hit["data"])
+
+        response = super().post(request, *args, **kwargs)
+        if response.status_code == 200:
+            payload = RefreshToken(raw, verify=False).payload
+            ttl = min(getattr(settings, "AUTH_REFRESH_CACHE_TTL", 30), int(payload["exp"] - time.time()))
+            if ttl > 0:
+                cache.set(key, {
+                    "data": response.data,
+                    "user_id": payload.get(api_settings.USER_ID_CLAIM),
+                    "auth_time": payload.get("auth_time"),
+                }, timeout=ttl)
+        return response
@@ -1,7 +1,15 @@
-from rest_framework import viewsets, permissions
+from rest_framework import permissions, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.response import Response
 
+from crm.deletion import delete_user
+from crm.pagination import UserPagination
+from crm.reassignment import reassign_portfolio
 from crm.users.models import User
-from crm.users.serializers import UserSerializer
+from crm.users.profile import get_profile
+from crm.users.serializers import ReassignmentSerializer, UserSerializer
+from crm.users.services import BULK_MAX_USERS, provision_users
 
 
 class UserViewSet(viewsets.ModelViewSet):
@@ -17,9 +25,24 @@ class UserViewSet(viewsets.ModelViewSet):
         → Pas d'accès aux profils d'autres utilisateurs.
 
     🔒 La logique de permissions est centralisée dans la classe interne `IsGestionOrSelfReadOnly`.
+
+    👤 `GET /api/users/me/` (tous rôles) : profil de l'utilisateur connecté, mis en cache
+    (`crm.users.profile`).
+
+    📦 `POST /api/users/bulk/` (GESTION) : création d'un lot d'utilisateurs, mots de passe
+    hachés par un petit pool de threads (`crm.users.services.provision_users`).
+
+    🔁 `POST /api/users/{id}/reassign/` (GESTION) : transfère clients, contrats et/ou
+    événements de l'utilisateur `id` vers `to`, une requête UPDATE par table
+    (`crm.reassignment`) ; `dry_run` pour compter sans écrire ; refus si des événements
+    chevauchent ceux du destinataire, sauf `allow_conflicts`.
+
+    🔑 Un changement de rôle, une désactivation ou une suppression révoque les claims
+    des tokens déjà émis (signaux de `crm.users.signals`) : l'utilisateur est relu en base.
     """
     queryset = User.objects.all().order_by("id")
     serializer_class = UserSerializer
+    pagination_class = UserPagination
 
     def get_permissions(self):
         """
@@ -45,7 +68,7 @@ class UserViewSet(viewsets.ModelViewSet):
 
                 # Autres rôles :
                 # Autorise seulement la lecture de leur propre profil
-                if view.action in ["retrieve", "list"]:
+                if view.action in ["retrieve", "list", "me"]:
                     return request.user.is_authenticated
 
                 # Toute autre action est refusée
@@ -73,5 +96,52 @@ class UserViewSet(viewsets.ModelViewSet):
         """
         user = self.request.user
         if user.role == "GESTION":
-            return User.objects.all()
-        return User.objects.filter(pk=user.pk)
\ No newline at end of file
+            return User.objects.all().order_by("id")
+        return User.objects.filter(pk=user.pk).order_by("id")
+
+    def perform_destroy(self, instance):
+        """Détache clients, contrats et événements par lots avant de supprimer le compte."""
+        delete_user(instance)
+
+    @action(detail=False, methods=["get"], url_path="me")
+    def me(self, request):
+        """Profil de l'utilisateur connecté (servi depuis le cache après la connexion)."""
+        profile = get_profile(request.user.pk)
+        if profile is None:
+            raise NotFound("Utilisateur introuvable.")
+        return Response(profile)
+
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request):
+        """
+        Crée plusieurs utilisateurs en une requête (liste d'objets `UserSerializer`).
+        Le lot est validé entièrement avant toute écriture, puis inséré en une transaction.
+        """
+        if not isinstance(request.data, list) or not request.data:
+            raise ValidationError({"detail": "Une liste non vide d'utilisateurs est attendue."})
+        if len(request.data) > BULK_MAX_USERS:
+            raise ValidationError({"detail": f"{BULK_MAX_USERS} utilisateurs maximum par lot."})
+
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+
+        usernames = [row["username"] for row in serializer.validated_data]
+        duplicates = sorted({u for u in usernames if usernames.count(u) > 1})
+        if duplicates:
+            raise ValidationError({"username": [f"Doublon dans le lot : {', '.join(duplicates)}."]})
+
+        users = provision_users(serializer.validated_data)
+        return Response(self.get_serializer(users, many=True).data, status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=["post"], url_path="reassign")
+    def reassign(self, request, pk=None):
+        """Réaffecte le portefeuille de l'utilisateur (tout ou partie) à un autre collaborateur."""
+        source = self.get_object()
+        params = ReassignmentSerializer(data=request.data, context={"source": source})
+        params.is_valid(raise_exception=True)
+        data = params.validated_data
+
+        counts = reassign_portfolio(source, data["to"], data["resources"],
+                                    client_ids=data.get("client_ids"), dry_run=data["dry_run"],
+                                    allow_conflicts=data["allow_conflicts"])
+        return Response({"from": source.pk, "to": data["to"].pk, "dry_run": data["dry_run"], **counts})
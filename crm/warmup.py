@@ -0,0 +1,165 @@
+"""
+Préchauffage d’un worker avant qu’il ne reçoive du trafic.
+
+Après un déploiement, les premières requêtes sur les ViewSets paient la
+construction paresseuse de nombreuses structures. `warm_up()` les prépare au
+démarrage (appelé par `epic_crm/wsgi.py` / `asgi.py` si `WARMUP_ON_STARTUP`, ou
+via `python manage.py warmup`) :
+
+    - routes : compilation des expressions régulières et tables de `reverse()` ;
+    - ViewSets : champs des sérialiseurs, plans de `crm.compiled` (complet et
+      `compact`), filtersets `django-filter` ;
+    - JWT : backend de signature et classe d’authentification (aller-retour d’un
+      token factice) ;
+    - traductions (catalogue de `LANGUAGE_CODE`) et rendu JSON ;
+    - base (`database=True`, `WARMUP_DATABASE`) : ouverture de chaque connexion
+      et aller-retour ; les connexions restent ouvertes pour la première
+      requête (`CONN_MAX_AGE`) ;
+    - optionnel (`schema=True`, `WARMUP_SCHEMA`) : rendu du schéma OpenAPI.
+
+Un socket ouvert avant un fork serait partagé par tous les workers et
+corromprait les échanges avec la base. Sous gunicorn `--preload` (application
+chargée dans le maître), désactiver `WARMUP_DATABASE` et déclarer le hook
+`post_fork` ci-dessous dans la configuration gunicorn : chaque worker ouvre
+alors ses propres connexions dès sa création. Sans étape base, les connexions
+éventuellement ouvertes par les autres étapes sont refermées.
+
+Une étape en échec est journalisée (`crm.warmup`) sans empêcher le démarrage.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Callable, Iterator
+
+from django.conf import settings
+from django.db import connections
+from django.urls import URLPattern, URLResolver, get_resolver
+from django.utils import translation
+
+logger = logging.getLogger("crm.warmup")
+
+
+def _walk(patterns, prefix: str = "") -> Iterator[tuple[str, URLPattern]]:
+    for entry in patterns:
+        if isinstance(entry, URLResolver):
+            yield from _walk(entry.url_patterns, prefix + str(entry.pattern))
+        else:
+            yield prefix + str(entry.pattern), entry
+
+
+def _viewsets() -> list[type]:
+    seen = []
+    for _, pattern in _walk(get_resolver().url_patterns):
+        cls = getattr(pattern.callback, "cls", None)
+        if cls is not None and getattr(pattern.callback, "actions", None) and cls not in seen:
+            seen.append(cls)
+    return seen
+
+
+def _compile_patterns(patterns) -> None:
+    for entry in patterns:
+        entry.pattern.regex  # compilation paresseuse
+        if isinstance(entry, URLResolver):
+            _compile_patterns(entry.url_patterns)
+
+
+def warm_urls() -> None:
+    resolver = get_resolver()
+    _compile_patterns(resolver.url_patterns)
+    resolver.reverse_dict  # peuple les tables de reverse() pour la langue active
+
+
+def warm_viewsets() -> None:
+    from django_filters.rest_framework import DjangoFilterBackend
+
+    from crm.compiled import CompiledListSerializer, CompiledListViewMixin
+
+    for cls in _viewsets():
+        serializer_class = getattr(cls, "serializer_class", None)
+        if serializer_class is None:
+            continue
+        serializer = serializer_class(context={})
+        serializer.fields
+
+        if issubclass(cls, CompiledListViewMixin):
+            CompiledListSerializer([], serializer)
+            compact = getattr(cls, "compact_fields", ())
+            if compact:
+                CompiledListSerializer([], serializer_class(context={"fields": list(compact)}))
+
+        filterable = getattr(cls, "filterset_class", None) or getattr(cls, "filterset_fields", None)
+        if DjangoFilterBackend in getattr(cls, "filter_backends", ()) and filterable:
+            queryset = serializer_class.Meta.model._default_manager.all()
+            filterset_class = DjangoFilterBackend().get_filterset_class(cls(), queryset)
+            filterset_class(data={}, queryset=queryset).form
+
+
+def warm_jwt() -> None:
+    from rest_framework_simplejwt.settings import api_settings
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    from crm.users.authentication import ClaimsJWTAuthentication
+
+    token = AccessToken()
+    token[api_settings.USER_ID_CLAIM] = 0
+    ClaimsJWTAuthentication().get_validated_token(str(token).encode())
+
+
+def warm_i18n_and_renderers() -> None:
+    from crm.renderers import FastJSONRenderer
+
+    with translation.override(settings.LANGUAGE_CODE):
+        translation.gettext("This field is required.")
+    FastJSONRenderer().render({"results": [{"id": 1, "name": "é"}]})
+
+
+def warm_database() -> None:
+    for alias in connections:
+        with connections[alias].cursor() as cursor:
+            cursor.execute("SELECT 1")
+
+
+def warm_schema() -> None:
+    from crm.schema import render_default_schemas
+
+    render_default_schemas()
+
+
+def post_fork(server, worker) -> None:
+    """Hook gunicorn (`from crm.warmup import post_fork` dans la configuration) : connexions du worker."""
+    try:
+        warm_database()
+    except Exception:
+        logger.warning("Préchauffage « base » en échec", exc_info=True)
+
+
+def warm_up(schema: bool | None = None, database: bool | None = None) -> dict[str, float]:
+    """Exécute les étapes de préchauffage ; retourne {étape: durée en secondes}."""
+    if schema is None:
+        schema = getattr(settings, "WARMUP_SCHEMA", False)
+    if database is None:
+        database = getattr(settings, "WARMUP_DATABASE", True)
+    steps: list[tuple[str, Callable[[], None]]] = [
+        ("routes", warm_urls),
+        ("viewsets", warm_viewsets),
+        ("jwt", warm_jwt),
+        ("i18n / rendu", warm_i18n_and_renderers),
+    ]
+    if database:
+        steps.append(("base", warm_database))
+    if schema:
+        steps.append(("schéma OpenAPI", warm_schema))
+
+    timings = {}
+    for name, step in steps:
+        started = time.perf_counter()
+        try:
+            step()
+        except Exception:
+            logger.warning("Préchauffage « %s » en échec", name, exc_info=True)
+        timings[name] = time.perf_counter() - started
+    if not database:
+        connections.close_all()
+    return timings
@@ -14,3 +14,11 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'epic_crm.settings')
 
 application = get_asgi_application()
+
+# Prépare routes, sérialiseurs, JWT et connexions à la base avant la première requête
+from django.conf import settings  # noqa: E402
+
+if settings.WARMUP_ON_STARTUP:
+    from crm.warmup import warm_up  # noqa: E402
+
+    warm_up()
@@ -27,15 +27,19 @@ INSTALLED_APPS = [
     'drf_spectacular_sidecar',  # assets Swagger/Redoc
 
     # Domain apps
+    'crm',  # transverse : commandes build_schema, …
     'crm.users',
     'crm.clients',
     'crm.contracts',
     'crm.events',
+    'crm.pipeline',
 ]
 
 # --- Middleware ---
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # Compression négociée (gzip, brotli / zstd si installés) — voir crm/compression.py
+    'crm.compression.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -71,13 +75,28 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'epic_crm.wsgi.application'
 
-# --- Base de données (SQLite) ---
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# --- Base de données (SQLite par défaut, PostgreSQL si DB_ENGINE=postgresql) ---
+if config('DB_ENGINE', default='sqlite') == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': config('DB_NAME'),
+            'USER': config('DB_USER'),
+            'PASSWORD': config('DB_PASSWORD'),
+            'HOST': config('DB_HOST', default='localhost'),
+            'PORT': config('DB_PORT', default='5432'),
+            # Connexions persistantes : ouvertes au préchauffage, réutilisées ensuite
+            'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', cast=int, default=60),
+            'CONN_HEALTH_CHECKS': True,
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+        }
     }
-}
 
 # --- Auth & User model ---
 AUTH_USER_MODEL = 'users.User'
@@ -110,9 +129,10 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.IsAuthenticated",
     ),
 
-    # Auth: JWT pour l’API, Session pour l’admin / Browsable API
+    # Auth: JWT pour l’API (rôle lu dans les claims, voir crm/users/authentication.py),
+    # Session pour l’admin / Browsable API
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "crm.users.authentication.ClaimsJWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ),
 
@@ -121,11 +141,22 @@ REST_FRAMEWORK = {
         "django_filters.rest_framework.DjangoFilterBackend",
     ),
 
+    # Rendu / lecture JSON via orjson si installé (sortie identique, voir crm/renderers.py)
+    "DEFAULT_RENDERER_CLASSES": (
+        "crm.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "crm.renderers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
+
     # Schéma OpenAPI via drf-spectacular
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 
-    # Pagination
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    # Pagination (`?page_size=` plafonné ; politique par ressource dans crm/pagination.py)
+    "DEFAULT_PAGINATION_CLASS": "crm.pagination.CRMPagination",
     "PAGE_SIZE": 10,
 
     # (Optionnel en tests pour POST/PUT plus simples)
@@ -143,6 +174,60 @@ SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('Bearer',),
     'ALGORITHM': 'HS256',
     'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',),
+    # Ajoute les claims role / username / auth_time au token de connexion
+    'TOKEN_OBTAIN_SERIALIZER': 'crm.users.authentication.RoleTokenObtainPairSerializer',
+}
+
+# Durée (s) de mise en cache en mémoire de l'utilisateur authentifié pour les écritures
+AUTH_USER_CACHE_TTL = config('AUTH_USER_CACHE_TTL', cast=int, default=30)
+# Durée (s) de mise en cache du profil servi par /api/users/me/ (déposé à la connexion)
+USER_PROFILE_CACHE_TTL = config('USER_PROFILE_CACHE_TTL', cast=int, default=60)
+# Durée (s) pendant laquelle un refresh token déjà vérifié renvoie le même access token
+AUTH_REFRESH_CACHE_TTL = config('AUTH_REFRESH_CACHE_TTL', cast=int, default=30)
+
+# Sérialisation précompilée des listes clients / contrats / événements (crm/compiled.py)
+FAST_LIST_SERIALIZATION = config('FAST_LIST_SERIALIZATION', cast=bool, default=True)
+
+# Rendus du schéma OpenAPI écrits par `manage.py build_schema` (vide : génération au 1er appel)
+OPENAPI_SCHEMA_DIR = config('OPENAPI_SCHEMA_DIR', default='')
+
+# Préchauffage des workers au chargement de wsgi.py / asgi.py (crm/warmup.py) ; actif par défaut hors DEBUG
+WARMUP_ON_STARTUP = config('WARMUP_ON_STARTUP', cast=bool, default=not DEBUG)
+# Inclure le rendu du schéma OpenAPI dans le préchauffage (inutile si OPENAPI_SCHEMA_DIR)
+WARMUP_SCHEMA = config('WARMUP_SCHEMA', cast=bool, default=False)
+# Ouvrir les connexions à la base au préchauffage (False sous gunicorn --preload : hook post_fork)
+WARMUP_DATABASE = config('WARMUP_DATABASE', cast=bool, default=True)
+
+# Suppression des clients / utilisateurs : lignes liées traitées par transaction (crm/deletion.py)
+DELETE_CHUNK_SIZE = config('DELETE_CHUNK_SIZE', cast=int, default=1000)
+
+# Autocomplétion (crm/autocomplete.py) : longueur minimale du préfixe, nombre de résultats
+AUTOCOMPLETE_MIN_CHARS = config('AUTOCOMPLETE_MIN_CHARS', cast=int, default=2)
+AUTOCOMPLETE_DEFAULT_RESULTS = 10
+AUTOCOMPLETE_MAX_RESULTS = 20
+
+# Doublons de clients (crm/clients/duplicates.py) : voisins comparés par bloc, similarité minimale
+DEDUP_WINDOW = config('DEDUP_WINDOW', cast=int, default=10)
+DEDUP_SIMILARITY = config('DEDUP_SIMILARITY', cast=float, default=0.85)
+
+# Liste de relance des clients (crm/clients/followup.py) : jours sans contact par défaut
+FOLLOW_UP_DAYS = config('FOLLOW_UP_DAYS', cast=int, default=30)
+
+# Taille minimale (octets) d'une réponse pour qu'elle soit compressée
+COMPRESSION_MIN_SIZE = config('COMPRESSION_MIN_SIZE', cast=int, default=1024)
+
+# Pagination (crm/pagination.py) : au-delà de ce nombre de lignes estimé par PostgreSQL,
+# le total renvoyé est l'estimation du planificateur plutôt qu'un COUNT(*)
+PAGINATION_ESTIMATE_THRESHOLD = config('PAGINATION_ESTIMATE_THRESHOLD', cast=int, default=10000)
+# Durée (s) de mise en cache du total d'une liste par périmètre (0 : désactivé)
+PAGINATION_COUNT_CACHE_TTL = config('PAGINATION_COUNT_CACHE_TTL', cast=int, default=5)
+
+# --- Limitation des connexions (crm/users/throttling.py) ---
+# RATES : (capacité du seau, secondes pour le remplir) ; BACKEND partagé possible :
+# 'crm.users.throttling.CacheBucketBackend' (avec un cache Django partagé).
+LOGIN_THROTTLE = {
+    'BACKEND': 'crm.users.throttling.LocalBucketBackend',
+    'RATES': {'ip': (20, 60), 'username': (5, 60)},
 }
 
 # --- Swagger / OpenAPI (drf-spectacular) ---
@@ -0,0 +1,16 @@
+"""
+Profil de settings pour la suite de tests (`pytest.ini`).
+
+Identique à `epic_crm.settings`, avec un hacheur de mots de passe rapide : les
+fixtures créent des utilisateurs à chaque test et PBKDF2 (≈ 1 M d'itérations)
+représente sinon l'essentiel du temps de mise en place. Ne jamais utiliser en production.
+
+Le cache des totaux de pagination est désactivé : d'un test à l'autre, une même
+requête SQL porte sur des données différentes.
+"""
+
+from epic_crm.settings import *  # noqa: F401,F403
+
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+PAGINATION_COUNT_CACHE_TTL = 0
@@ -3,16 +3,15 @@ from django.contrib import admin
 from django.urls import path, include
 
 from drf_spectacular.views import (
-    SpectacularAPIView,
     SpectacularSwaggerView,
     SpectacularRedocView,
 )
 
-from rest_framework_simplejwt.views import (
-    TokenObtainPairView,
-    TokenRefreshView,
-    TokenVerifyView,
-)
+from rest_framework_simplejwt.views import TokenVerifyView
+
+from crm.autocomplete import ClientAutocompleteView, UserAutocompleteView
+from crm.schema import CachedSpectacularAPIView
+from crm.users.token_views import CachedTokenRefreshView, LoginView
 
 urlpatterns = [
     # --- Admin Django ---
@@ -23,18 +22,24 @@ urlpatterns = [
     path("api/clients/", include("crm.clients.urls")),
     path("api/contracts/", include("crm.contracts.urls")),
     path("api/events/", include("crm.events.urls")),
+    path("api/pipeline/", include("crm.pipeline.urls")),
+
+    # --- Autocomplétion par préfixe (colonnes normalisées indexées, crm/autocomplete.py) ---
+    path("api/autocomplete/clients/", ClientAutocompleteView.as_view(), name="autocomplete-clients"),
+    path("api/autocomplete/users/", UserAutocompleteView.as_view(), name="autocomplete-users"),
 
     # --- Authentification JWT (SimpleJWT) ---
     # Note : utiliser des slashs finaux pour respecter APPEND_SLASH=True
-    path("api/auth/jwt/create/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
-    path("api/auth/jwt/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    # create : limité par IP / nom d'utilisateur ; refresh : cache court des tokens vérifiés
+    path("api/auth/jwt/create/", LoginView.as_view(), name="token_obtain_pair"),
+    path("api/auth/jwt/refresh/", CachedTokenRefreshView.as_view(), name="token_refresh"),
     path("api/auth/jwt/verify/", TokenVerifyView.as_view(), name="token_verify"),
 
     # --- Schéma OpenAPI & UIs (drf-spectacular) ---
-    # /api/schema/        -> JSON du schéma OpenAPI
+    # /api/schema/        -> schéma OpenAPI (rendu une fois, servi avec ETag : crm/schema.py)
     # /api/docs/          -> Swagger UI
     # /api/redoc/         -> ReDoc
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
+    path("api/schema/", CachedSpectacularAPIView.as_view(), name="schema"),
     path("api/docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
     path("api/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
 ]
\ No newline at end of file
@@ -0,0 +1,143 @@
+# tests/api/test_auth_claims.py
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from crm.users.authentication import revoke_user_tokens, user_cache
+
+TOKEN_URL = "/api/auth/jwt/create/"
+
+
+@pytest.fixture(autouse=True)
+def _clear_auth_caches():
+    cache.clear()
+    user_cache.clear()
+    yield
+    cache.clear()
+    user_cache.clear()
+
+
+def _bearer(user) -> APIClient:
+    api = APIClient()
+    r = api.post(TOKEN_URL, {"username": user.username, "password": "Azerty123$"}, format="json")
+    assert r.status_code == 200
+    api.credentials(HTTP_AUTHORIZATION=f"Bearer {r.data['access']}")
+    return api
+
+
+def _user_queries(api, method, url, data=None):
+    with CaptureQueriesContext(connection) as ctx:
+        response = getattr(api, method)(url, data, format="json")
+    return response, [q["sql"] for q in ctx.captured_queries if 'FROM "users_user"' in q["sql"]]
+
+
+@pytest.mark.django_db
+def test_reads_use_token_claims_and_writes_use_cached_user(commercial_user, client_of_commercial):
+    api = _bearer(commercial_user)
+
+    r, queries = _user_queries(api, "get", "/api/clients/")
+    assert r.status_code == 200
+    assert queries == []
+
+    payload = {"full_name": "X", "phone": "0600000000", "company_name": "X", "last_contact": "2025-01-01"}
+    r, first = _user_queries(api, "post", "/api/clients/", {**payload, "email": "a@x.com"})
+    assert r.status_code == 201
+    assert r.data["sales_contact"] == commercial_user.id
+    # Même téléphone que le premier : doublon probable, création confirmée
+    r, second = _user_queries(api, "post", "/api/clients/?allow_duplicate=true", {**payload, "email": "b@x.com"})
+    assert r.status_code == 201
+    assert len(first) == 1 and second == []
+
+
+@pytest.mark.django_db
+def test_role_change_revokes_claims(gestion_user, commercial_user):
+    api = _bearer(commercial_user)
+    assert api.get("/api/pipeline/me/").status_code == 200
+
+    admin = APIClient()
+    admin.force_authenticate(user=gestion_user)
+    assert admin.patch(f"/api/users/{commercial_user.id}/", {"role": "SUPPORT"}, format="json").status_code == 200
+
+    # L'ancien token porte role=COMMERCIAL mais l'utilisateur est désormais relu en base
+    assert api.get("/api/pipeline/me/").status_code == 403
+    payload = {"full_name": "X", "email": "c@x.com", "phone": "0600000000",
+               "company_name": "X", "last_contact": "2025-01-01"}
+    assert api.post("/api/clients/", payload, format="json").status_code == 403
+
+    # Une nouvelle connexion retrouve le chemin rapide avec le bon rôle
+    api = _bearer(commercial_user)
+    r, queries = _user_queries(api, "get", "/api/pipeline/me/")
+    assert r.status_code == 403 and queries == []
+
+
+@pytest.mark.django_db
+def test_role_change_outside_the_api_revokes_claims(commercial_user):
+    """Révocation portée par un signal : admin, shell et commandes sont couverts."""
+    api = _bearer(commercial_user)
+    assert api.get("/api/pipeline/me/").status_code == 200
+
+    commercial_user.role = "SUPPORT"
+    commercial_user.save()
+    assert api.get("/api/pipeline/me/").status_code == 403
+
+
+@pytest.mark.django_db
+def test_cached_user_is_copied_per_request(commercial_user):
+    user_cache.set(commercial_user.pk, commercial_user)
+    first, second = user_cache.get(commercial_user.pk), user_cache.get(commercial_user.pk)
+    assert first is not second and first is not commercial_user
+
+    first.role = "GESTION"
+    commercial_user.email = "modifie@example.com"
+    cached = user_cache.get(commercial_user.pk)
+    assert (cached.role, cached.email) == ("COMMERCIAL", "commercial@test.com")
+
+
+@pytest.mark.django_db
+def test_login_throttled_per_username_before_hashing(commercial_user, settings):
+    settings.LOGIN_THROTTLE = {**settings.LOGIN_THROTTLE, "RATES": {"ip": (100, 60), "username": (2, 60)}}
+    api = APIClient()
+    bad = {"username": "Commercial_Test ", "password": "wrong"}
+    statuses = [api.post(TOKEN_URL, bad, format="json").status_code for _ in range(2)]
+    assert statuses == [401, 401]
+
+    r = api.post(TOKEN_URL, {"username": "commercial_test", "password": "Azerty123$"}, format="json")
+    assert r.status_code == 429
+    assert "Retry-After" in r
+    assert "Server-Timing" not in r  # refusé avant toute vérification de mot de passe
+
+    # Un autre compte depuis la même IP reste possible
+    assert api.post(TOKEN_URL, {"username": "other", "password": "x"}, format="json").status_code == 401
+
+
+@pytest.mark.django_db
+def test_login_timings_only_exposed_in_debug(commercial_user, settings):
+    api = APIClient()
+    credentials = {"username": "commercial_test", "password": "Azerty123$"}
+    assert "Server-Timing" not in api.post(TOKEN_URL, credentials, format="json")
+
+    settings.DEBUG = True
+    r = api.post(TOKEN_URL, credentials, format="json")
+    timings = {name: float(dur.removeprefix("dur=")) for name, dur in
+               (part.split(";") for part in r["Server-Timing"].split(", "))}
+    assert set(timings) == {"db", "hash", "total"}
+    assert 0 <= timings["hash"] <= timings["total"]
+
+
+@pytest.mark.django_db
+def test_refresh_is_cached(commercial_user, django_assert_num_queries):
+    api = APIClient()
+    r = api.post(TOKEN_URL, {"username": "commercial_test", "password": "Azerty123$"}, format="json")
+
+    refresh = {"refresh": r.data["refresh"]}
+    first = api.post("/api/auth/jwt/refresh/", refresh, format="json")
+    with django_assert_num_queries(0):
+        second = api.post("/api/auth/jwt/refresh/", refresh, format="json")
+    assert second.data == first.data
+
+    # Révocation : l'entrée en cache n'est plus servie
+    revoke_user_tokens(commercial_user.id)
+    with django_assert_num_queries(1):
+        assert api.post("/api/auth/jwt/refresh/", refresh, format="json").status_code == 200
@@ -0,0 +1,73 @@
+# tests/api/test_autocomplete.py
+import pytest
+
+from crm.clients.models import Client
+from crm.textsearch import normalize, prefix_filter, prefix_key
+
+CLIENTS_URL = "/api/autocomplete/clients/"
+USERS_URL = "/api/autocomplete/users/"
+
+
+def test_normalize_ignores_case_accents_and_punctuation():
+    assert normalize("  Élodie   DUPONT-Martin ") == "elodie dupont martin"
+    assert normalize("Ça & Cie.") == "ca cie"
+    assert normalize(None) == ""
+
+
+@pytest.mark.django_db
+def test_prefix_search_reads_the_index_in_order():
+    plan = (Client.objects.filter(prefix_filter("search_name", "dup"))
+            .order_by(prefix_key("search_name")).values("id")[:10].explain())
+    assert "client_search_name_idx" in plan
+    # Lignes rendues dans l'ordre de l'index : pas de tri avant le LIMIT
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.django_db
+def test_clients_match_name_or_company_prefix(client_as, support_user, commercial_user, client_of_commercial,
+                                              client_of_commercial_2, other_client, django_assert_num_queries):
+    client_of_commercial.full_name = "Élodie Alphand"
+    client_of_commercial.save(update_fields=["full_name"])
+    assert Client.objects.get(pk=client_of_commercial.pk).search_name == "elodie alphand"
+
+    api = client_as(support_user)
+    # Une lecture d'index par colonne (nom, entreprise)
+    with django_assert_num_queries(2):
+        r = api.get(CLIENTS_URL, {"q": "CLIENT"})
+    assert r.status_code == 200
+    assert [(c["id"], c["match"]) for c in r.data["results"]] == [
+        (other_client.pk, "full_name"), (client_of_commercial_2.pk, "full_name"),
+    ]
+
+    # Accents ignorés ; un client trouvé par ses deux colonnes n'apparaît qu'une fois
+    r = api.get(CLIENTS_URL, {"q": "elo"})
+    assert [c["id"] for c in r.data["results"]] == [client_of_commercial.pk]
+    r = api.get(CLIENTS_URL, {"q": "al"})
+    assert [(c["id"], c["match"]) for c in r.data["results"]] == [(client_of_commercial.pk, "company_name")]
+
+    # Limite, préfixe trop court, périmètre « mes clients »
+    assert len(api.get(CLIENTS_URL, {"q": "cl", "limit": 1}).data["results"]) == 1
+    assert api.get(CLIENTS_URL, {"q": "c"}).data["results"] == []
+    r = client_as(commercial_user).get(CLIENTS_URL, {"q": "alpha", "mine": "true"})
+    assert [c["id"] for c in r.data["results"]] == [client_of_commercial.pk]
+    assert client_as(commercial_user).get(CLIENTS_URL, {"q": "beta", "mine": "true"}).data["results"] == []
+
+
+@pytest.mark.django_db
+def test_users_scope_follows_role(api_client, client_as, gestion_user, commercial_user, commercial_user_2,
+                                  support_user):
+    r = client_as(gestion_user).get(USERS_URL, {"q": "commercial", "role": "commercial"})
+    assert [u["username"] for u in r.data["results"]] == ["commercial_test", "commercial_test_2"]
+
+    commercial_user_2.is_active = False
+    commercial_user_2.save()
+    r = client_as(gestion_user).get(USERS_URL, {"q": "commercial_test"})
+    assert [u["id"] for u in r.data["results"]] == [commercial_user.pk]
+
+    # Hors GESTION : uniquement soi-même
+    r = client_as(support_user).get(USERS_URL, {"q": "commercial"})
+    assert r.data["results"] == []
+    r = client_as(support_user).get(USERS_URL, {"q": "support"})
+    assert [u["id"] for u in r.data["results"]] == [support_user.pk]
+
+    assert api_client.get(USERS_URL, {"q": "commercial"}).status_code == 401
@@ -0,0 +1,61 @@
+# tests/api/test_client_duplicates.py
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from crm.clients.duplicates import find_duplicates, find_matches
+from crm.clients.models import Client
+from crm.textsearch import phone_key
+
+CLIENTS_URL = "/api/clients/"
+
+
+def _client(full_name, email, phone, company_name):
+    return Client.objects.create(full_name=full_name, email=email, phone=phone, company_name=company_name,
+                                 last_contact="2025-01-01")
+
+
+def test_phone_key_ignores_format_and_country_code():
+    assert phone_key("+33 6 12 34 56 78") == phone_key("06.12.34.56.78") == "0612345678"
+    assert phone_key("12") == ""
+
+
+@pytest.mark.django_db
+def test_report_finds_pairs_by_blocking_keys(django_assert_max_num_queries):
+    dupont = _client("Jean Dupont", "jean.dupont@acme.fr", "0612345678", "Acme SARL")
+    same_email = _client("J. Dupont", "Jean.Dupont@ACME.fr", "0700000001", "Autre")
+    same_phone = _client("Paul Martin", "paul@martin.fr", "+33 6 12 34 56 78", "Martin Co")
+    similar_name = _client("Jean Dupond", "contact@acme.fr", "0700000002", "SARL ACME")
+    _client("Lucie Durand", "lucie@globex.fr", "0700000003", "Globex")
+
+    # Nombre de requêtes indépendant du volume : une lecture par bloc
+    with django_assert_max_num_queries(4):
+        pairs = {(p.first_id, p.second_id): p.reasons for p in find_duplicates()}
+    assert pairs == {
+        (dupont.pk, same_email.pk): {"email"},
+        (dupont.pk, same_phone.pk): {"phone"},
+        (dupont.pk, similar_name.pk): {"company"},
+    }
+
+    out = StringIO()
+    call_command("find_duplicate_clients", stdout=out)
+    assert "3 paire(s)" in out.getvalue() and "même e-mail" in out.getvalue()
+
+    matches = find_matches({"full_name": "Jean Dupont", "company_name": "acme", "email": "x@y.fr", "phone": ""})
+    assert {m["id"] for m in matches} == {dupont.pk, similar_name.pk}
+
+
+@pytest.mark.django_db
+def test_create_checks_duplicates_unless_confirmed(client_as, gestion_user, client_of_commercial):
+    api = client_as(gestion_user)
+    payload = {"full_name": "Client  Alpha", "email": "ALPHA@example.com", "phone": "0600000001",
+               "company_name": "Alpha Corp.", "last_contact": "2025-01-01"}
+
+    r = api.post(CLIENTS_URL, payload, format="json")
+    assert r.status_code == 400
+    assert f"#{client_of_commercial.pk}" in r.data["duplicates"][0]
+    assert not Client.objects.filter(email="ALPHA@example.com").exists()
+
+    r = api.post(f"{CLIENTS_URL}?allow_duplicate=true", payload, format="json")
+    assert r.status_code == 201
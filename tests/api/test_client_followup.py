@@ -0,0 +1,60 @@
+# tests/api/test_client_followup.py
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.utils import timezone
+
+from crm.clients.models import Client
+
+TO_CALL_URL = "/api/clients/to-call/"
+
+
+def _client(n, owner, days_ago):
+    return Client.objects.create(full_name=f"Relance {n}", email=f"relance{n}@example.com", phone=f"06000000{n:02d}",
+                                 company_name=f"Société {n}", sales_contact=owner,
+                                 last_contact=timezone.localdate() - timedelta(days=days_ago))
+
+
+@pytest.mark.django_db
+def test_commercial_walks_stale_clients_page_by_page(client_as, commercial_user, commercial_user_2, signed_contract,
+                                                     django_assert_num_queries):
+    # signed_contract : client_of_commercial (dernier contact : fixture), 500 € dus
+    stale = [_client(n, commercial_user, days_ago) for n, days_ago in enumerate((90, 45, 45, 31, 10))]
+    _client(9, commercial_user_2, 200)
+    client = Client.objects.get(pk=signed_contract.client_id)
+    client.last_contact = timezone.localdate() - timedelta(days=60)
+    client.save()
+
+    api = client_as(commercial_user)
+    with django_assert_num_queries(1):
+        r = api.get(TO_CALL_URL, {"days": 30, "page_size": 2})
+    assert r.status_code == 200
+    first = r.data["results"]
+    assert [c["id"] for c in first] == [stale[0].pk, client.pk]
+    assert first[0]["days_since_contact"] == 90 and Decimal(first[1]["contracts_amount_due"]) == Decimal("500")
+
+    # Page suivante : reprise après la dernière ligne, ex æquo départagés par ID
+    r = api.get(r.data["next"])
+    assert [c["id"] for c in r.data["results"]] == [stale[1].pk, stale[2].pk]
+    r = api.get(r.data["next"])
+    assert [c["id"] for c in r.data["results"]] == [stale[3].pk] and r.data["next"] is None
+
+
+@pytest.mark.django_db
+def test_scope_and_parameters(client_as, gestion_user, commercial_user, commercial_user_2, support_user):
+    mine = _client(1, commercial_user, 40)
+    other = _client(2, commercial_user_2, 50)
+
+    r = client_as(gestion_user).get(TO_CALL_URL)
+    assert [c["id"] for c in r.data["results"]] == [other.pk, mine.pk]
+    r = client_as(gestion_user).get(TO_CALL_URL, {"sales_contact": commercial_user.pk})
+    assert [c["id"] for c in r.data["results"]] == [mine.pk]
+    assert client_as(commercial_user).get(TO_CALL_URL, {"days": 45}).data["results"] == []
+
+    assert client_as(support_user).get(TO_CALL_URL).status_code == 403
+    for days in ("-1", "1000000", "²", "abc"):
+        assert client_as(commercial_user).get(TO_CALL_URL, {"days": days}).status_code == 400
+    assert client_as(commercial_user).get(TO_CALL_URL, {"days": 36500}).status_code == 200
+    assert client_as(gestion_user).get(TO_CALL_URL, {"sales_contact": "²"}).status_code == 400
+    assert client_as(commercial_user).get(TO_CALL_URL, {"after": "pas-une-date,1"}).status_code == 404
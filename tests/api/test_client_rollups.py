@@ -0,0 +1,103 @@
+# tests/api/test_client_rollups.py
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from crm.clients.models import Client
+from crm.clients.rollups import reconcile
+from crm.contracts.models import Contract
+from crm.events.models import Event
+
+CLIENTS_URL = "/api/clients/"
+
+
+def _rollups(client):
+    c = Client.objects.get(pk=client.pk)
+    return (c.contracts_count, c.signed_contracts_count, c.contracts_total_amount, c.contracts_amount_due,
+            c.next_event_start)
+
+
+@pytest.mark.django_db
+def test_rollups_follow_contract_and_event_writes(client_of_commercial, client_of_commercial_2, signed_contract,
+                                                  unsigned_contract, event_assigned_to_support):
+    assert _rollups(client_of_commercial) == (2, 1, Decimal("5000"), Decimal("1500"),
+                                              event_assigned_to_support.event_start)
+
+    # Signature + paiement, puis déplacement vers un autre client
+    contract = Contract.objects.get(pk=unsigned_contract.pk)
+    contract.is_signed, contract.amount_due = True, 0
+    contract.save()
+    assert _rollups(client_of_commercial)[:4] == (2, 2, Decimal("5000"), Decimal("500"))
+    contract.client = client_of_commercial_2
+    contract.save()
+    assert _rollups(client_of_commercial_2)[:4] == (1, 1, Decimal("2000"), Decimal("0"))
+
+    # Contrat chargé avec des champs différés, puis déplacé : les deux clients sont recalculés
+    deferred = Contract.objects.only("pk", "client").get(pk=unsigned_contract.pk)
+    deferred.client = client_of_commercial
+    deferred.save()
+    assert _rollups(client_of_commercial_2)[:4] == (0, 0, Decimal("0"), Decimal("0"))
+    assert _rollups(client_of_commercial)[:2] == (2, 2)
+    assert reconcile() == 0
+    deferred.client = client_of_commercial_2
+    deferred.save()
+
+    # Événement rattaché à un autre client : les deux prochains événements suivent
+    event = Event.objects.get(pk=event_assigned_to_support.pk)
+    event.client = client_of_commercial_2
+    event.save()
+    assert _rollups(client_of_commercial)[4] is None
+    assert _rollups(client_of_commercial_2)[4] == event.event_start
+    event = Event.objects.only("pk").get(pk=event.pk)
+    event.client_id = client_of_commercial.pk
+    event.save()
+    assert (_rollups(client_of_commercial)[4], _rollups(client_of_commercial_2)[4]) == (event.event_start, None)
+
+    # Suppression du contrat à événement : cascade → prochain événement effacé
+    Contract.objects.get(pk=signed_contract.pk).delete()
+    assert _rollups(client_of_commercial) == (0, 0, Decimal("0"), Decimal("0"), None)
+    assert reconcile() == 0
+
+
+@pytest.mark.django_db
+def test_saving_a_stale_client_keeps_rollups(client_of_commercial):
+    client = Client.objects.get(pk=client_of_commercial.pk)
+    Contract.objects.create(client=client_of_commercial, sales_contact=None, total_amount=100, amount_due=40)
+
+    # Instance chargée avant l'écriture du contrat (ex. PATCH concurrent) : agrégats non écrasés
+    client.full_name = "Client Alpha bis"
+    client.save()
+    assert _rollups(client_of_commercial)[:4] == (1, 0, Decimal("100"), Decimal("40"))
+    assert Client.objects.get(pk=client.pk).full_name == "Client Alpha bis"
+    assert reconcile() == 0
+
+
+@pytest.mark.django_db
+def test_clients_sorted_and_filtered_on_rollups(client_as, gestion_user, client_of_commercial, other_client,
+                                                client_of_commercial_2, signed_contract, unsigned_contract,
+                                                signed_contract_commercial_2):
+    api = client_as(gestion_user)
+    r = api.get(CLIENTS_URL, {"ordering": "-contracts_amount_due,id"})
+    assert [row["id"] for row in r.data["results"]] == [client_of_commercial.id, client_of_commercial_2.id,
+                                                        other_client.id]
+    assert r.data["results"][0]["contracts_amount_due"] == "1500.00"
+
+    r = api.get(CLIENTS_URL, {"contracts_count__gte": 1, "next_event_start__isnull": "true"})
+    assert {row["id"] for row in r.data["results"]} == {client_of_commercial.id, client_of_commercial_2.id}
+
+
+@pytest.mark.django_db
+def test_reconcile_command_fixes_bulk_updates(client_of_commercial, other_client, event_assigned_to_support):
+    Contract.objects.filter(pk=event_assigned_to_support.contract_id).update(amount_due=0)
+    assert _rollups(client_of_commercial)[3] == Decimal("500")
+    # Écarts impliquant NULL : prochain événement perdu / fantôme
+    Client.objects.filter(pk=client_of_commercial.pk).update(next_event_start=None)
+    Client.objects.filter(pk=other_client.pk).update(next_event_start=event_assigned_to_support.event_start)
+
+    out = StringIO()
+    call_command("reconcile_clients", stdout=out)
+    assert "2 client(s)" in out.getvalue()
+    assert _rollups(client_of_commercial)[3:] == (Decimal("0"), event_assigned_to_support.event_start)
+    assert _rollups(other_client)[4] is None
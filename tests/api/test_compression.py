@@ -0,0 +1,95 @@
+# tests/api/test_compression.py
+import gzip
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from crm.clients.models import Client
+from crm.compression import negotiate
+
+
+@pytest.fixture
+def many_clients(db, commercial_user):
+    Client.objects.bulk_create([
+        Client(full_name=f"Client {i}", email=f"client{i}@example.com", phone="0600000000",
+               company_name="Acme", last_contact=timezone.now().date(), sales_contact=commercial_user)
+        for i in range(10)
+    ])
+
+
+@pytest.mark.django_db
+def test_large_list_is_gzipped_and_decodes_to_same_json(client_as, gestion_user, many_clients):
+    api = client_as(gestion_user)
+    plain = api.get("/api/clients/")
+    packed = api.get("/api/clients/", HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+    assert "Content-Encoding" not in plain
+    assert packed["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in packed["Vary"]
+    assert int(packed["Content-Length"]) < len(plain.content)
+    assert gzip.decompress(packed.content) == plain.content
+
+
+@pytest.mark.django_db
+def test_small_or_refused_responses_stay_plain(client_as, gestion_user, many_clients, settings):
+    api = client_as(gestion_user)
+    small = api.get("/api/clients/", {"fields": "id"}, HTTP_ACCEPT_ENCODING="gzip")
+    assert "Content-Encoding" not in small
+
+    refused = api.get("/api/clients/", HTTP_ACCEPT_ENCODING="gzip;q=0, identity")
+    assert "Content-Encoding" not in refused
+
+    settings.COMPRESSION_MIN_SIZE = 1_000_000
+    assert "Content-Encoding" not in api.get("/api/clients/", HTTP_ACCEPT_ENCODING="gzip")
+
+
+def _decoder(coding):
+    """Décompression de référence ; test ignoré si la dépendance optionnelle manque."""
+    if coding == "br":
+        return pytest.importorskip("brotli").decompress
+    zstandard = pytest.importorskip("zstandard")
+    return lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+
+def _without_stamp(ics: bytes) -> list[bytes]:
+    """Lignes du calendrier hors DTSTAMP (horodatage du rendu)."""
+    return [line for line in ics.split(b"\r\n") if not line.startswith(b"DTSTAMP")]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("coding", ["br", "zstd"])
+def test_large_list_uses_optional_codec_and_decodes_to_same_json(client_as, gestion_user, many_clients, coding):
+    decode = _decoder(coding)
+    api = client_as(gestion_user)
+    plain = api.get("/api/clients/")
+    packed = api.get("/api/clients/", HTTP_ACCEPT_ENCODING=f"gzip;q=0.5, {coding}")
+
+    assert packed["Content-Encoding"] == coding
+    assert "Accept-Encoding" in packed["Vary"]
+    assert int(packed["Content-Length"]) == len(packed.content) < len(plain.content)
+    assert decode(packed.content) == plain.content
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("coding", ["br", "zstd"])
+def test_streamed_export_is_compressed_block_by_block(client_as, support_user, event_assigned_to_support, coding):
+    decode = _decoder(coding)
+    api = client_as(support_user)
+    today = timezone.localdate()
+    window = {"start": today.isoformat(), "end": (today + timedelta(days=7)).isoformat()}
+    plain = b"".join(api.get("/api/events/agenda/ics/", window).streaming_content)
+    packed = api.get("/api/events/agenda/ics/", window, HTTP_ACCEPT_ENCODING=coding)
+
+    assert packed.streaming and packed["Content-Encoding"] == coding
+    assert not packed.has_header("Content-Length")
+    assert _without_stamp(decode(b"".join(packed.streaming_content))) == _without_stamp(plain)
+    assert b"Salon Tech" in plain
+
+
+def test_negotiation_uses_q_values_then_server_preference():
+    available = ("zstd", "br", "gzip")
+    assert negotiate("gzip, br, zstd", available) == "zstd"
+    assert negotiate("gzip;q=1, br;q=0.5", available) == "gzip"
+    assert negotiate("br;q=0, *;q=0.1", available) == "zstd"
+    assert negotiate("identity", available) is None
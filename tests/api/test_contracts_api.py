@@ -1,7 +1,11 @@
 # tests/test_contracts_api.py
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 
+from crm.contracts.models import Contract
+
 CONTRACTS_URL = "/api/contracts/"
 
 @pytest.mark.django_db
@@ -51,4 +55,25 @@ def test_commercial_cannot_update_contract(commercial_user, signed_contract):
     api = APIClient()
     api.force_authenticate(user=commercial_user)
     r = api.patch(f"{CONTRACTS_URL}{signed_contract.id}/", {"amount_due": 0}, format="json")
-    assert r.status_code in (403, 405)
\ No newline at end of file
+    assert r.status_code in (403, 405)
+
+
+@pytest.mark.django_db
+def test_has_event_filter_is_an_exists_subquery(commercial_user, client_of_commercial, event_assigned_to_support):
+    """
+    `?has_event=false` : contrats signés encore sans événement (liste de sélection de la CLI).
+    """
+    free = Contract.objects.create(client=client_of_commercial, sales_contact=commercial_user,
+                                   total_amount=800, amount_due=0, is_signed=True)
+    api = APIClient()
+    api.force_authenticate(user=commercial_user)
+
+    with CaptureQueriesContext(connection) as ctx:
+        r = api.get(CONTRACTS_URL, {"is_signed": "true", "has_event": "false"})
+    assert [it["id"] for it in r.data["results"]] == [free.id]
+    assert r.data["results"][0]["has_event"] is False
+    assert "NOT EXISTS" in ctx.captured_queries[-1]["sql"]
+
+    r = api.get(CONTRACTS_URL, {"has_event": "true", "compact": "true"})
+    assert [it["id"] for it in r.data["results"]] == [event_assigned_to_support.contract_id]
+    assert api.get(f"{CONTRACTS_URL}{free.id}/").data["has_event"] is False
@@ -0,0 +1,68 @@
+# tests/api/test_deletion.py
+from decimal import Decimal
+
+import pytest
+
+from crm.clients.models import Client
+from crm.clients.rollups import reconcile
+from crm.contracts.models import Contract
+from crm.deletion import delete_client
+from crm.events.models import Event
+from crm.pipeline.models import PipelineSummary
+from crm.pipeline.services import rebuild_summary
+
+
+def _values(s):
+    return s.clients_count, s.contracts_count, s.unsigned_contracts_count, s.amount_due_total
+
+
+@pytest.mark.django_db
+def test_client_delete_removes_graph_in_chunks(settings, client_as, gestion_user, commercial_user,
+                                               commercial_user_2, client_of_commercial, event_assigned_to_support,
+                                               unsigned_contract, signed_contract_commercial_2):
+    settings.DELETE_CHUNK_SIZE = 1
+    # Contrat du client suivi par un autre commercial : sa contribution doit lui être retirée
+    Contract.objects.create(client=client_of_commercial, sales_contact=commercial_user_2,
+                            total_amount=300, amount_due=300, is_signed=False)
+
+    r = client_as(gestion_user).delete(f"/api/clients/{client_of_commercial.pk}/")
+    assert r.status_code == 204
+
+    assert not Client.objects.filter(pk=client_of_commercial.pk).exists()
+    assert not Contract.objects.filter(client_id=client_of_commercial.pk).exists()
+    assert not Event.objects.filter(client_id=client_of_commercial.pk).exists()
+    assert Contract.objects.filter(pk=signed_contract_commercial_2.pk).exists()
+
+    # Compteurs maintenus sans signaux = recalcul complet
+    maintained = {u.pk: _values(PipelineSummary.objects.get(sales_contact=u)) for u in (commercial_user, commercial_user_2)}
+    assert maintained == {pk: _values(rebuild_summary(pk)) for pk in maintained}
+    assert maintained[commercial_user.pk] == (0, 0, 0, Decimal("0"))
+
+
+@pytest.mark.django_db
+def test_interrupted_client_delete_leaves_consistent_rollups(settings, monkeypatch, client_of_commercial,
+                                                             signed_contract, unsigned_contract,
+                                                             event_assigned_to_support):
+    settings.DELETE_CHUNK_SIZE = 1
+    monkeypatch.setattr(Client, "delete", lambda self: (_ for _ in ()).throw(RuntimeError("coupure")))
+    with pytest.raises(RuntimeError):
+        delete_client(client_of_commercial)
+
+    # Dépendances supprimées, client toujours là : ses agrégats ont suivi chaque lot
+    client = Client.objects.get(pk=client_of_commercial.pk)
+    assert (client.contracts_count, client.contracts_amount_due, client.next_event_start) == (0, Decimal("0"), None)
+    assert reconcile() == 0
+
+
+@pytest.mark.django_db
+def test_user_delete_detaches_rows_in_chunks(settings, client_as, gestion_user, commercial_user, support_user,
+                                             client_of_commercial, signed_contract, unsigned_contract,
+                                             event_assigned_to_support):
+    settings.DELETE_CHUNK_SIZE = 1
+    for user in (commercial_user, support_user):
+        assert client_as(gestion_user).delete(f"/api/users/{user.pk}/").status_code == 204
+
+    assert Client.objects.get(pk=client_of_commercial.pk).sales_contact_id is None
+    assert not Contract.objects.filter(sales_contact__isnull=False).exists()
+    assert Event.objects.get(pk=event_assigned_to_support.pk).support_contact_id is None
+    assert not PipelineSummary.objects.filter(sales_contact_id=commercial_user.pk).exists()
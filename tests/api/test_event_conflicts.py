@@ -0,0 +1,80 @@
+# tests/api/test_event_conflicts.py
+import pytest
+from datetime import timedelta
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from crm.contracts.models import Contract
+from crm.events.conflicts import detect_conflicts
+from crm.events.models import Event
+
+EVENTS_URL = "/api/events/"
+
+
+def _signed_contract(client, sales_contact):
+    return Contract.objects.create(client=client, sales_contact=sales_contact,
+                                   total_amount=1000, amount_due=0, is_signed=True)
+
+
+def test_detect_conflicts_sweep_line():
+    """Le balayage ne signale que les paires qui se chevauchent réellement."""
+    t0 = timezone.now()
+    h = timedelta(hours=1)
+    rows = [
+        (1, 7, "Salle A", t0, t0 + 2 * h),
+        (2, 7, "Salle B", t0 + h, t0 + 3 * h),      # chevauche #1 (support 7)
+        (3, 8, "Salle A", t0 + 2 * h, t0 + 4 * h),  # démarre à la fin de #1 → pas de conflit
+    ]
+    conflicts = detect_conflicts(rows)
+    assert conflicts == [{"resource": "support_contact", "value": 7, "events": [1, 2]}]
+
+
+@pytest.mark.django_db
+def test_create_event_refused_when_support_double_booked(gestion_user, event_assigned_to_support,
+                                                         client_of_commercial, commercial_user, support_user):
+    """GESTION ne peut pas affecter un support déjà occupé sur le même créneau."""
+    contract = _signed_contract(client_of_commercial, commercial_user)
+    api = APIClient()
+    api.force_authenticate(user=gestion_user)
+
+    r = api.post(EVENTS_URL, {
+        "contract": contract.id,
+        "client": client_of_commercial.id,
+        "support_contact": support_user.id,
+        "event_name": "Doublon",
+        "event_start": (event_assigned_to_support.event_start + timedelta(hours=1)).isoformat(),
+        "event_end": (event_assigned_to_support.event_end + timedelta(hours=1)).isoformat(),
+        "location": "Autre salle",
+        "attendees": 10,
+    }, format="json")
+    assert r.status_code == 400
+    assert "support_contact" in r.data
+
+
+@pytest.mark.django_db
+def test_update_event_location_conflict_and_report(gestion_user, event_assigned_to_support,
+                                                   client_of_commercial, commercial_user):
+    """Déplacer un événement dans un lieu occupé est refusé ; le rapport liste les conflits existants."""
+    other = Event.objects.create(
+        contract=_signed_contract(client_of_commercial, commercial_user),
+        client=client_of_commercial,
+        event_name="Atelier",
+        event_start=event_assigned_to_support.event_start,
+        event_end=event_assigned_to_support.event_end,
+        location="Salle 12",
+        attendees=20,
+    )
+    api = APIClient()
+    api.force_authenticate(user=gestion_user)
+
+    r = api.patch(f"{EVENTS_URL}{other.id}/", {"location": event_assigned_to_support.location}, format="json")
+    assert r.status_code == 400
+    assert "location" in r.data
+
+    # Conflit créé hors API (ex. import) → remonté par le rapport
+    Event.objects.filter(pk=other.pk).update(location=event_assigned_to_support.location)
+    report = api.get(f"{EVENTS_URL}conflicts/")
+    assert report.status_code == 200
+    assert report.data["count"] == 1
+    assert report.data["results"][0]["resource"] == "location"
+    assert set(report.data["results"][0]["events"]) == {event_assigned_to_support.id, other.id}
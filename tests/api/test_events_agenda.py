@@ -0,0 +1,87 @@
+# tests/api/test_events_agenda.py
+import pytest
+from datetime import datetime, time, timedelta
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from crm.contracts.models import Contract
+from crm.events.agenda import _ics_line
+from crm.events.models import Event
+
+AGENDA_URL = "/api/events/agenda/"
+
+
+def _event_on(day, hour, contract, support):
+    start = datetime.combine(day, time(hour), tzinfo=timezone.get_current_timezone())
+    return Event.objects.create(
+        contract=contract, client=contract.client, support_contact=support,
+        event_name=f"Event {day} {hour}h", event_start=start, event_end=start + timedelta(hours=1),
+        location=f"Salle {hour}", attendees=5,
+    )
+
+
+@pytest.fixture
+def week_events(db, client_of_commercial, commercial_user, support_user):
+    monday = timezone.localdate() - timedelta(days=timezone.localdate().weekday())
+    contracts = [
+        Contract.objects.create(client=client_of_commercial, sales_contact=commercial_user,
+                                total_amount=100, amount_due=0, is_signed=True)
+        for _ in range(4)
+    ]
+    return monday, [
+        _event_on(monday, 9, contracts[0], support_user),
+        _event_on(monday, 14, contracts[1], support_user),
+        _event_on(monday + timedelta(days=2), 10, contracts[2], support_user),
+        _event_on(monday + timedelta(days=8), 10, contracts[3], support_user),  # hors fenêtre
+    ]
+
+
+@pytest.mark.django_db
+def test_agenda_buckets_by_day(support_user, week_events):
+    """Le support reçoit ses événements de la semaine regroupés par jour, sans pagination."""
+    monday, events = week_events
+    api = APIClient()
+    api.force_authenticate(user=support_user)
+
+    r = api.get(AGENDA_URL, {"start": monday.isoformat(), "end": (monday + timedelta(days=7)).isoformat()})
+    assert r.status_code == 200
+    assert r.data["count"] == 3
+    assert [b["key"] for b in r.data["buckets"]] == [monday.isoformat(), (monday + timedelta(days=2)).isoformat()]
+    assert [e["id"] for e in r.data["buckets"][0]["events"]] == [events[0].id, events[1].id]
+
+    r_week = api.get(AGENDA_URL, {"start": monday.isoformat(),
+                                  "end": (monday + timedelta(days=14)).isoformat(), "bucket": "week"})
+    assert [b["count"] for b in r_week.data["buckets"]] == [3, 1]
+
+
+@pytest.mark.django_db
+def test_agenda_rejects_invalid_window(support_user):
+    api = APIClient()
+    api.force_authenticate(user=support_user)
+    assert api.get(AGENDA_URL, {"start": "2025-01-10", "end": "2025-01-01"}).status_code == 400
+    assert api.get(AGENDA_URL, {"start": "2025-01-01", "end": "2026-01-01"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_agenda_ics_export_is_streamed(support_user, week_events):
+    monday, events = week_events
+    api = APIClient()
+    api.force_authenticate(user=support_user)
+
+    r = api.get(f"{AGENDA_URL}ics/", {"start": monday.isoformat(), "end": (monday + timedelta(days=30)).isoformat()})
+    assert r.status_code == 200
+    assert r.streaming
+    body = b"".join(r.streaming_content).decode()
+    assert body.startswith("BEGIN:VCALENDAR\r\n")
+    assert body.count("BEGIN:VEVENT") == 4
+    assert f"UID:event-{events[0].id}@epic-crm" in body
+
+
+def test_ics_lines_fold_at_75_octets_without_splitting_characters():
+    line = "SUMMARY:" + "Séminaire d’été à Évry — " * 8
+    folded = _ics_line(line).encode("utf-8")
+    parts = folded[:-2].split(b"\r\n")
+    assert len(parts) > 1 and all(len(p) <= 75 for p in parts)
+    assert all(p.startswith(b" ") for p in parts[1:])
+    assert "".join(p.decode("utf-8") for p in [parts[0]] + [p[1:] for p in parts[1:]]) == line
+    assert _ics_line("BEGIN:VEVENT") == "BEGIN:VEVENT\r\n"
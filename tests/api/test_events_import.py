@@ -0,0 +1,102 @@
+# tests/api/test_events_import.py
+import io
+import json
+from datetime import timedelta
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from crm.contracts.models import Contract
+from crm.events.importer import import_events, read_csv
+from crm.events.models import Event
+
+IMPORT_URL = "/api/events/import/"
+
+
+def _when(days, hour):
+    return (timezone.localtime() + timedelta(days=days)).strftime(f"%Y-%m-%d {hour:02d}:00")
+
+
+def _csv(rows, sep=","):
+    lines = [sep.join(["contract", "event_name", "event_start", "event_end", "location", "attendees", "notes"])]
+    lines += [sep.join(str(v) for v in row) for row in rows]
+    return "\n".join(lines) + "\n"
+
+
+@pytest.fixture
+def signed_contracts(db, client_of_commercial, commercial_user):
+    return [
+        Contract.objects.create(client=client_of_commercial, sales_contact=commercial_user,
+                                total_amount=1000, amount_due=0, is_signed=True)
+        for _ in range(30)
+    ]
+
+
+@pytest.mark.django_db
+def test_api_import_reports_row_errors(commercial_user, signed_contracts, unsigned_contract,
+                                       signed_contract_commercial_2):
+    """Les lignes valides sont créées ; chaque ligne invalide est rapportée avec ses erreurs."""
+    content = _csv([
+        (signed_contracts[0].id, "Salon", _when(3, 9), _when(3, 12), "Lyon", 40, "ok"),
+        (unsigned_contract.id, "Non signé", _when(3, 9), _when(3, 12), "Lyon", 40, ""),
+        (signed_contract_commercial_2.id, "Pas à moi", _when(3, 9), _when(3, 12), "Nice", 10, ""),
+        (signed_contracts[0].id, "Doublon", _when(4, 9), _when(4, 12), "Lyon", 40, ""),
+        (signed_contracts[1].id, "Dates", _when(3, 12), _when(3, 9), "Lille", 0, ""),
+    ], sep=";")
+    api = APIClient()
+    api.force_authenticate(user=commercial_user)
+
+    r = api.post(IMPORT_URL, {"file": SimpleUploadedFile("events.csv", content.encode())}, format="multipart")
+    assert r.status_code == 201
+    assert r.data["created"] == 1
+    assert r.data["last_row"] == 5
+    assert [e["row"] for e in r.data["errors"]] == [2, 3, 4, 5]
+    assert len(r.data["errors"][3]["errors"]) == 2  # participants + dates
+    assert Event.objects.filter(contract=signed_contracts[0]).exists()
+
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("encoding", ["utf-8-sig", "cp1252"])
+def test_api_import_accepts_excel_encodings(commercial_user, signed_contracts, encoding):
+    """Export Excel FR (Windows-1252) ou UTF-8 avec BOM : accents conservés, pas d'erreur 500."""
+    content = _csv([(signed_contracts[0].id, "Séminaire d’été", _when(3, 9), _when(3, 12), "Défense", 40, "")])
+    api = APIClient()
+    api.force_authenticate(user=commercial_user)
+
+    upload = SimpleUploadedFile("events.csv", content.encode(encoding))
+    r = api.post(IMPORT_URL, {"file": upload}, format="multipart")
+    assert r.status_code == 201 and r.data["errors"] == []
+    event = Event.objects.get(contract=signed_contracts[0])
+    assert (event.event_name, event.location) == ("Séminaire d’été", "Défense")
+
+@pytest.mark.django_db
+def test_import_resolves_contracts_once_per_chunk(signed_contracts, django_assert_max_num_queries):
+    """Un paquet = 1 requête de résolution des contrats + 1 insertion groupée (pas de requête par ligne)."""
+    content = _csv([(c.id, f"Event {c.id}", _when(5, 10), _when(5, 11), f"Salle {c.id}", 5, "")
+                    for c in signed_contracts])
+    with django_assert_max_num_queries(8):
+        report = import_events(read_csv(io.StringIO(content)), chunk_size=len(signed_contracts))
+    assert report.created == len(signed_contracts)
+    assert not report.errors
+
+
+@pytest.mark.django_db
+def test_import_command_resumes_from_checkpoint(tmp_path, signed_contracts):
+    path = tmp_path / "events.csv"
+    path.write_text(_csv([(c.id, "Event", _when(6, 10), _when(6, 11), f"Salle {c.id}", 5, "")
+                          for c in signed_contracts[:6]]))
+    # Simule une interruption après 4 lignes déjà importées
+    for c in signed_contracts[:4]:
+        Event.objects.create(contract=c, client=c.client, event_name="Event", attendees=5,
+                             event_start=timezone.now() + timedelta(days=6),
+                             event_end=timezone.now() + timedelta(days=6, hours=1), location=f"Salle {c.id}")
+    (tmp_path / "events.csv.checkpoint.json").write_text(json.dumps({"last_row": 4}))
+
+    call_command("import_events", str(path), "--resume", "--chunk-size", "2", stdout=io.StringIO())
+
+    assert Event.objects.filter(contract__in=signed_contracts[:6]).count() == 6
+    assert not (tmp_path / "events.csv.checkpoint.json").exists()
@@ -0,0 +1,66 @@
+# tests/api/test_fast_rendering.py
+import pytest
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from crm.clients.models import Client
+from crm.clients.views import ClientViewSet
+from crm.contracts.views import ContractViewSet
+from crm.events.models import Event
+from crm.events.views import EventViewSet
+from crm.renderers import FastJSONRenderer
+
+# Sans orjson, `FastJSONRenderer` retombe sur DRF : les comparaisons ne prouveraient rien
+pytest.importorskip("orjson")
+
+URLS = [
+    ("/api/clients/", {}, ClientViewSet),
+    ("/api/clients/", {"fields": "id,sales_contact_username"}, ClientViewSet),
+    ("/api/contracts/", {}, ContractViewSet),
+    ("/api/contracts/", {"compact": "true"}, ContractViewSet),
+    ("/api/events/", {}, EventViewSet),
+    ("/api/events/", {"omit": "notes"}, EventViewSet),
+]
+
+
+@pytest.fixture
+def mixed_rows(db, event_assigned_to_support, unsigned_contract):
+    """Lignes complètes + relations nulles (client non assigné, événement sans support), texte non ASCII."""
+    Client.objects.create(
+        full_name="Zoé « Sans commercial »", email="zoe@example.com", phone="0600000000",
+        company_name="Café Crème", last_contact=timezone.now().date(), sales_contact=None,
+    )
+    now = timezone.now()
+    Event.objects.create(
+        contract=unsigned_contract, client=unsigned_contract.client, support_contact=None,
+        event_name="Séminaire", event_start=now, event_end=now, location="Lyon", attendees=12, notes="",
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url,params,viewset", URLS)
+def test_fast_list_output_is_byte_identical(client_as, gestion_user, mixed_rows, settings, monkeypatch,
+                                            url, params, viewset):
+    api = client_as(gestion_user)
+    fast = api.get(url, params)
+    assert isinstance(fast.accepted_renderer, FastJSONRenderer)
+
+    # Les vues lient `renderer_classes` à l'import : le réglage DRF seul ne changerait rien
+    settings.FAST_LIST_SERIALIZATION = False
+    monkeypatch.setattr(viewset, "renderer_classes", [JSONRenderer])
+    reference = api.get(url, params)
+    assert type(reference.accepted_renderer) is JSONRenderer
+
+    assert fast.status_code == reference.status_code == 200
+    assert fast.content == reference.content
+    assert fast["Content-Type"] == reference["Content-Type"]
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_non_finite_floats_are_refused_like_drf(value):
+    data = {"results": [{"id": 1, "note": None, "score": value}]}
+    with pytest.raises(ValueError, match="Out of range float values"):
+        JSONRenderer().render(data)
+    with pytest.raises(ValueError, match="Out of range float values"):
+        FastJSONRenderer().render(data)
+    assert FastJSONRenderer().render({"score": 1.5, "x": None}) == JSONRenderer().render({"score": 1.5, "x": None})
@@ -0,0 +1,78 @@
+# tests/api/test_login_profile.py
+import io
+
+import pytest
+import requests
+from django.test import Client as DjangoClient
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from rest_framework.test import APIClient
+
+from cli.utils import session as session_module
+
+TOKEN_URL = "/api/auth/jwt/create/"
+ME_URL = "/api/users/me/"
+
+
+class DjangoAdapter(BaseAdapter):
+    """Transport `requests` qui sert les appels de la CLI par le client de test Django."""
+
+    def __init__(self):
+        super().__init__()
+        self.client = DjangoClient()
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append((request.method, request.path_url))
+        headers = {
+            f"HTTP_{name.upper().replace('-', '_')}": value
+            for name, value in request.headers.items()
+            if name.lower() not in ("content-type", "content-length", "accept-encoding")
+        }
+        r = self.client.generic(request.method, request.path_url, data=request.body or b"",
+                                content_type=request.headers.get("Content-Type", ""), **headers)
+        response = requests.Response()
+        response.status_code = r.status_code
+        response._content = r.content
+        response.headers = CaseInsensitiveDict(r.headers.items())
+        response.raw = io.BytesIO()
+        response.url, response.request, response.encoding = request.url, request, "utf-8"
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.mark.django_db
+def test_cli_login_is_a_single_request(commercial_user, monkeypatch, tmp_path):
+    monkeypatch.setattr(session_module, "TOKEN_FILE", str(tmp_path / "token"))
+    monkeypatch.setattr("builtins.input", lambda prompt="": "commercial_test")
+    monkeypatch.setattr(session_module, "getpass", lambda prompt="": "Azerty123$")
+
+    session = session_module.Session()
+    adapter = DjangoAdapter()
+    session.http.mount("http://", adapter)
+
+    assert session.login_prompt() is True
+    assert adapter.sent == [("POST", TOKEN_URL)]
+    assert session.user["username"] == "commercial_test" and session.user["role"] == "COMMERCIAL"
+    assert set(session.tokens) == {"access", "refresh"}
+
+
+@pytest.mark.django_db
+def test_me_is_served_from_login_cache(commercial_user, django_assert_num_queries):
+    api = APIClient()
+    r = api.post(TOKEN_URL, {"username": "commercial_test", "password": "Azerty123$"}, format="json")
+    assert r.data["user"]["id"] == commercial_user.id and "password" not in r.data["user"]
+    api.credentials(HTTP_AUTHORIZATION=f"Bearer {r.data['access']}")
+
+    with django_assert_num_queries(0):
+        me = api.get(ME_URL)
+    assert me.status_code == 200 and me.data == r.data["user"]
+
+    # Une modification du compte invalide le profil en cache
+    admin = APIClient()
+    admin.force_authenticate(user=commercial_user.__class__.objects.create_user(
+        username="admin_g", password="Azerty123$", role="GESTION"))
+    admin.patch(f"/api/users/{commercial_user.id}/", {"email": "new@example.com"}, format="json")
+    assert api.get(ME_URL).data["email"] == "new@example.com"
@@ -0,0 +1,59 @@
+# tests/api/test_openapi_schema.py
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.test import RequestFactory
+from drf_spectacular.views import SpectacularAPIView
+from rest_framework.test import APIClient
+
+from crm.schema import clear_schema_cache, code_version
+
+SCHEMA_URL = "/api/schema/"
+JSON = "application/vnd.oai.openapi+json"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_schema_cache():
+    clear_schema_cache()
+    yield
+    clear_schema_cache()
+
+
+@pytest.mark.parametrize("accept", ["application/vnd.oai.openapi", JSON])
+def test_cached_schema_matches_spectacular_and_revalidates(db, accept):
+    reference = SpectacularAPIView.as_view()(RequestFactory().get(SCHEMA_URL, HTTP_ACCEPT=accept)).render()
+
+    api = APIClient()
+    first = api.get(SCHEMA_URL, HTTP_ACCEPT=accept)
+    assert first.status_code == 200
+    assert first.content == reference.content
+    assert first["Content-Type"] == reference["Content-Type"]
+
+    etag = first["ETag"]
+    assert api.get(SCHEMA_URL, HTTP_ACCEPT=accept)["ETag"] == etag
+    not_modified = api.get(SCHEMA_URL, HTTP_ACCEPT=accept, HTTP_IF_NONE_MATCH=f"W/{etag}")
+    assert not_modified.status_code == 304 and not_modified.content == b""
+
+
+def test_build_schema_command_output_is_served(db, tmp_path, settings):
+    call_command("build_schema", output=str(tmp_path), stdout=StringIO())
+    assert (tmp_path / "openapi.yaml").exists() and (tmp_path / "openapi.json").exists()
+
+    assert (tmp_path / "openapi.version").read_text().strip() == code_version()
+
+    settings.OPENAPI_SCHEMA_DIR = str(tmp_path)
+    (tmp_path / "openapi.json").write_bytes(b'{"openapi": "deployed"}')
+    clear_schema_cache()
+    assert APIClient().get(SCHEMA_URL, HTTP_ACCEPT=JSON).content == b'{"openapi": "deployed"}'
+
+
+def test_schema_file_from_another_build_is_not_served(db, tmp_path, settings, caplog):
+    # Fichiers d'un déploiement précédent : empreinte différente du code en cours
+    (tmp_path / "openapi.json").write_bytes(b'{"openapi": "stale"}')
+    (tmp_path / "openapi.version").write_text("ancienne-version\n")
+    settings.OPENAPI_SCHEMA_DIR = str(tmp_path)
+
+    r = APIClient().get(SCHEMA_URL, HTTP_ACCEPT=JSON)
+    assert r.status_code == 200 and b"stale" not in r.content and b'"paths"' in r.content
+    assert any(rec.name == "crm.schema" for rec in caplog.records)
@@ -0,0 +1,106 @@
+# tests/api/test_pagination.py
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from crm import pagination
+from crm.clients.models import Client
+from crm.pagination import ClientPagination
+
+
+@pytest.fixture
+def clients(db, commercial_user):
+    # Plafond abaissé pour garder le jeu de données petit
+    ClientPagination.max_page_size, previous = 30, ClientPagination.max_page_size
+    Client.objects.bulk_create([
+        Client(full_name=f"Client {i:02d}", email=f"c{i}@example.com", phone="0600000000",
+               company_name="Acme", last_contact=timezone.now().date(), sales_contact=commercial_user)
+        for i in range(45)
+    ])
+    yield
+    ClientPagination.max_page_size = previous
+
+
+@pytest.mark.django_db
+def test_page_size_defaults_param_and_cap(client_as, gestion_user, clients):
+    api = client_as(gestion_user)
+    assert len(api.get("/api/clients/").data["results"]) == ClientPagination.page_size
+    assert len(api.get("/api/clients/", {"page_size": 5}).data["results"]) == 5
+    assert len(api.get("/api/clients/", {"page_size": 1000}).data["results"]) == 30
+
+    r = api.get("/api/clients/", {"page_size": "max"})
+    assert len(r.data["results"]) == 30 and "page_size=max" in r.data["next"]
+
+    # Valeur invalide : taille par défaut de la ressource
+    assert len(api.get("/api/clients/", {"page_size": "abc"}).data["results"]) == ClientPagination.page_size
+
+
+@pytest.mark.django_db
+def test_each_resource_has_its_own_policy(client_as, gestion_user, event_assigned_to_support):
+    api = client_as(gestion_user)
+    r = api.get("/api/events/", {"page_size": "max"})
+    assert r.status_code == 200 and r.data["count"] == 1
+    assert api.get("/api/users/", {"page_size": "max"}).status_code == 200
+
+
+@pytest.mark.django_db
+def test_counts_cached_per_scope(client_as, gestion_user, commercial_user, clients, settings,
+                                 django_assert_num_queries):
+    settings.PAGINATION_COUNT_CACHE_TTL = 5
+    cache.clear()
+    gestion, commercial = client_as(gestion_user), client_as(commercial_user)
+    assert gestion.get("/api/clients/").data["count"] == 45
+    with django_assert_num_queries(1):  # page seule, total en cache
+        assert gestion.get("/api/clients/", {"page": 2}).data["count"] == 45
+
+    # Périmètres distincts selon le rôle : totaux distincts
+    assert gestion.get("/api/users/").data["count"] == 2
+    assert commercial.get("/api/users/").data["count"] == 1
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_large_scope_uses_planner_estimate(client_as, gestion_user, clients, monkeypatch):
+    monkeypatch.setattr(pagination, "_planner_estimate", lambda queryset: 2_000_000)
+    r = client_as(gestion_user).get("/api/clients/")
+    assert r.data["count"] == 2_000_000 and r.data["count_estimated"] is True
+
+    monkeypatch.setattr(pagination, "_planner_estimate", lambda queryset: 45)
+    r = client_as(gestion_user).get("/api/clients/")
+    assert r.data["count"] == 45 and "count_estimated" not in r.data
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("estimate", [5, 2_000_000])
+def test_estimate_does_not_drive_paging(client_as, gestion_user, clients, monkeypatch, settings, estimate):
+    # Estimation trop basse ou trop haute : pages et liens suivent les lignes réelles
+    settings.PAGINATION_ESTIMATE_THRESHOLD = 1
+    monkeypatch.setattr(pagination, "_planner_estimate", lambda queryset: estimate)
+    api = client_as(gestion_user)
+    with CaptureQueriesContext(connection) as ctx:
+        r = api.get("/api/clients/", {"page_size": 20, "page": 2})
+    assert r.data["count"] == estimate and r.data["count_estimated"] is True
+    assert "LIMIT 21" in ctx.captured_queries[-1]["sql"]
+    assert "page=3" in r.data["next"] and r.data["previous"]
+
+    last = api.get("/api/clients/", {"page_size": 20, "page": 3})
+    assert len(last.data["results"]) == 5 and last.data["next"] is None
+    assert api.get("/api/clients/", {"page_size": 20, "page": 4}).status_code == 404
+
+
+@pytest.mark.django_db
+def test_count_free_mode_reads_one_extra_row(client_as, gestion_user, clients):
+    api = client_as(gestion_user)
+    with CaptureQueriesContext(connection) as ctx:
+        r = api.get("/api/clients/", {"count": "false", "page_size": 20})
+    assert "count" not in r.data and len(r.data["results"]) == 20
+    assert not any("COUNT(" in q["sql"] for q in ctx.captured_queries)
+    assert "LIMIT 21" in ctx.captured_queries[-1]["sql"]
+    assert "page=2" in r.data["next"] and r.data["previous"] is None
+
+    last = api.get("/api/clients/", {"count": "false", "page_size": 20, "page": 3})
+    assert len(last.data["results"]) == 5 and last.data["next"] is None
+    assert "page=2" in last.data["previous"]
+    assert api.get("/api/clients/", {"count": "false", "page": 9}).status_code == 404
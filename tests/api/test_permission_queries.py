@@ -0,0 +1,88 @@
+# tests/api/test_permission_queries.py
+"""Les contrôles d'accès ne doivent émettre aucune requête SQL (liste et détail)."""
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from crm.clients.models import Client
+from crm.clients.permissions import ClientPermission
+from crm.clients.views import ClientViewSet
+from crm.contracts.models import Contract
+from crm.contracts.permissions import ContractPermission
+from crm.contracts.views import ContractViewSet
+from crm.events.models import Event
+from crm.events.permissions import EventPermission
+from crm.events.views import EventViewSet
+
+RESOURCES = [
+    ("/api/clients/", ClientViewSet, ClientPermission),
+    ("/api/contracts/", ContractViewSet, ContractPermission),
+    ("/api/events/", EventViewSet, EventPermission),
+]
+
+
+def _loaded_object(viewset, user, pk):
+    """Charge l'objet comme le ferait `get_object()` (queryset de la vue)."""
+    request = APIRequestFactory().get("/")
+    request.user = user
+    view = viewset(request=request, action="retrieve", format_kwarg=None)
+    return view.get_queryset().get(pk=pk)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url, viewset, permission_class", RESOURCES)
+@pytest.mark.parametrize("role", ["commercial_user", "support_user", "gestion_user"])
+def test_permission_checks_issue_no_query(request, role, url, viewset, permission_class,
+                                          event_assigned_to_support, django_assert_num_queries):
+    user = request.getfixturevalue(role)
+    event = event_assigned_to_support
+    pk = {ClientViewSet: event.client_id, ContractViewSet: event.contract_id, EventViewSet: event.id}[viewset]
+    obj = _loaded_object(viewset, user, pk)
+
+    permission = permission_class()
+    for method in ("get", "patch", "delete"):
+        drf_request = Request(getattr(APIRequestFactory(), method)(url))
+        drf_request.user = user
+        with django_assert_num_queries(0):
+            if permission.has_permission(drf_request, None):
+                permission.has_object_permission(drf_request, None, obj)
+
+
+def _count(api, url):
+    with CaptureQueriesContext(connection) as ctx:
+        response = api.get(url)
+    assert response.status_code == 200
+    return len(ctx.captured_queries)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", ["/api/clients/", "/api/contracts/", "/api/events/"])
+def test_list_and_detail_query_counts(url, client_as, gestion_user, commercial_user, support_user, signed_contract,
+                                      event_assigned_to_support):
+    api = client_as(gestion_user)
+    few = _count(api, url)
+    listed = len(api.get(url).data["results"])
+    now = timezone.now()
+    # Nouvelles lignes dans chacune des trois listes (clients, contrats, événements)
+    for n in range(5):
+        client = Client.objects.create(full_name=f"Client {n}", email=f"client.{n}@example.com", phone="0600000000",
+                                       company_name=f"Société {n}", last_contact=now.date(),
+                                       sales_contact=commercial_user)
+        contract = Contract.objects.create(client=client, sales_contact=commercial_user,
+                                           total_amount=100, amount_due=0, is_signed=True)
+        Event.objects.create(contract=contract, client=client, support_contact=support_user,
+                             event_name=f"Événement {n}", event_start=now + timedelta(days=n + 3),
+                             event_end=now + timedelta(days=n + 4), location="Lyon", attendees=10)
+    assert len(api.get(url).data["results"]) == listed + 5
+    # Nombre de requêtes indépendant du nombre de lignes (pas de N+1)
+    assert _count(api, url) == few
+
+    pk = {"/api/clients/": signed_contract.client_id, "/api/contracts/": signed_contract.id,
+          "/api/events/": event_assigned_to_support.id}[url]
+    # Détail : une seule requête (objet + relations jointes), contrôle d'accès compris
+    assert _count(client_as(commercial_user), f"{url}{pk}/") == 1
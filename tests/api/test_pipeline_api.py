@@ -0,0 +1,91 @@
+# tests/api/test_pipeline_api.py
+import pytest
+from decimal import Decimal
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+from crm.clients.models import Client
+from crm.contracts.models import Contract
+from crm.pipeline.models import PipelineSummary
+
+PIPELINE_URL = "/api/pipeline/"
+
+
+def _summary(user):
+    return PipelineSummary.objects.get(sales_contact=user)
+
+
+@pytest.mark.django_db
+def test_summary_maintained_incrementally(commercial_user, commercial_user_2, client_of_commercial,
+                                          signed_contract, unsigned_contract):
+    """Créations, mises à jour et réassignations ajustent les compteurs sans recalcul complet."""
+    s = _summary(commercial_user)
+    assert (s.clients_count, s.contracts_count, s.unsigned_contracts_count) == (1, 2, 1)
+    assert s.amount_due_total == Decimal("1500")
+
+    # Signature + paiement partiel
+    unsigned_contract.is_signed = True
+    unsigned_contract.amount_due = 200
+    unsigned_contract.save()
+    s = _summary(commercial_user)
+    assert s.unsigned_contracts_count == 0
+    assert s.amount_due_total == Decimal("700")
+
+    # Réassignation du contrat vers un autre commercial
+    contract = Contract.objects.get(pk=signed_contract.pk)
+    contract.sales_contact = commercial_user_2
+    contract.save()
+    assert _summary(commercial_user).contracts_count == 1
+    assert _summary(commercial_user_2).amount_due_total == Decimal("500")
+
+    # Suppression du client → contrats supprimés en cascade
+    Client.objects.get(pk=client_of_commercial.pk).delete()
+    s = _summary(commercial_user)
+    assert (s.clients_count, s.contracts_count, s.amount_due_total) == (0, 0, Decimal("0"))
+
+
+@pytest.mark.django_db
+def test_deferred_fields_update_previous_owner(commercial_user, commercial_user_2, client_of_commercial,
+                                               signed_contract):
+    """Instance chargée avec `only()` : l'ancien commercial perd aussi ce qui est réaffecté."""
+    client = Client.objects.only("pk").get(pk=client_of_commercial.pk)
+    client.sales_contact_id = commercial_user_2.pk
+    client.save()
+    assert (_summary(commercial_user).clients_count, _summary(commercial_user_2).clients_count) == (0, 1)
+
+    contract = Contract.objects.only("pk").get(pk=signed_contract.pk)
+    contract.sales_contact_id = commercial_user_2.pk
+    contract.save()
+    assert _summary(commercial_user).contracts_count == 0
+    assert _summary(commercial_user_2).amount_due_total == Decimal("500")
+
+
+@pytest.mark.django_db
+def test_rebuild_command_repairs_drift(commercial_user, signed_contract):
+    """Les mises à jour en masse contournent les signaux : la commande de rebuild répare."""
+    Contract.objects.filter(pk=signed_contract.pk).update(amount_due=0)
+    assert _summary(commercial_user).amount_due_total == Decimal("500")
+
+    call_command("rebuild_pipeline")
+    assert _summary(commercial_user).amount_due_total == Decimal("0")
+
+
+@pytest.mark.django_db
+def test_pipeline_endpoint_scoped_by_role(commercial_user, support_user, gestion_user,
+                                          event_assigned_to_support, client_of_commercial_2):
+    api = APIClient()
+    api.force_authenticate(user=commercial_user)
+    r = api.get(f"{PIPELINE_URL}me/")
+    assert r.status_code == 200
+    assert r.data["clients_count"] == 1
+    assert r.data["unsigned_contracts_count"] == 0
+    assert [e["id"] for e in r.data["upcoming_events"]] == [event_assigned_to_support.id]
+
+    # COMMERCIAL ne voit que sa propre ligne ; GESTION voit tout
+    items = api.get(PIPELINE_URL).data.get("results")
+    assert [row["sales_contact"] for row in items] == [commercial_user.id]
+    api.force_authenticate(user=gestion_user)
+    assert api.get(PIPELINE_URL).data["count"] == 2
+
+    api.force_authenticate(user=support_user)
+    assert api.get(f"{PIPELINE_URL}me/").status_code == 403
@@ -0,0 +1,89 @@
+# tests/api/test_reassignment.py
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+
+from crm.clients.models import Client
+from crm.contracts.models import Contract
+from crm.events.models import Event
+from crm.pipeline.models import PipelineSummary
+
+
+def _url(user):
+    return f"/api/users/{user.pk}/reassign/"
+
+
+@pytest.mark.django_db
+def test_commercial_portfolio_moves_in_one_update_per_table(client_as, gestion_user, commercial_user,
+                                                            commercial_user_2, client_of_commercial,
+                                                            signed_contract, unsigned_contract,
+                                                            django_assert_max_num_queries):
+    api = client_as(gestion_user)
+    payload = {"to": commercial_user_2.pk}
+
+    r = api.post(_url(commercial_user), payload | {"dry_run": True}, format="json")
+    assert r.status_code == 200
+    assert (r.data["clients"], r.data["contracts"], r.data["dry_run"]) == (1, 2, True)
+    assert Client.objects.get(pk=client_of_commercial.pk).sales_contact_id == commercial_user.pk
+
+    # Nombre de requêtes indépendant du volume : une UPDATE par table + recalcul des deux pipelines
+    with django_assert_max_num_queries(20):
+        r = api.post(_url(commercial_user), payload, format="json")
+    assert (r.data["clients"], r.data["contracts"], "events" in r.data) == (1, 2, False)
+    assert not Contract.objects.filter(sales_contact=commercial_user).exists()
+
+    # Compteurs du pipeline recalculés (update() n'émet pas de signaux)
+    moved = PipelineSummary.objects.get(sales_contact=commercial_user_2)
+    assert (moved.clients_count, moved.contracts_count, moved.amount_due_total) == (1, 2, Decimal("1500"))
+    assert PipelineSummary.objects.get(sales_contact=commercial_user).contracts_count == 0
+
+
+@pytest.mark.django_db
+def test_subset_and_role_checks(client_as, gestion_user, commercial_user, commercial_user_2, support_user,
+                                client_of_commercial, other_client, event_assigned_to_support, user_factory):
+    api = client_as(gestion_user)
+    other_client.sales_contact = commercial_user
+    other_client.save()
+
+    r = api.post(_url(commercial_user), {"to": commercial_user_2.pk, "resources": ["clients"],
+                                         "client_ids": [other_client.pk]}, format="json")
+    assert r.data["clients"] == 1
+    assert Client.objects.get(pk=client_of_commercial.pk).sales_contact_id == commercial_user.pk
+
+    # Événements : uniquement vers un SUPPORT
+    r = api.post(_url(support_user), {"to": commercial_user_2.pk, "resources": ["events"]}, format="json")
+    assert r.status_code == 400 and "resources" in r.data
+    support_2 = user_factory("support_2", role="SUPPORT")
+    r = api.post(_url(support_user), {"to": support_2.pk}, format="json")
+    assert r.data["events"] == 1
+    assert Event.objects.get(pk=event_assigned_to_support.pk).support_contact_id == support_2.pk
+
+    assert api.post(_url(support_2), {"to": support_2.pk}, format="json").status_code == 400
+    assert client_as(commercial_user).post(_url(commercial_user), {"to": commercial_user_2.pk},
+                                           format="json").status_code == 403
+
+
+@pytest.mark.django_db
+def test_events_overlapping_the_target_schedule_are_refused(client_as, gestion_user, support_user,
+                                                           event_assigned_to_support,
+                                                           signed_contract_commercial_2, user_factory):
+    api = client_as(gestion_user)
+    support_2 = user_factory("support_2", role="SUPPORT")
+    busy = Event.objects.create(
+        contract=signed_contract_commercial_2, client=signed_contract_commercial_2.client,
+        support_contact=support_2, event_name="Atelier", location="Lyon", attendees=10,
+        event_start=event_assigned_to_support.event_start + timedelta(hours=2),
+        event_end=event_assigned_to_support.event_end + timedelta(hours=2),
+    )
+    expected = [{"event": event_assigned_to_support.pk, "conflicts_with": busy.pk}]
+
+    r = api.post(_url(support_user), {"to": support_2.pk, "dry_run": True}, format="json")
+    assert (r.data["events"], r.data["conflicts"]) == (1, expected)
+
+    r = api.post(_url(support_user), {"to": support_2.pk}, format="json")
+    assert r.status_code == 400 and f"#{busy.pk}" in r.data["events"][0]
+    assert Event.objects.get(pk=event_assigned_to_support.pk).support_contact_id == support_user.pk
+
+    r = api.post(_url(support_user), {"to": support_2.pk, "allow_conflicts": True}, format="json")
+    assert (r.status_code, r.data["events"], r.data["conflicts"]) == (200, 1, expected)
@@ -0,0 +1,49 @@
+# tests/api/test_sparse_fieldsets.py
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def _get(api, url, params=None):
+    with CaptureQueriesContext(connection) as ctx:
+        response = api.get(url, params or {})
+    return response, [q["sql"] for q in ctx.captured_queries]
+
+
+@pytest.mark.django_db
+def test_fields_prunes_columns_and_joins(client_as, gestion_user, client_of_commercial):
+    r, queries = _get(client_as(gestion_user), "/api/clients/", {"fields": "id,full_name"})
+    assert r.status_code == 200
+    assert list(r.data["results"][0]) == ["id", "full_name"]
+    select = queries[-1]
+    assert '"email"' not in select and "JOIN" not in select
+
+    r, queries = _get(client_as(gestion_user), "/api/clients/", {"omit": "email,phone"})
+    assert "email" not in r.data["results"][0] and "sales_contact_username" in r.data["results"][0]
+    assert '"users_user"."username"' in queries[-1] and '"users_user"."password"' not in queries[-1]
+
+
+@pytest.mark.django_db
+def test_compact_mode_for_cli_tables(client_as, gestion_user, event_assigned_to_support):
+    r, queries = _get(client_as(gestion_user), "/api/events/", {"compact": "true"})
+    row = r.data["results"][0]
+    assert "notes" not in row and "created_at" not in row and "contract_id" not in row
+    assert row["client_full_name"] == event_assigned_to_support.client.full_name
+    assert '"notes"' not in queries[-1] and '"contracts_contract"' not in queries[-1]
+
+
+@pytest.mark.django_db
+def test_sparse_detail_keeps_permission_columns(client_as, commercial_user, signed_contract,
+                                                signed_contract_commercial_2):
+    api = client_as(commercial_user)
+    r, queries = _get(api, f"/api/contracts/{signed_contract.id}/", {"fields": "id,amount_due"})
+    assert r.status_code == 200 and set(r.data) == {"id", "amount_due"}
+    assert len(queries) == 1
+    assert api.get(f"/api/contracts/{signed_contract_commercial_2.id}/", {"fields": "id"}).status_code == 404
+
+
+@pytest.mark.django_db
+def test_unknown_field_is_rejected(client_as, gestion_user):
+    r = client_as(gestion_user).get("/api/contracts/", {"fields": "id,secret"})
+    assert r.status_code == 400
+    assert "secret" in r.data["fields"][0]
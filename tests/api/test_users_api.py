@@ -1,7 +1,15 @@
 # tests/test_users_api.py
+import io
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password
+from django.core.management import CommandError, call_command
 from rest_framework.test import APIClient
 
+from crm.users import services
+
 USERS_URL = "/api/users/"
 
 @pytest.mark.django_db
@@ -38,4 +46,71 @@ def test_user_can_retrieve_self(commercial_user):
     r = api.get(USERS_URL)
     assert r.status_code == 200
     items = r.data.get("results", r.data)
-    assert any(it["username"] == commercial_user.username for it in items)
\ No newline at end of file
+    assert any(it["username"] == commercial_user.username for it in items)
+
+
+class _StubProcessPool(ThreadPoolExecutor):
+    """Pool de processus simulé par des threads : aucun processus démarré pendant les tests."""
+    created = []
+
+    def __init__(self, max_workers=None, initializer=None):
+        super().__init__(max_workers=max_workers)
+        _StubProcessPool.created.append(max_workers)
+
+
+@pytest.fixture
+def process_pool(monkeypatch):
+    _StubProcessPool.created = []
+    monkeypatch.setattr(services, "ProcessPoolExecutor", _StubProcessPool)
+    return _StubProcessPool
+
+
+@pytest.mark.django_db
+def test_gestion_bulk_provisions_users(gestion_user, process_pool):
+    """Création d'un lot par l'API : mots de passe hachés sans pool de processus."""
+    api = APIClient()
+    api.force_authenticate(user=gestion_user)
+    rows = [{"username": f"staff_{i}", "email": f"s{i}@ex.com", "role": "SUPPORT", "password": "Passw0rd!"}
+            for i in range(services.POOL_THRESHOLD)]
+    r = api.post(f"{USERS_URL}bulk/", rows, format="json")
+    assert r.status_code == 201
+    assert [u["username"] for u in r.data] == [row["username"] for row in rows]
+    assert get_user_model().objects.get(username="staff_1").check_password("Passw0rd!")
+    assert process_pool.created == []
+
+
+@pytest.mark.django_db
+def test_bulk_rejects_invalid_batch_and_non_gestion(gestion_user, commercial_user):
+    """Lot invalide (doublon) : rien n'est créé ; non-GESTION refusé."""
+    api = APIClient()
+    api.force_authenticate(user=gestion_user)
+    rows = [{"username": "dup", "email": f"s{i}@ex.com", "role": "SUPPORT", "password": "Passw0rd!"}
+            for i in range(2)]
+    r = api.post(f"{USERS_URL}bulk/", rows, format="json")
+    assert r.status_code == 400
+    assert not get_user_model().objects.filter(username="dup").exists()
+    api.force_authenticate(user=commercial_user)
+    assert api.post(f"{USERS_URL}bulk/", rows[:1], format="json").status_code == 403
+
+
+def test_hash_passwords_uses_threads_unless_processes_requested(process_pool):
+    hashes = services.hash_passwords([f"pw{i}" for i in range(8)], workers=2)
+    assert check_password("pw7", hashes[7]) and process_pool.created == []
+
+    hashes = services.hash_passwords([f"pw{i}" for i in range(8)], workers=2, processes=True)
+    assert check_password("pw7", hashes[7]) and process_pool.created == [2]
+
+
+@pytest.mark.django_db
+def test_provision_users_command_uses_process_pool(tmp_path, process_pool):
+    path = tmp_path / "comptes.csv"
+    path.write_text("username,email,role,password\n"
+                    + "".join(f"pool_{i},p{i}@ex.com,SUPPORT,Passw0rd{i}\n" for i in range(8)), encoding="utf-8")
+    out = io.StringIO()
+    call_command("provision_users", str(path), "--workers", "2", stdout=out)
+    assert "8 utilisateur(s)" in out.getvalue() and process_pool.created == [2]
+    assert get_user_model().objects.get(username="pool_7").check_password("Passw0rd7")
+
+    path.write_text("username,email,role,password\nbad,,SUPPORT,court\n", encoding="utf-8")
+    with pytest.raises(CommandError, match="ligne 2"):
+        call_command("provision_users", str(path))
@@ -0,0 +1,45 @@
+# tests/api/test_warmup.py
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from crm import compiled, warmup
+from crm.clients.serializers import ClientSerializer
+from crm.warmup import warm_up
+
+
+@pytest.mark.django_db
+def test_warm_up_runs_every_step_and_builds_list_plans(caplog, monkeypatch):
+    monkeypatch.setattr(compiled, "_plans", {})
+    closed = []
+    monkeypatch.setattr(warmup.connections, "close_all", lambda: closed.append(True))
+    timings = warm_up(schema=False)
+
+    assert list(timings) == ["routes", "viewsets", "jwt", "i18n / rendu", "base"]
+    assert not [r for r in caplog.records if r.name == "crm.warmup"]
+    assert any(serializer_type is ClientSerializer for serializer_type, _ in compiled._plans)
+    # Connexion ouverte par l'étape base conservée pour la première requête
+    assert closed == []
+
+
+@pytest.mark.django_db
+def test_warm_up_without_database_closes_connections(monkeypatch, django_assert_num_queries):
+    closed = []
+    monkeypatch.setattr(warmup.connections, "close_all", lambda: closed.append(True))
+    with django_assert_num_queries(0):
+        timings = warm_up(schema=False, database=False)
+    assert "base" not in timings
+    # Aucune connexion laissée ouverte avant le fork (gunicorn --preload)
+    assert closed == [True]
+
+    # Ouverture reportée dans chaque worker
+    with django_assert_num_queries(1):
+        warmup.post_fork(server=None, worker=None)
+
+
+@pytest.mark.django_db
+def test_warmup_command_reports_steps():
+    out = StringIO()
+    call_command("warmup", stdout=out)
+    assert "routes" in out.getvalue() and "✅" in out.getvalue()
@@ -16,12 +16,14 @@ from datetime import timedelta
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.utils import timezone
 from rest_framework.test import APIClient
 
 from crm.clients.models import Client
 from crm.contracts.models import Contract
 from crm.events.models import Event
+from crm.users.throttling import reset_login_throttles
 
 User = get_user_model()
 
@@ -30,6 +32,18 @@ User = get_user_model()
 #   UTILITAIRES / API CLIENTS
 # ==========================
 
+@pytest.fixture(autouse=True)
+def _reset_login_throttles():
+    """Les seaux de connexion sont propres au processus : repartir de zéro à chaque test."""
+    reset_login_throttles()
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    """Cache local (profils, révocations…) : les identifiants sont réutilisés d'un test à l'autre."""
+    cache.clear()
+
+
 @pytest.fixture
 def api_client() -> APIClient:
     """Client DRF non authentifié."""
@@ -0,0 +1,48 @@
+# tests/model/test_datagen.py
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from crm.clients.models import Client
+from crm.contracts.models import Contract
+from crm.datagen import GeneratorConfig, generate
+from crm.events.models import Event
+from crm.pipeline.models import PipelineSummary
+
+User = get_user_model()
+
+
+def _snapshot():
+    return (
+        list(Client.objects.order_by("email").values_list("email", "phone", "company_name", "last_contact")),
+        list(Contract.objects.order_by("client__email", "total_amount").values_list("total_amount", "is_signed")),
+        list(Event.objects.order_by("event_name").values_list("event_name", "event_start", "attendees")),
+    )
+
+
+@pytest.mark.django_db
+def test_generator_is_deterministic_and_batched(django_assert_max_num_queries):
+    config = GeneratorConfig(seed=7, clients=40, batch_size=15, today=timezone.now())
+    with django_assert_max_num_queries(40):
+        report = generate(config)
+
+    assert report.clients == Client.objects.count() == 40
+    assert report.contracts == Contract.objects.count()
+    assert report.events == Event.objects.count()
+    assert not Event.objects.filter(contract__is_signed=False).exists()
+    assert User.objects.filter(role="COMMERCIAL").count() == 3
+    # bulk_create contourne les signaux : le pipeline est recalculé en fin de génération
+    assert sum(PipelineSummary.objects.values_list("clients_count", flat=True)) == 40
+
+    first = _snapshot()
+    Client.objects.all().delete()
+    User.objects.all().delete()
+    generate(config)
+    assert _snapshot() == first
+
+
+@pytest.mark.django_db
+def test_generator_refuses_non_empty_base():
+    generate(GeneratorConfig(clients=1))
+    with pytest.raises(ValueError):
+        generate(GeneratorConfig(clients=1))